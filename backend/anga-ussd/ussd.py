@@ -1,14 +1,34 @@
 from flask import Flask, request, Response
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait
+import os
+import time
 import requests
+from requests.adapters import HTTPAdapter
 
 app = Flask(__name__)
 
 # Supported locations
 ALLOWED_LOCATIONS = ["machakos", "vhembe"]
 FASTAPI_PREDICT_URL = "http://localhost:8000/predict/"
+FASTAPI_PREDICT_RANGE_URL = "http://localhost:8000/predict/range"
 FASTAPI_LIVE_URL = "http://localhost:8000/live_weather/"
 
+# Aggregators drop the session after a few seconds, so every menu response
+# must be built within this budget (seconds)
+USSD_RESPONSE_BUDGET = float(os.getenv("USSD_RESPONSE_BUDGET", "4"))
+# Share of the budget given to the bulk range request before falling back
+# to parallel per-day requests
+BULK_BUDGET_SHARE = 0.6
+# Shortest timeout worth giving a request (seconds); requests rejects 0
+MIN_REQUEST_TIMEOUT = 0.1
+
+# Pooled keep-alive connections to the API, shared by all sessions
+http = requests.Session()
+http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+executor = ThreadPoolExecutor(max_workers=16)
+
 @app.route("/ussd", methods=["POST"])
 def ussd_callback():
     session_id = request.form.get("sessionId")
@@ -102,34 +122,88 @@ def is_valid_date(date_str):
     except ValueError:
         return False
 
-def generate_forecast_response(location, start, end):
-    try:
-        forecast_result = []
-        current = start
-
-        while current <= end:
-            res = requests.post(FASTAPI_PREDICT_URL, json={
-                "date": current.strftime("%Y-%m-%d"),
-                "location": location
-            })
-            if res.status_code == 200:
-                data = res.json()
-                forecast_result.append(
-                    f"{current.strftime('%d/%m')}: {data['temperature_prediction']}°C, {data['rain_prediction']}mm")
-            else:
-                forecast_result.append(f"{current.strftime('%d/%m')}: No data")
-            current += timedelta(days=1)
+def remaining(deadline):
+    return max(deadline - time.monotonic(), 0.0)
+
+def request_timeout(seconds):
+    """A usable requests timeout for what is left of the budget"""
+    return max(seconds, MIN_REQUEST_TIMEOUT)
+
+def format_day(day, data):
+    return f"{day.strftime('%d/%m')}: {data['temperature_prediction']}°C, {data['rain_prediction']}mm"
+
+def fetch_range(location, start, end, timeout):
+    """Fetch the whole range in one request. Returns {date: line}."""
+    res = http.post(FASTAPI_PREDICT_RANGE_URL, json={
+        "start_date": start.strftime("%Y-%m-%d"),
+        "end_date": end.strftime("%Y-%m-%d"),
+        "locations": [location]
+    }, timeout=timeout)
+    res.raise_for_status()
+    results = {}
+    for item in res.json()["locations"][0]["forecasts"]:
+        day = datetime.strptime(item["date"], "%Y-%m-%d")
+        results[day.date()] = format_day(day, item)
+    return results
+
+def fetch_day(location, day, deadline):
+    # Queued behind other sessions' requests, the budget may be spent by now
+    if remaining(deadline) < MIN_REQUEST_TIMEOUT:
+        raise TimeoutError("response budget spent before the request started")
+    res = http.post(FASTAPI_PREDICT_URL, json={
+        "date": day.strftime("%Y-%m-%d"),
+        "location": location
+    }, timeout=request_timeout(remaining(deadline)))
+    if res.status_code == 200:
+        return format_day(day, res.json())
+    return f"{day.strftime('%d/%m')}: No data"
+
+def fetch_days_parallel(location, days, deadline):
+    """Fetch days concurrently, keeping whatever finished before the deadline."""
+    futures = {}
+    for day in days:
+        if remaining(deadline) < MIN_REQUEST_TIMEOUT:
+            break
+        futures[executor.submit(fetch_day, location, day, deadline)] = day
+    done, not_done = wait(futures, timeout=remaining(deadline))
+    for future in not_done:
+        future.cancel()
+
+    results = {}
+    for future in done:
+        day = futures[future]
+        try:
+            results[day.date()] = future.result()
+        except Exception as e:
+            print(f"⚠️ Error fetching {day.date()}:", e)
+    return results
 
-        result = f"END ✅ Forecast for {location.title()}:\n" + "\n".join(forecast_result)
-        return Response(result, mimetype="text/plain")
+def generate_forecast_response(location, start, end):
+    deadline = time.monotonic() + USSD_RESPONSE_BUDGET
+    days = []
+    current = start
+    while current <= end:
+        days.append(current)
+        current += timedelta(days=1)
 
+    try:
+        results = fetch_range(location, start, end, timeout=request_timeout(remaining(deadline) * BULK_BUDGET_SHARE))
     except Exception as e:
-        print("⚠️ Error fetching forecast:", e)
+        print("⚠️ Bulk forecast failed, falling back to per-day requests:", e)
+        results = fetch_days_parallel(location, days, deadline)
+
+    if not results:
         return Response("END ⚠️ Error retrieving data. Try again.", mimetype="text/plain")
 
+    forecast_result = [results.get(day.date(), f"{day.strftime('%d/%m')}: ...") for day in days]
+    result = f"END ✅ Forecast for {location.title()}:\n" + "\n".join(forecast_result)
+    if len(results) < len(days):
+        result += "\n⏳ Partial forecast, dial again for the rest."
+    return Response(result, mimetype="text/plain")
+
 def get_live_forecast(location):
     try:
-        res = requests.get(f"{FASTAPI_LIVE_URL}?location={location}")
+        res = http.get(FASTAPI_LIVE_URL, params={"location": location}, timeout=USSD_RESPONSE_BUDGET)
         if res.status_code == 200:
             data = res.json()
             return Response(
@@ -0,0 +1,489 @@
+"""
+🤖 Assistant Engine
+Async client for the Groq chat completions API with a shared keep-alive
+connection pool, its own bounded concurrency, per-request timeouts and a
+bounded wait queue, so a burst of assistant questions cannot starve the
+rest of the API. Answers can also be streamed token by token.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+from assistant_core import DEFAULT_MODEL, GROQ_API_KEY, _get_fallback_response, knowledge_base, system_prompts
+from knowledge_base import DEFAULT_REGION, KNOWLEDGE_BASE_DIRECT_SCORE
+
+if TYPE_CHECKING:
+    from response_cache import ResponseCache
+    from weather_context import WeatherContextBuilder
+
+logger = logging.getLogger(__name__)
+
+# Use cases whose prompts get the location's weather context
+WEATHER_USE_CASES = {"Weather-Based Farming", "Emergency Weather Response"}
+
+GROQ_BASE_URL = os.getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1")
+DEMO_API_KEY = "gsk_demo_key_for_testing_only"
+
+# Completions running at once, questions allowed to wait for a slot, and timeouts (seconds)
+ASSISTANT_MAX_CONCURRENCY = int(os.getenv("ASSISTANT_MAX_CONCURRENCY", "8"))
+ASSISTANT_MAX_QUEUE = int(os.getenv("ASSISTANT_MAX_QUEUE", "32"))
+ASSISTANT_QUEUE_TIMEOUT = float(os.getenv("ASSISTANT_QUEUE_TIMEOUT", "10"))
+ASSISTANT_TIMEOUT_SECONDS = float(os.getenv("ASSISTANT_TIMEOUT_SECONDS", "30"))
+
+MAX_TOKENS = 1000
+TEMPERATURE = 0.7
+
+# Streamed text is held back by this many characters so a "gsk_" split
+# across two chunks is still caught before it is sent
+LEAK_MARKER = "gsk_"
+LEAK_HOLDBACK = len(LEAK_MARKER) - 1
+
+# Recent streams kept for the latency percentiles
+LATENCY_WINDOW = 500
+
+
+def _percentile(values: Deque[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+
+class AssistantBusyError(Exception):
+    """Raised when the wait queue is full; retry_after is a hint in seconds"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"AI Assistant is busy, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class _Slot:
+    """A completion slot handed from stream() to the event generator, released at most once"""
+
+    def __init__(self, semaphore: Optional[asyncio.Semaphore] = None):
+        self._semaphore = semaphore
+
+    def release(self):
+        semaphore, self._semaphore = self._semaphore, None
+        if semaphore is not None:
+            semaphore.release()
+
+
+class AssistantStream:
+    """
+    Events returned by AssistantEngine.stream(). The completion slot is given
+    back when the events end or on aclose(), whichever comes first; callers
+    must aclose() a stream they may not iterate to the end (a generator that
+    never started does not run its finally).
+    """
+
+    def __init__(self, events: AsyncGenerator[Dict[str, Any], None], slot: Optional[_Slot] = None):
+        self._events = events
+        self._slot = slot or _Slot()
+
+    def __aiter__(self) -> "AssistantStream":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self._events.__anext__()
+
+    async def aclose(self):
+        try:
+            await self._events.aclose()
+        finally:
+            self._slot.release()
+
+
+class AssistantEngine:
+    """Async assistant shared by every request in the process"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = GROQ_API_KEY,
+        base_url: str = GROQ_BASE_URL,
+        model: str = DEFAULT_MODEL,
+        max_concurrency: int = ASSISTANT_MAX_CONCURRENCY,
+        max_queue: int = ASSISTANT_MAX_QUEUE,
+        queue_timeout: float = ASSISTANT_QUEUE_TIMEOUT,
+        timeout: float = ASSISTANT_TIMEOUT_SECONDS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional["ResponseCache"] = None,
+        weather_context: Optional["WeatherContextBuilder"] = None,
+        local_answer_score: float = KNOWLEDGE_BASE_DIRECT_SCORE,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.timeout = timeout
+        self._transport = transport
+        self.cache = cache
+        self.weather_context = weather_context
+        self.local_answer_score = local_answer_score
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.active = 0
+        self.waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+        # Moving average of completion latency, used for Retry-After hints
+        self.avg_latency = 2.0
+        self.streams = 0
+        self.local_answers = 0
+        self.leaks_blocked = 0
+        self.ttft: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.stream_latency: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key) and self.api_key != DEMO_API_KEY
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Created lazily so the pool and semaphore bind to the running loop
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                transport=self._transport,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def close(self):
+        """Close the pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._semaphore = None
+
+    def retry_after(self) -> int:
+        """Seconds until the queue ahead of a new question has likely drained"""
+        return max(1, math.ceil(self.avg_latency * (self.waiting + 1) / self.max_concurrency))
+
+    async def _system_prompt(self, use_case: str, location: Optional[str]) -> Tuple[str, str]:
+        """
+        System prompt for a question, with the location's weather context for
+        the weather use cases.
+
+        Returns:
+            Tuple[str, str]: (cache namespace, system prompt); grounded prompts
+            are cached per location
+        """
+        system_prompt = system_prompts.get(use_case, system_prompts["Smart Farming Advice"])
+        if self.weather_context is None or use_case not in WEATHER_USE_CASES:
+            return use_case, system_prompt
+        location = (location or DEFAULT_REGION).lower()
+        try:
+            context = await self.weather_context.get(location)
+        except Exception as e:
+            logger.warning(f"⚠️ Weather context failed for {location}: {e}")
+            context = None
+        if context is None:
+            return use_case, system_prompt
+        return f"{use_case}@{location}", f"{system_prompt}\n\n{context}"
+
+    def _messages(self, prompt: str, system_prompt: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt},
+        ]
+
+    def _cached(self, prompt: str, use_case: str, namespace: str, system_prompt: str, location: Optional[str]) -> Optional[str]:
+        """Answer from the response cache or, for common questions, the knowledge base"""
+        if self.cache is not None:
+            cached = self.cache.get(prompt, namespace, system_prompt)
+            if cached is not None:
+                return cached
+        if namespace != use_case:
+            # A grounded weather prompt carries live data a canned answer would ignore
+            return None
+        local = knowledge_base.best(prompt, use_case, location, min_score=self.local_answer_score)
+        if local is not None:
+            self.local_answers += 1
+            return local.answer
+        return None
+
+    def _remember(self, prompt: str, namespace: str, system_prompt: str, answer: str):
+        if self.cache is not None:
+            self.cache.set(prompt, namespace, system_prompt, answer)
+
+    async def _acquire(self):
+        """Wait for a completion slot, or raise AssistantBusyError"""
+        self._get_client()
+        assert self._semaphore is not None
+        if self.active + self.waiting >= self.max_concurrency + self.max_queue:
+            self.rejected += 1
+            raise AssistantBusyError(self.retry_after())
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise AssistantBusyError(self.retry_after())
+        finally:
+            self.waiting -= 1
+
+    async def list_models(self) -> int:
+        """
+        Cheap connectivity check: list the available models.
+
+        Does not use a completion slot or spend tokens.
+
+        Returns:
+            int: Number of models available to the API key
+        """
+        response = await self._get_client().get("/models")
+        response.raise_for_status()
+        return len(response.json().get("data", []))
+
+    async def _complete(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        response = await self._get_client().post("/chat/completions", json={
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": MAX_TOKENS,
+            "temperature": TEMPERATURE,
+        })
+        response.raise_for_status()
+        choices = response.json().get("choices") or []
+        if not choices or not choices[0].get("message"):
+            return None
+        return choices[0]["message"].get("content")
+
+    async def generate(self, prompt: str, use_case: str = "Smart Farming Advice", location: Optional[str] = None) -> str:
+        """
+        Generate AI-powered farming advice without blocking a worker thread.
+
+        Falls back to the built-in answers when no API key is configured,
+        the call fails or times out, or the answer leaks an API key.
+
+        Args:
+            prompt (str): User's farming question or concern
+            use_case (str): Type of farming advice needed
+            location (Optional[str]): User's location, for weather context
+                and regional fallback answers
+
+        Returns:
+            str: AI-generated response with farming advice
+
+        Raises:
+            AssistantBusyError: If the wait queue is full or the wait timed out
+        """
+        if not prompt or prompt.strip() == "":
+            return "❌ Please provide a specific farming question or concern."
+
+        if not self.configured:
+            logger.warning("⚠️ Using fallback responses - no valid API key or client")
+            return _get_fallback_response(prompt, use_case, location)
+
+        namespace, system_prompt = await self._system_prompt(use_case, location)
+        cached = self._cached(prompt, use_case, namespace, system_prompt, location)
+        if cached is not None:
+            return cached
+
+        await self._acquire()
+        semaphore = self._semaphore
+        assert semaphore is not None
+        self.active += 1
+        started = time.perf_counter()
+        try:
+            logger.info(f"🤖 Generating response for use case: {use_case}")
+            answer = await asyncio.wait_for(self._complete(self._messages(prompt, system_prompt)), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            logger.error(f"❌ AI response timed out after {self.timeout}s")
+            return _get_fallback_response(prompt, use_case, location)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"❌ Error generating response: {str(e)}")
+            return _get_fallback_response(prompt, use_case, location)
+        finally:
+            self.active -= 1
+            semaphore.release()
+
+        self.completed += 1
+        self.avg_latency = 0.8 * self.avg_latency + 0.2 * (time.perf_counter() - started)
+
+        if answer is None:
+            return "❌ No response generated from AI model."
+        if LEAK_MARKER in answer:
+            logger.warning("⚠️ API key detected in response - using fallback")
+            return _get_fallback_response(prompt, use_case, location)
+
+        logger.info("✅ Response generated successfully")
+        self._remember(prompt, namespace, system_prompt, answer)
+        return answer
+
+    async def _stream_completion(self, messages: List[Dict[str, str]]) -> AsyncGenerator[str, None]:
+        """Yield content deltas from a streamed (server-sent events) completion"""
+        async with self._get_client().stream("POST", "/chat/completions", json={
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": MAX_TOKENS,
+            "temperature": TEMPERATURE,
+            "stream": True,
+        }) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    return
+                choices = json.loads(data).get("choices") or []
+                content = choices[0].get("delta", {}).get("content") if choices else None
+                if content:
+                    yield content
+
+    async def stream(
+        self, prompt: str, use_case: str = "Smart Farming Advice", location: Optional[str] = None
+    ) -> AssistantStream:
+        """
+        Stream farming advice as it is generated.
+
+        Waits for a completion slot before returning, so a full queue is
+        reported before any response is sent.
+
+        Events:
+            {"type": "token", "content": str}    next piece of the answer
+            {"type": "replace", "content": str}  discard what was sent and show this
+                                                 instead (fallback after an error,
+                                                 timeout or leaked API key)
+            {"type": "done", "ttft_ms": float, "total_ms": float}
+
+        Args:
+            prompt (str): User's farming question or concern
+            use_case (str): Type of farming advice needed
+            location (Optional[str]): User's location, for weather context
+                and regional fallback answers
+
+        Returns:
+            AssistantStream: The events above; aclose() it when done
+
+        Raises:
+            AssistantBusyError: If the wait queue is full or the wait timed out
+        """
+        if not prompt or prompt.strip() == "" or not self.configured:
+            return AssistantStream(self._single_event_stream(await self.generate(prompt, use_case, location)))
+
+        namespace, system_prompt = await self._system_prompt(use_case, location)
+        cached = self._cached(prompt, use_case, namespace, system_prompt, location)
+        if cached is not None:
+            return AssistantStream(self._single_event_stream(cached))
+
+        await self._acquire()
+        slot = _Slot(self._semaphore)
+        return AssistantStream(self._stream_events(prompt, use_case, location, namespace, system_prompt, slot), slot)
+
+    async def _single_event_stream(self, answer: str) -> AsyncGenerator[Dict[str, Any], None]:
+        yield {"type": "token", "content": answer}
+        yield {"type": "done", "ttft_ms": 0.0, "total_ms": 0.0}
+
+    async def _stream_events(
+        self, prompt: str, use_case: str, location: Optional[str], namespace: str, system_prompt: str, slot: _Slot
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        self.active += 1
+        self.streams += 1
+        started = time.perf_counter()
+        first_token_at: Optional[float] = None
+        pending = ""
+        parts: List[str] = []
+        replacement: Optional[str] = None
+        chunks = self._stream_completion(self._messages(prompt, system_prompt))
+        try:
+            logger.info(f"🤖 Streaming response for use case: {use_case}")
+            while True:
+                # Each read waits only for what is left of the budget, so a stalled upstream cannot hold the slot
+                try:
+                    chunk = await asyncio.wait_for(
+                        chunks.__anext__(), max(self.timeout - (time.perf_counter() - started), 0.0)
+                    )
+                except StopAsyncIteration:
+                    break
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+
+                pending += chunk
+                parts.append(chunk)
+                if LEAK_MARKER in pending:
+                    self.leaks_blocked += 1
+                    logger.warning("⚠️ API key detected in streamed response - using fallback")
+                    replacement = _get_fallback_response(prompt, use_case, location)
+                    break
+                if len(pending) > LEAK_HOLDBACK:
+                    yield {"type": "token", "content": pending[:-LEAK_HOLDBACK]}
+                    pending = pending[-LEAK_HOLDBACK:]
+
+            if replacement is None:
+                if pending:
+                    yield {"type": "token", "content": pending}
+                elif first_token_at is None:
+                    replacement = "❌ No response generated from AI model."
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            logger.error(f"❌ AI response timed out after {self.timeout}s")
+            replacement = _get_fallback_response(prompt, use_case, location)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"❌ Error streaming response: {str(e)}")
+            replacement = _get_fallback_response(prompt, use_case, location)
+        finally:
+            self.active -= 1
+            slot.release()
+            await chunks.aclose()
+
+        if replacement is not None:
+            yield {"type": "replace", "content": replacement}
+        else:
+            self._remember(prompt, namespace, system_prompt, "".join(parts))
+
+        total = time.perf_counter() - started
+        ttft = (first_token_at or time.perf_counter()) - started
+        self.completed += 1
+        self.ttft.append(ttft)
+        self.stream_latency.append(total)
+        self.avg_latency = 0.8 * self.avg_latency + 0.2 * total
+        yield {"type": "done", "ttft_ms": round(ttft * 1000, 1), "total_ms": round(total * 1000, 1)}
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue, outcome and cache counters for /assistant/status"""
+        stats = {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "avg_latency_seconds": round(self.avg_latency, 3),
+            "streams": self.streams,
+            "knowledge_base_answers": self.local_answers,
+            "leaks_blocked": self.leaks_blocked,
+            "ttft_p50_seconds": _percentile(self.ttft, 0.5),
+            "ttft_p95_seconds": _percentile(self.ttft, 0.95),
+            "stream_latency_p50_seconds": _percentile(self.stream_latency, 0.5),
+            "stream_latency_p95_seconds": _percentile(self.stream_latency, 0.95),
+        }
+        if self.cache is not None:
+            stats["response_cache"] = self.cache.stats(self.avg_latency)
+        if self.weather_context is not None:
+            stats["weather_context"] = self.weather_context.stats()
+        return stats
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Assistant Engine Tests
+Checks concurrency limits, backpressure, timeouts and streaming against a mock LLM
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+pytest.importorskip("groq")
+
+from assistant_core import _get_fallback_response
+from assistant_engine import AssistantBusyError, AssistantEngine
+from response_cache import ResponseCache
+
+
+def mock_llm(answer="Plant maize early.", delay=0.0):
+    """Mock OpenAI-compatible chat completions server"""
+    state = {"calls": 0, "concurrent": 0, "peak": 0}
+
+    async def handler(request):
+        state["calls"] += 1
+        state["concurrent"] += 1
+        state["peak"] = max(state["peak"], state["concurrent"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            state["concurrent"] -= 1
+        return httpx.Response(200, json={"choices": [{"message": {"role": "assistant", "content": answer}}]})
+
+    return httpx.MockTransport(handler), state
+
+
+def make_engine(transport, **kwargs):
+    return AssistantEngine(api_key="gsk_test", base_url="http://mock-llm/v1", transport=transport, **kwargs)
+
+
+def test_generates_answer_within_concurrency_limit():
+    transport, state = mock_llm(delay=0.02)
+    engine = make_engine(transport, max_concurrency=2, max_queue=10)
+
+    async def run():
+        answers = await asyncio.gather(*[engine.generate("What should I plant?") for _ in range(6)])
+        await engine.close()
+        return answers
+
+    assert asyncio.run(run()) == ["Plant maize early."] * 6
+    assert state["peak"] == 2
+    assert engine.stats()["completed"] == 6
+
+
+def test_full_queue_is_rejected_with_retry_after():
+    transport, state = mock_llm(delay=0.2)
+    engine = make_engine(transport, max_concurrency=1, max_queue=1)
+
+    async def run():
+        return await asyncio.gather(*[engine.generate("When will it rain?") for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+    busy = [r for r in results if isinstance(r, AssistantBusyError)]
+    assert len(busy) == 1 and busy[0].retry_after >= 1
+    assert state["calls"] == 2
+
+
+def test_timeout_and_key_leak_fall_back():
+    slow, _ = mock_llm(delay=1.0)
+    engine = make_engine(slow, timeout=0.05)
+    assert asyncio.run(engine.generate("pest control")) == _get_fallback_response("pest control", "Smart Farming Advice")
+    assert engine.stats()["timeouts"] == 1
+
+    leaky, _ = mock_llm(answer="Your key is gsk_abc123")
+    engine = make_engine(leaky)
+    assert asyncio.run(engine.generate("soil")) == _get_fallback_response("soil", "Smart Farming Advice")
+
+
+def mock_streaming_llm(chunks):
+    """Mock chat completions server answering with server-sent events"""
+
+    def handler(request):
+        lines = [
+            "data: " + json.dumps({"choices": [{"delta": {"content": chunk}}]}) + "\n\n"
+            for chunk in chunks
+        ]
+        return httpx.Response(200, content="".join(lines) + "data: [DONE]\n\n", headers={"content-type": "text/event-stream"})
+
+    return httpx.MockTransport(handler)
+
+
+async def collect(engine, prompt):
+    stream = await engine.stream(prompt)
+    try:
+        return [event async for event in stream]
+    finally:
+        await stream.aclose()
+
+
+def test_stream_forwards_tokens_and_records_latency():
+    engine = make_engine(mock_streaming_llm(["Plant ", "maize ", "in March."]))
+    events = asyncio.run(collect(engine, "What should I plant?"))
+
+    assert "".join(e["content"] for e in events if e["type"] == "token") == "Plant maize in March."
+    assert events[-1]["type"] == "done" and events[-1]["total_ms"] >= events[-1]["ttft_ms"]
+    assert engine.stats()["ttft_p50_seconds"] is not None
+    assert engine.active == 0
+
+
+def test_stream_catches_key_split_across_chunks():
+    engine = make_engine(mock_streaming_llm(["Your key is g", "sk_abc123"]))
+    events = asyncio.run(collect(engine, "soil"))
+
+    sent = "".join(e["content"] for e in events if e["type"] == "token")
+    assert "gsk" not in sent
+    assert events[-2] == {"type": "replace", "content": _get_fallback_response("soil", "Smart Farming Advice")}
+    assert engine.stats()["leaks_blocked"] == 1
+
+
+def test_unstarted_stream_gives_its_slot_back():
+    engine = make_engine(mock_streaming_llm(["Plant maize."]), max_concurrency=1, max_queue=0, queue_timeout=0.05)
+
+    async def run():
+        # The client disconnects before the body is iterated
+        stream = await engine.stream("What should I plant?")
+        await stream.aclose()
+        return await collect(engine, "When will it rain?")
+
+    events = asyncio.run(run())
+    assert events[-1]["type"] == "done"
+    assert engine.stats()["rejected"] == 0
+
+
+def test_stalled_stream_times_out_and_gives_its_slot_back():
+    async def stalled_body():
+        yield b"data: " + json.dumps({"choices": [{"delta": {"content": "Plant "}}]}).encode() + b"\n\n"
+        await asyncio.sleep(60)
+
+    def handler(request):
+        return httpx.Response(200, content=stalled_body(), headers={"content-type": "text/event-stream"})
+
+    engine = make_engine(httpx.MockTransport(handler), max_concurrency=1, max_queue=0, queue_timeout=0.05, timeout=0.2)
+
+    async def run():
+        events = await asyncio.wait_for(collect(engine, "What should I plant?"), timeout=2)
+        return events, engine._semaphore.locked()
+
+    events, locked = asyncio.run(run())
+    assert events[-2] == {"type": "replace", "content": _get_fallback_response("What should I plant?", "Smart Farming Advice")}
+    assert engine.stats()["timeouts"] == 1 and engine.active == 0 and not locked
+
+
+def test_cached_answers_skip_the_llm():
+    transport, state = mock_llm()
+    engine = make_engine(transport, cache=ResponseCache())
+
+    async def run():
+        first = await engine.generate("What should I plant?")
+        second = await engine.generate("what should I plant")
+        streamed = await collect(engine, "What should I plant??")
+        return first, second, streamed
+
+    first, second, streamed = asyncio.run(run())
+    assert first == second == streamed[0]["content"] == "Plant maize early."
+    assert state["calls"] == 1
+    assert engine.stats()["response_cache"]["exact_hits"] == 2
@@ -0,0 +1,117 @@
+"""
+📡 Assistant Connectivity Monitor
+Probes the LLM provider in the background with a cheap "list models" call
+and keeps a rolling success rate and latency histogram, so
+/assistant/status answers instantly without spending tokens.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from assistant_core import DEFAULT_MODEL, system_prompts
+from assistant_engine import AssistantEngine
+
+logger = logging.getLogger(__name__)
+
+ASSISTANT_PROBE_INTERVAL_SECONDS = float(os.getenv("ASSISTANT_PROBE_INTERVAL_SECONDS", "60"))
+ASSISTANT_PROBE_WINDOW = int(os.getenv("ASSISTANT_PROBE_WINDOW", "60"))
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class ConnectivityMonitor:
+    """Rolling record of LLM provider probes"""
+
+    def __init__(
+        self,
+        engine: AssistantEngine,
+        interval: float = ASSISTANT_PROBE_INTERVAL_SECONDS,
+        window: int = ASSISTANT_PROBE_WINDOW,
+    ):
+        self.engine = engine
+        self.interval = interval
+        # (ok, latency seconds) of the most recent probes
+        self.probes: Deque[Tuple[bool, float]] = deque(maxlen=window)
+        self.last_checked: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    async def probe(self) -> bool:
+        """Run one probe and record the outcome"""
+        started = time.perf_counter()
+        try:
+            await self.engine.list_models()
+            ok = True
+            self.last_error = None
+        except Exception as e:
+            ok = False
+            self.last_error = str(e)
+            logger.warning(f"⚠️ AI Assistant probe failed: {e}")
+        self.probes.append((ok, time.perf_counter() - started))
+        self.last_checked = datetime.now()
+        return ok
+
+    async def run(self):
+        """Probe every `interval` seconds until cancelled"""
+        if not self.engine.configured:
+            return
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.interval)
+
+    def _histogram(self) -> Dict[str, int]:
+        counts = {f"<={bound}s": 0 for bound in LATENCY_BUCKETS}
+        counts[f">{LATENCY_BUCKETS[-1]}s"] = 0
+        for ok, latency in self.probes:
+            if not ok:
+                continue
+            label = next((f"<={bound}s" for bound in LATENCY_BUCKETS if latency <= bound), f">{LATENCY_BUCKETS[-1]}s")
+            counts[label] += 1
+        return counts
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Assistant status from configuration and recorded probes, without any
+        network call.
+
+        Returns:
+            Dict[str, Any]: Same fields as assistant_core.test_connectivity, plus
+            the rolling probe statistics
+        """
+        result: Dict[str, Any] = {
+            "api_key_configured": bool(self.engine.api_key),
+            "client_initialized": self.engine.configured,
+            "available_use_cases": list(system_prompts.keys()),
+            "default_model": DEFAULT_MODEL,
+        }
+
+        if not self.engine.api_key:
+            result["status"] = "no_api_key"
+            result["message"] = "GROQ_API_KEY not found in environment variables"
+        elif not self.engine.configured:
+            result["status"] = "demo_mode"
+            result["message"] = "Demo API key configured, using built-in answers"
+        elif not self.probes:
+            result["status"] = "unknown"
+            result["message"] = "No connectivity probe has completed yet"
+        elif self.probes[-1][0]:
+            result["status"] = "working"
+            result["message"] = "AI Assistant is working correctly"
+        else:
+            result["status"] = "api_error"
+            result["message"] = f"Last probe failed: {self.last_error}"
+
+        successes = sum(1 for ok, _ in self.probes if ok)
+        result["connectivity"] = {
+            "probe_interval_seconds": self.interval,
+            "probes": len(self.probes),
+            "success_rate": round(successes / len(self.probes), 4) if self.probes else None,
+            "last_checked": self.last_checked.isoformat() if self.last_checked else None,
+            "latency_histogram": self._histogram(),
+        }
+        return result
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Assistant Monitor Tests
+Checks that probes list models instead of requesting completions and that
+status is built from the recorded probes
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+pytest.importorskip("groq")
+
+from assistant_engine import AssistantEngine
+from assistant_monitor import ConnectivityMonitor
+
+
+def test_status_comes_from_model_list_probes():
+    paths = []
+    outcomes = iter([200, 200, 503])
+
+    def handler(request):
+        paths.append(request.url.path)
+        return httpx.Response(next(outcomes), json={"data": [{"id": "llama3-70b-8192"}]})
+
+    engine = AssistantEngine(api_key="gsk_test", base_url="http://mock-llm/v1", transport=httpx.MockTransport(handler))
+    monitor = ConnectivityMonitor(engine)
+    assert monitor.status()["status"] == "unknown"
+
+    async def run():
+        for _ in range(3):
+            await monitor.probe()
+
+    asyncio.run(run())
+    status = monitor.status()
+
+    assert paths == ["/v1/models"] * 3
+    assert status["status"] == "api_error"
+    assert status["connectivity"]["success_rate"] == round(2 / 3, 4)
+    assert sum(status["connectivity"]["latency_histogram"].values()) == 2
+
+
+def test_status_without_api_key():
+    monitor = ConnectivityMonitor(AssistantEngine(api_key=None))
+    assert monitor.status()["status"] == "no_api_key"
@@ -1,19 +1,110 @@
-from sqlalchemy import Column, Integer, String, Float, Date
+import os
+from contextlib import nullcontext
+from datetime import datetime
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Index
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
+
+# Load .env from repo root (this module is imported before the API loads it)
+load_dotenv(dotenv_path=Path(__file__).resolve().parents[1] / ".env")
 
 # Define the base class for our ORM models
 Base = declarative_base()
 
-# SQLite Database URL - this will create a 'weather.db' file in your project folder
-DATABASE_URL = "sqlite:///./weather.db"
+# Database URL - defaults to a 'weather.db' SQLite file in the working directory
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./weather.db")
+
+# Connection pool for server databases (Postgres)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# How long (ms) a SQLite writer waits for a lock before failing
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers run alongside the writer; NORMAL syncs at checkpoints instead of every commit
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+def create_db_engine(url: str = DATABASE_URL) -> Engine:
+    """
+    Create the engine for a database URL.
+
+    SQLite gets WAL mode, synchronous=NORMAL and a busy timeout on every
+    connection; other databases get a sized QueuePool with pre-ping so
+    connections dropped by the server are replaced transparently.
 
-# Create the SQLite engine
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    Args:
+        url (str): SQLAlchemy database URL
+
+    Returns:
+        Engine: The configured engine
+    """
+    if url.startswith("sqlite"):
+        sqlite_engine = create_engine(url, connect_args={"check_same_thread": False})
+        event.listen(sqlite_engine, "connect", _set_sqlite_pragmas)
+        return sqlite_engine
+    return create_engine(
+        url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+
+# Async drivers used by the API handlers, per sync URL scheme
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+def async_database_url(url: str = DATABASE_URL) -> str:
+    """Map a database URL to the same database through its async driver"""
+    scheme, sep, rest = url.partition("://")
+    backend = scheme.split("+")[0]
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    return ASYNC_DRIVERS[backend] + sep + rest
+
+def create_async_db_engine(url: str = DATABASE_URL) -> AsyncEngine:
+    """
+    Create the async engine (aiosqlite or asyncpg) for a database URL,
+    with the same SQLite pragmas and pool settings as create_db_engine.
+    """
+    async_url = async_database_url(url)
+    if async_url.startswith("sqlite"):
+        sqlite_engine = create_async_engine(async_url)
+        event.listen(sqlite_engine.sync_engine, "connect", _set_sqlite_pragmas)
+        return sqlite_engine
+    return create_async_engine(
+        async_url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+
+# Create the engines: sync for scripts and bulk jobs, async for the API handlers
+engine = create_db_engine()
+async_engine = create_async_db_engine()
 
 # Create a session maker for interacting with the database
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Define the User model to store user information
 class User(Base):
@@ -27,12 +118,52 @@ class User(Base):
 # Define the WeatherData model to store weather predictions
 class WeatherData(Base):
     __tablename__ = "weather_data"  # Table name for weather predictions
+    # One row per (location, date, source, model version): the forecast store key
+    __table_args__ = (
+        Index("ux_weather_data_key", "location", "date", "source", "model_version", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     date = Column(Date, index=True)  # Using Date type for proper date storage
     location = Column(String, index=True)
     temperature = Column(Float)
     rain = Column(Float)
+    source = Column(String, nullable=False, default="manual", server_default="manual")  # open-meteo, ml-model or manual
+    model_version = Column(String, nullable=False, default="", server_default="")  # Artifact versions for ml-model rows
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)  # When the values were stored
+
+def migrate_weather_data(bind=engine):
+    """Add the forecast store columns and key to a weather_data table created before them"""
+    inspector = inspect(bind)
+    if not inspector.has_table("weather_data"):
+        return
+    columns = {column["name"] for column in inspector.get_columns("weather_data")}
+    indexes = {index["name"] for index in inspector.get_indexes("weather_data")}
+    updated_at_type = DateTime().compile(dialect=bind.dialect)
+    # An engine gets its own transaction; a connection is migrated in the caller's
+    with bind.begin() if isinstance(bind, Engine) else nullcontext(bind) as conn:
+        if "source" not in columns:
+            conn.execute(text("ALTER TABLE weather_data ADD COLUMN source VARCHAR NOT NULL DEFAULT 'manual'"))
+        if "model_version" not in columns:
+            conn.execute(text("ALTER TABLE weather_data ADD COLUMN model_version VARCHAR NOT NULL DEFAULT ''"))
+        if "updated_at" not in columns:
+            conn.execute(text(f"ALTER TABLE weather_data ADD COLUMN updated_at {updated_at_type}"))
+        if "ux_weather_data_key" not in indexes:
+            # Older rows could repeat a key; keep the latest of each
+            conn.execute(text(
+                "DELETE FROM weather_data WHERE id NOT IN "
+                "(SELECT MAX(id) FROM weather_data GROUP BY location, date, source, model_version)"
+            ))
+            conn.execute(text(
+                "CREATE UNIQUE INDEX ux_weather_data_key ON weather_data (location, date, source, model_version)"
+            ))
+
+def init_db(bind=engine):
+    """
+    Create all tables that don't exist yet and migrate older ones.
 
-# Create all tables in the database if they don't already exist
-Base.metadata.create_all(bind=engine)
+    Args:
+        bind: Engine, or a connection (e.g. from AsyncConnection.run_sync)
+    """
+    Base.metadata.create_all(bind=bind)
+    migrate_weather_data(bind)
@@ -10,6 +10,28 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dotenv import load_dotenv
 
+# Example values shipped in env.example, README.md and docker-compose.yml; a
+# session token signed with one of these can be forged by anyone
+PLACEHOLDER_SECRET_KEYS = frozenset({
+    'your_secret_key_here',
+    'your_super_secret_key_here',
+    'anga_weather_secret_key_2024_secure_random_string_here',
+    'secret',
+    'changeme',
+})
+MIN_SECRET_KEY_LENGTH = 32
+
+
+def secret_key_problem(value: Optional[str]) -> Optional[str]:
+    """Why a SECRET_KEY value cannot sign session tokens, or None if it can"""
+    if not value:
+        return "SECRET_KEY is not set"
+    if value.strip().lower() in PLACEHOLDER_SECRET_KEYS or value.lower().startswith('your_'):
+        return "SECRET_KEY still has a placeholder value"
+    if len(value) < MIN_SECRET_KEY_LENGTH:
+        return f"SECRET_KEY is shorter than {MIN_SECRET_KEY_LENGTH} characters"
+    return None
+
 class EnvironmentValidator:
     """Validates environment configuration for the ANGA Weather App"""
     
@@ -53,7 +75,7 @@ class EnvironmentValidator:
                 'description': 'Application secret key',
                 'type': 'string',
                 'required': True,
-                'default': 'anga_weather_secret_key_2024_secure_random_string_here'
+                'validation': self._validate_secret_key
             },
             'DEBUG_MODE': {
                 'description': 'Debug mode flag',
@@ -82,6 +104,13 @@ class EnvironmentValidator:
         
         return True, "API key format is valid"
     
+    def _validate_secret_key(self, value: str) -> Tuple[bool, str]:
+        """Validate that the session signing key is not a placeholder"""
+        problem = secret_key_problem(value)
+        if problem:
+            return False, f"{problem}; generate one with: python -c \"import secrets; print(secrets.token_urlsafe(32))\""
+        return True, "Secret key is set"
+
     def _validate_port(self, value: str) -> Tuple[bool, str]:
         """Validate port number"""
         try:
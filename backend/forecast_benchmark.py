@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Forecast Benchmark
+Compares Prophet's model.predict with the NumPy artifact evaluator for
+per-request and whole-season forecasts.
+
+Usage:
+    python forecast_benchmark.py [days]
+"""
+
+import logging
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from model_artifacts import ProphetArtifact
+
+MODEL_DIR = backend_dir / "model"
+
+
+def timed(fn, repeat=1):
+    """Best wall time of `repeat` runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(name: str, days: int):
+    import pandas as pd
+
+    with open(MODEL_DIR / f"{name}.pkl", "rb") as f:
+        model = pickle.load(f)
+    artifact = ProphetArtifact.load(MODEL_DIR / f"{name}.npz")
+
+    season = pd.date_range(pd.Timestamp.today().normalize() + pd.Timedelta(days=17), periods=days, freq="D")
+    season_np = season.to_numpy()
+    one_day = season[:1]
+
+    results = {
+        "single date: prophet": timed(lambda: model.predict(pd.DataFrame({"ds": one_day})), repeat=5),
+        "single date: numpy": timed(lambda: artifact.predict(one_day.to_numpy()), repeat=50),
+        f"{days} dates: prophet": timed(lambda: model.predict(pd.DataFrame({"ds": season})), repeat=3),
+        f"{days} dates: numpy yhat": timed(lambda: artifact.predict(season_np), repeat=50),
+        f"{days} dates: numpy + intervals": timed(lambda: artifact.predict_interval(season_np), repeat=50),
+    }
+
+    logger.info(f"\n📊 {name}")
+    for label, seconds in results.items():
+        logger.info(f"   {label:<32} {seconds * 1000:10.3f} ms")
+    logger.info(f"   speedup (single date): {results['single date: prophet'] / results['single date: numpy']:,.0f}x")
+    logger.info(f"   speedup ({days} dates):  {results[f'{days} dates: prophet'] / results[f'{days} dates: numpy yhat']:,.0f}x")
+
+    np.testing.assert_allclose(
+        artifact.predict(season_np),
+        model.predict(pd.DataFrame({"ds": season}))["yhat"].to_numpy(),
+        atol=1e-6,
+    )
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 180
+    for name in ("temp_model", "rain_model"):
+        benchmark(name, days)
+
+
+if __name__ == "__main__":
+    main()
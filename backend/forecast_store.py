@@ -0,0 +1,202 @@
+"""
+💾 Forecast Store
+Read-through, write-behind store for predictions in the weather_data table,
+keyed by (location, date, source, model version).
+
+Reads hit the unique key index; values are fresh while younger than the
+caller's max age (model rows never expire, since a retrained model gets a
+new version and so a new key). New values are queued in memory, served from
+the queue until written, and upserted in batches by a background task.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from database import AsyncSessionLocal, WeatherData
+
+logger = logging.getLogger(__name__)
+
+# Max age (seconds) of stored Open-Meteo values served by /predict/
+FORECAST_STORE_LIVE_TTL_SECONDS = int(os.getenv("FORECAST_STORE_LIVE_TTL_SECONDS", "3600"))
+# How often (seconds) queued values are written, and the rows per write
+FORECAST_STORE_FLUSH_SECONDS = float(os.getenv("FORECAST_STORE_FLUSH_SECONDS", "2"))
+FORECAST_STORE_BATCH_SIZE = int(os.getenv("FORECAST_STORE_BATCH_SIZE", "500"))
+
+# Queued values kept when the database is failing; older ones are dropped
+MAX_PENDING_FACTOR = 20
+
+StoreKey = Tuple[str, date, str, str]
+KEY_COLUMNS = ["location", "date", "source", "model_version"]
+
+
+def upsert_weather_rows(session: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert or update weather_data rows on their store key with one statement.
+
+    From an AsyncSession, call it as ``await db.run_sync(upsert_weather_rows, rows)``.
+
+    Args:
+        session (Session): Database session; the caller commits
+        rows (List[Dict[str, Any]]): Rows with the key columns, temperature and rain
+
+    Returns:
+        int: Number of rows written
+
+    Raises:
+        ValueError: If the database has no upsert support here
+    """
+    if not rows:
+        return 0
+    dialects = {"sqlite": sqlite, "postgresql": postgresql}
+    dialect = dialects.get(session.get_bind().dialect.name)
+    if dialect is None:
+        raise ValueError(f"Upserts are not supported on {session.get_bind().dialect.name}")
+    now = datetime.now()
+    stmt = dialect.insert(WeatherData)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=KEY_COLUMNS,
+        set_={"temperature": stmt.excluded.temperature, "rain": stmt.excluded.rain, "updated_at": stmt.excluded.updated_at},
+    )
+    session.execute(stmt, [{**row, "updated_at": now} for row in rows])
+    return len(rows)
+
+
+class ForecastStore:
+    """weather_data as a read-through, write-behind forecast store"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        flush_interval: float = FORECAST_STORE_FLUSH_SECONDS,
+        batch_size: int = FORECAST_STORE_BATCH_SIZE,
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._pending: Dict[StoreKey, Tuple[float, float]] = {}
+        self._flush_now = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.rows_written = 0
+        self.flushes = 0
+        self.flush_errors = 0
+        self.dropped = 0
+
+    async def _read(self, key: StoreKey, max_age: Optional[float]) -> Optional[Tuple[float, float]]:
+        location, day, source, model_version = key
+        query = select(WeatherData.temperature, WeatherData.rain).where(
+            WeatherData.location == location,
+            WeatherData.date == day,
+            WeatherData.source == source,
+            WeatherData.model_version == model_version,
+        )
+        if max_age is not None:
+            query = query.where(WeatherData.updated_at >= datetime.now() - timedelta(seconds=max_age))
+        async with self.session_factory() as db:
+            row = (await db.execute(query.limit(1))).first()
+        return None if row is None else (row.temperature, row.rain)
+
+    async def get(
+        self, location: str, day: date, source: str, model_version: str = "", max_age: Optional[float] = None
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Get stored (temperature, rain) for a key.
+
+        Args:
+            location (str): Location name
+            day (date): Forecast day
+            source (str): "open-meteo", "ml-model" or "manual"
+            model_version (str): Model versions for ml-model rows
+            max_age (Optional[float]): Ignore rows older than this many seconds
+
+        Returns:
+            Optional[Tuple[float, float]]: The stored values, or None when missing or stale
+        """
+        key = (location, day, source, model_version)
+        value = self._pending.get(key)
+        if value is None:
+            try:
+                value = await self._read(key, max_age)
+            except Exception as e:
+                logger.warning(f"⚠️ Forecast store read failed: {e}")
+        if value is None or value[0] is None or value[1] is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, location: str, day: date, source: str, model_version: str, temperature: float, rain: float):
+        """Queue values for the next batched write"""
+        key = (location, day, source, model_version)
+        self._pending.pop(key, None)
+        self._pending[key] = (temperature, rain)
+        if len(self._pending) >= self.batch_size:
+            self._flush_now.set()
+
+    async def _write(self, rows: List[Dict[str, Any]]):
+        async with self.session_factory() as db:
+            for start in range(0, len(rows), self.batch_size):
+                await db.run_sync(upsert_weather_rows, rows[start:start + self.batch_size])
+            await db.commit()
+
+    async def flush(self) -> int:
+        """Write the queued values; on failure they stay queued for the next flush"""
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            rows = [
+                {"location": loc, "date": day, "source": src, "model_version": version, "temperature": t, "rain": r}
+                for (loc, day, src, version), (t, r) in batch.items()
+            ]
+            started = time.perf_counter()
+            try:
+                await self._write(rows)
+            except Exception as e:
+                self.flush_errors += 1
+                logger.error(f"❌ Forecast store write of {len(rows)} rows failed: {e}")
+                # Newer values queued meanwhile win over the failed ones
+                self._pending = {**batch, **self._pending}
+                while len(self._pending) > self.batch_size * MAX_PENDING_FACTOR:
+                    self._pending.pop(next(iter(self._pending)))
+                    self.dropped += 1
+                return 0
+            self.flushes += 1
+            self.rows_written += len(rows)
+            logger.debug(f"💾 Stored {len(rows)} forecasts in {time.perf_counter() - started:.3f}s")
+            return len(rows)
+
+    async def run(self):
+        """Write queued values every flush interval, or as soon as a batch is full"""
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            await self.flush()
+
+    async def close(self):
+        """Write whatever is still queued"""
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "pending": len(self._pending),
+            "rows_written": self.rows_written,
+            "flushes": self.flushes,
+            "flush_errors": self.flush_errors,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Forecast Store Tests
+Checks read-through freshness, batched write-behind upserts and the
+migration of weather_data tables created before the store key
+"""
+
+import asyncio
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from database import Base, WeatherData, create_async_db_engine, migrate_weather_data
+from forecast_store import ForecastStore
+
+DAY = date(2027, 6, 1)
+
+
+def make_store(tmp_path, **kwargs):
+    """Store on an async engine, plus a sync engine on the same file for checks"""
+    url = f"sqlite:///{tmp_path / 'store.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    async_engine = create_async_db_engine(url)
+    return ForecastStore(async_sessionmaker(async_engine, expire_on_commit=False), **kwargs), engine, async_engine
+
+
+def test_values_are_written_behind_and_read_back(tmp_path):
+    store, engine, async_engine = make_store(tmp_path, batch_size=2)
+
+    async def run():
+        store.put("machakos", DAY, "ml-model", "v1", 21.0, 3.0)
+        # Served from the queue before it is written
+        assert await store.get("machakos", DAY, "ml-model", "v1") == (21.0, 3.0)
+        store.put("machakos", DAY, "ml-model", "v1", 22.0, 4.0)
+        store.put("machakos", DAY, "ml-model", "v2", 23.0, 5.0)
+        assert await store.flush() == 2
+        stored = (
+            await store.get("machakos", DAY, "ml-model", "v1"),
+            await store.get("machakos", DAY, "ml-model", "v3"),
+        )
+        await async_engine.dispose()
+        return stored
+
+    assert asyncio.run(run()) == ((22.0, 4.0), None)
+    with sessionmaker(bind=engine)() as db:
+        assert db.query(WeatherData).count() == 2
+    assert store.stats()["rows_written"] == 2 and store.stats()["pending"] == 0
+
+
+def test_stale_rows_are_not_served(tmp_path):
+    store, engine, async_engine = make_store(tmp_path)
+
+    async def run():
+        store.put("machakos", DAY, "open-meteo", "", 25.0, 0.0)
+        await store.flush()
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE weather_data SET updated_at = :old"), {"old": datetime.now() - timedelta(hours=2)})
+        stored = (
+            await store.get("machakos", DAY, "open-meteo", max_age=3600),
+            await store.get("machakos", DAY, "open-meteo", max_age=3 * 3600),
+        )
+        await async_engine.dispose()
+        return stored
+
+    assert asyncio.run(run()) == (None, (25.0, 0.0))
+
+
+def test_migration_adds_the_store_key(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE weather_data (id INTEGER PRIMARY KEY, date DATE, location VARCHAR, temperature FLOAT, rain FLOAT)"
+        ))
+        conn.execute(text(
+            "INSERT INTO weather_data (date, location, temperature, rain) VALUES "
+            "('2027-06-01', 'machakos', 20, 1), ('2027-06-01', 'machakos', 21, 2), ('2027-06-02', 'machakos', 22, 3)"
+        ))
+
+    migrate_weather_data(engine)
+    migrate_weather_data(engine)
+
+    inspector = inspect(engine)
+    assert {"source", "model_version", "updated_at"} <= {c["name"] for c in inspector.get_columns("weather_data")}
+    assert any(index["name"] == "ux_weather_data_key" and index["unique"] for index in inspector.get_indexes("weather_data"))
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT date, temperature, source FROM weather_data ORDER BY date")).fetchall()
+    assert [tuple(row) for row in rows] == [("2027-06-01", 21.0, "manual"), ("2027-06-02", 22.0, "manual")]
@@ -0,0 +1,78 @@
+"""
+📅 Forecast Table
+Materializes the model forecasts once over a long horizon so far-horizon
+/predict/ requests are answered with an O(1) array lookup instead of a
+model evaluation per request.
+"""
+
+import logging
+import os
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple
+
+import numpy as np
+
+from model_artifacts import ProphetArtifact
+
+logger = logging.getLogger(__name__)
+
+# How many days ahead (from today) each table covers
+DEFAULT_HORIZON_DAYS = int(os.getenv("FORECAST_HORIZON_DAYS", "730"))
+
+# How often the background task refreshes the loaded models and their tables
+DEFAULT_REFRESH_SECONDS = int(os.getenv("FORECAST_REFRESH_SECONDS", "300"))
+
+
+class ForecastTable:
+    """Date-indexed yhat / yhat_lower / yhat_upper arrays for one model"""
+
+    def __init__(self, start: date, yhat: np.ndarray, yhat_lower: np.ndarray, yhat_upper: np.ndarray):
+        self.start = start
+        self.yhat = yhat
+        self.yhat_lower = yhat_lower
+        self.yhat_upper = yhat_upper
+        self.built_at = datetime.now()
+
+    @classmethod
+    def from_model(cls, model: ProphetArtifact, start: date, horizon_days: int = DEFAULT_HORIZON_DAYS) -> "ForecastTable":
+        """
+        Evaluate a model once over the whole horizon.
+
+        Args:
+            model (ProphetArtifact): Exported model
+            start (date): First day covered by the table
+            horizon_days (int): Number of consecutive days to materialize
+
+        Returns:
+            ForecastTable: Table covering [start, start + horizon_days)
+        """
+        days = np.datetime64(start, "D") + np.arange(horizon_days)
+        yhat, yhat_lower, yhat_upper = model.predict_interval(days)
+        return cls(
+            start,
+            yhat.astype(np.float32),
+            yhat_lower.astype(np.float32),
+            yhat_upper.astype(np.float32),
+        )
+
+    @property
+    def end(self) -> date:
+        """Last day covered by the table"""
+        return self.start + timedelta(days=len(self.yhat) - 1)
+
+    def covers(self, day: date) -> bool:
+        return 0 <= (day - self.start).days < len(self.yhat)
+
+    def lookup(self, day: date) -> Optional[Tuple[float, float, float]]:
+        """
+        Get (yhat, yhat_lower, yhat_upper) for a single day.
+
+        Returns:
+            Optional[Tuple[float, float, float]]: The forecast, or None if the
+            day falls outside the table
+        """
+        index = (day - self.start).days
+        if index < 0 or index >= len(self.yhat):
+            return None
+        return float(self.yhat[index]), float(self.yhat_lower[index]), float(self.yhat_upper[index])
+
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Forecast Table Tests
+Checks the materialized forecast lookups
+"""
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from forecast_table import ForecastTable
+
+
+class ConstantModel:
+    """Stand-in for an exported model that predicts a constant"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def predict(self, days):
+        return np.full(len(days), self.value)
+
+    def predict_interval(self, days):
+        yhat = self.predict(days)
+        return yhat, yhat - 1, yhat + 1
+
+
+def test_lookup_inside_and_outside_table():
+    start = date(2025, 1, 1)
+    table = ForecastTable.from_model(ConstantModel(20.0), start, horizon_days=10)
+
+    assert table.end == start + timedelta(days=9)
+    assert table.lookup(start + timedelta(days=3)) == (20.0, 19.0, 21.0)
+    assert table.lookup(start - timedelta(days=1)) is None
+    assert table.lookup(start + timedelta(days=10)) is None
+
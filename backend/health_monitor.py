@@ -0,0 +1,141 @@
+"""
+🩺 Health Monitor
+Runs the component checks (database, Open-Meteo, assistant, models, caches,
+environment) on a background schedule, each with its own timeout, and keeps
+the result as a pre-serialized snapshot. /health and /ready answer from that
+snapshot without touching any dependency.
+
+A check is an async callable returning a dict of details; raising marks it
+failed. Critical checks decide readiness; the rest only degrade the status.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_INTERVAL_SECONDS = float(os.getenv("HEALTH_CHECK_INTERVAL_SECONDS", "15"))
+HEALTH_CHECK_TIMEOUT_SECONDS = float(os.getenv("HEALTH_CHECK_TIMEOUT_SECONDS", "3"))
+
+Check = Callable[[], Awaitable[Dict[str, Any]]]
+Summary = Callable[[Dict[str, Dict[str, Any]]], Dict[str, Any]]
+
+
+@dataclass
+class RegisteredCheck:
+    check: Check
+    critical: bool
+    interval: float
+    timeout: float
+    result: Optional[Dict[str, Any]] = None
+    next_run: float = 0.0
+
+
+class HealthMonitor:
+    """Background-refreshed health snapshot for liveness and readiness probes"""
+
+    def __init__(
+        self,
+        interval: float = HEALTH_CHECK_INTERVAL_SECONDS,
+        timeout: float = HEALTH_CHECK_TIMEOUT_SECONDS,
+        summary: Optional[Summary] = None,
+    ):
+        self.interval = interval
+        self.timeout = timeout
+        self.summary = summary
+        self._checks: Dict[str, RegisteredCheck] = {}
+        self.ready = False
+        self.refreshes = 0
+        self._snapshot: Dict[str, Any] = {"status": "starting", "ready": False, "checks": {}}
+        self._body = json.dumps(self._snapshot).encode()
+
+    def register(
+        self,
+        name: str,
+        check: Check,
+        critical: bool = False,
+        interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Add a component check.
+
+        Args:
+            name (str): Key in the snapshot's "checks"
+            check (Check): Async callable returning details, raising on failure
+            critical (bool): Whether a failure makes the service not ready
+            interval (Optional[float]): Seconds between runs (default: the monitor's)
+            timeout (Optional[float]): Seconds before the check counts as failed
+        """
+        self._checks[name] = RegisteredCheck(
+            check, critical, interval or self.interval, timeout or self.timeout
+        )
+
+    async def _run_check(self, name: str, registered: RegisteredCheck) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            details = await asyncio.wait_for(registered.check(), timeout=registered.timeout)
+            result = {"status": "ok", **(details or {})}
+        except asyncio.TimeoutError:
+            result = {"status": "timeout", "error": f"No answer within {registered.timeout}s"}
+        except Exception as e:
+            result = {"status": "error", "error": str(e)}
+        result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        result["checked_at"] = datetime.now().isoformat()
+        if result["status"] != "ok" and (registered.result or {}).get("status") == "ok":
+            logger.warning(f"⚠️ Health check '{name}' failed: {result.get('error')}")
+        return result
+
+    async def refresh(self, force: bool = False) -> Dict[str, Any]:
+        """Run the checks that are due and rebuild the snapshot"""
+        now = time.monotonic()
+        due = {
+            name: registered for name, registered in self._checks.items()
+            if force or registered.result is None or registered.next_run <= now
+        }
+        results = await asyncio.gather(*[self._run_check(name, r) for name, r in due.items()])
+        for (name, registered), result in zip(due.items(), results):
+            registered.result = result
+            registered.next_run = now + registered.interval
+
+        checks = {name: registered.result for name, registered in self._checks.items()}
+        failed = [name for name, result in checks.items() if result["status"] != "ok"]
+        self.ready = not any(self._checks[name].critical for name in failed)
+        snapshot: Dict[str, Any] = {
+            "status": "healthy" if not failed else ("degraded" if self.ready else "unhealthy"),
+            "ready": self.ready,
+            "timestamp": datetime.now().isoformat(),
+            "failed_checks": failed,
+            "checks": checks,
+        }
+        if self.summary is not None:
+            try:
+                snapshot.update(self.summary(checks))
+            except Exception as e:
+                logger.error(f"❌ Health summary failed: {e}")
+        self._snapshot = snapshot
+        self._body = json.dumps(snapshot, default=str).encode()
+        self.refreshes += 1
+        return snapshot
+
+    async def run(self):
+        """Refresh forever; checks with longer intervals run only when due"""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"❌ Health refresh failed: {e}")
+            await asyncio.sleep(min([self.interval] + [r.interval for r in self._checks.values()]))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return self._snapshot
+
+    def body(self) -> bytes:
+        """The snapshot as JSON, serialized once per refresh"""
+        return self._body
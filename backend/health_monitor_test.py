@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Health Monitor Tests
+Checks per-check timeouts, readiness from critical checks and the cached
+snapshot
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from health_monitor import HealthMonitor
+
+
+def test_readiness_follows_critical_checks():
+    async def database():
+        return {"pool": "ok"}
+
+    async def slow_upstream():
+        await asyncio.sleep(1)
+        return {}
+
+    async def broken_assistant():
+        raise RuntimeError("api_error")
+
+    monitor = HealthMonitor(timeout=0.05, summary=lambda checks: {"database": checks["database"]["status"]})
+    monitor.register("database", database, critical=True)
+    monitor.register("upstream", slow_upstream)
+    monitor.register("assistant", broken_assistant)
+
+    assert json.loads(monitor.body())["status"] == "starting" and not monitor.ready
+    snapshot = asyncio.run(monitor.refresh())
+
+    assert monitor.ready and snapshot["status"] == "degraded"
+    assert snapshot["checks"]["upstream"]["status"] == "timeout"
+    assert snapshot["checks"]["assistant"]["status"] == "error"
+    assert snapshot["checks"]["assistant"]["error"] == "api_error"
+    assert snapshot["checks"]["database"]["pool"] == "ok" and snapshot["database"] == "ok"
+    assert sorted(snapshot["failed_checks"]) == ["assistant", "upstream"]
+    assert json.loads(monitor.body()) == snapshot
+
+
+def test_failing_critical_check_is_not_ready():
+    async def database():
+        raise ConnectionError("database is locked")
+
+    monitor = HealthMonitor()
+    monitor.register("database", database, critical=True)
+    snapshot = asyncio.run(monitor.refresh())
+    assert not monitor.ready and snapshot["status"] == "unhealthy"
+
+
+def test_checks_run_on_their_own_interval_and_reads_are_cached():
+    calls = {"fast": 0, "slow": 0}
+
+    def counting(name):
+        async def check():
+            calls[name] += 1
+            return {}
+        return check
+
+    monitor = HealthMonitor(interval=0.01)
+    monitor.register("fast", counting("fast"))
+    monitor.register("slow", counting("slow"), interval=60)
+
+    async def run():
+        for _ in range(3):
+            await monitor.refresh()
+            await asyncio.sleep(0.02)
+
+    asyncio.run(run())
+    assert calls == {"fast": 3, "slow": 1}
+
+    started = time.perf_counter()
+    for _ in range(10_000):
+        monitor.body()
+    assert (time.perf_counter() - started) / 10_000 < 0.00001
@@ -0,0 +1,145 @@
+"""
+⚙️ Inference Pool
+Runs model predictions in a dedicated process pool so inference scales
+across cores and never blocks the API's event loop.
+
+Workers come from a forkserver (spawn where that is unavailable), never by
+forking the API process itself: by the time the pool starts, the API has
+executor, database and HTTP client threads, and a child forked from a
+multithreaded process can inherit their locks in a held state. Each worker
+loads the artifacts it is told to preload into its own registry and keeps
+hot-swapping retrained ones from there.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from model_registry import ModelRegistry
+
+logger = logging.getLogger(__name__)
+
+# Worker processes; 0 runs predictions inline in the API process
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "2"))
+
+Predictions = Tuple[np.ndarray, np.ndarray]
+
+# Registry used inside worker processes
+_worker_registry: Optional[ModelRegistry] = None
+
+
+def _init_worker(model_dir: str, preload: List[Tuple[str, str]]):
+    global _worker_registry
+    # The API process handles Ctrl+C and shuts the pool down in order
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_registry = ModelRegistry(Path(model_dir))
+    for location, variable in preload:
+        _worker_registry.get(location, variable)
+
+
+def _predict_in_worker(location: str, days: List[date]) -> Predictions:
+    assert _worker_registry is not None
+    return (
+        _worker_registry.predict_days(location, "temperature", days),
+        _worker_registry.predict_days(location, "rain", days),
+    )
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class InferencePool:
+    """Temperature and rain predictions, in worker processes or inline"""
+
+    def __init__(self, model_registry: ModelRegistry, workers: int = INFERENCE_WORKERS):
+        self.model_registry = model_registry
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.calls = 0
+        self.days = 0
+        self.busy_seconds = 0.0
+
+    def start(self, preload: Iterable[Tuple[str, str]] = ()):
+        """
+        Start the workers and wait until each has loaded its models. Safe to
+        call from any thread: workers never fork from the API process.
+
+        Args:
+            preload (Iterable[Tuple[str, str]]): (location, variable) models every worker loads up front
+        """
+        if self.workers <= 0 or self._executor is not None:
+            return
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(str(self.model_registry.model_dir), list(preload)),
+        )
+        try:
+            # Submitting once per worker makes every child start immediately
+            pids = {future.result() for future in [self._executor.submit(_ping) for _ in range(self.workers)]}
+        except Exception:
+            # Predictions fall back to running inline
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            raise
+        logger.info(f"✅ Inference pool started: {len(pids)} worker process(es)")
+
+    async def predict(self, location: str, days: List[date]) -> Predictions:
+        """
+        Predict temperature and rain for many days of one location.
+
+        Args:
+            location (str): Location name from the catalog
+            days (List[date]): Days to forecast
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Temperature and rain predictions
+        """
+        started = time.perf_counter()
+        try:
+            if self._executor is None:
+                # Loading or hot-swapping a model blocks, so keep it off the event loop
+                return await asyncio.to_thread(_predict_inline, self.model_registry, location, days)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, _predict_in_worker, location, days)
+        finally:
+            self.calls += 1
+            self.days += len(days)
+            self.busy_seconds += time.perf_counter() - started
+
+    async def shutdown(self):
+        """Let running predictions finish, then stop the workers"""
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.to_thread(executor.shutdown, wait=True)
+        logger.info("✅ Inference pool stopped")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": "process-pool" if self._executor is not None else "inline",
+            "workers": self.workers if self._executor is not None else 0,
+            "calls": self.calls,
+            "days_predicted": self.days,
+            "avg_call_ms": round(self.busy_seconds / self.calls * 1000, 3) if self.calls else None,
+        }
+
+
+def _predict_inline(model_registry: ModelRegistry, location: str, days: List[date]) -> Predictions:
+    return (
+        model_registry.predict_days(location, "temperature", days),
+        model_registry.predict_days(location, "rain", days),
+    )
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Inference Pool Tests
+Checks that worker processes predict the same values as the API process
+"""
+
+import asyncio
+import sys
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from inference_pool import InferencePool
+from model_registry import ModelRegistry
+
+DAYS = [date(2027, 3, 1) + timedelta(days=i) for i in range(60)]
+
+
+def test_inline_pool_uses_the_registry():
+    pool = InferencePool(ModelRegistry(backend_dir / "model"), workers=0)
+    pool.start()
+    temps, rains = asyncio.run(pool.predict("machakos", DAYS))
+    assert len(temps) == len(rains) == len(DAYS)
+    assert pool.stats()["mode"] == "inline" and pool.stats()["days_predicted"] == len(DAYS)
+
+
+def test_workers_match_inline_predictions():
+    registry = ModelRegistry(backend_dir / "model")
+    expected = asyncio.run(InferencePool(registry, workers=0).predict("machakos", DAYS))
+
+    pool = InferencePool(registry, workers=2)
+    # Started from a thread, as the API's warm-up does
+    thread = threading.Thread(target=pool.start, args=([("machakos", "temperature"), ("machakos", "rain")],))
+    thread.start()
+    thread.join()
+
+    async def run():
+        try:
+            return await asyncio.gather(*[pool.predict("machakos", DAYS) for _ in range(4)])
+        finally:
+            await pool.shutdown()
+
+    for temps, rains in asyncio.run(run()):
+        np.testing.assert_allclose(temps, expected[0])
+        np.testing.assert_allclose(rains, expected[1])
+    assert pool.stats()["mode"] == "inline" and pool.stats()["calls"] == 4
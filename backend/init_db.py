@@ -18,7 +18,7 @@ backend_dir = Path(__file__).resolve().parent
 sys.path.insert(0, str(backend_dir))
 
 try:
-    from database import Base, engine, SessionLocal, User, WeatherData
+    from database import init_db, SessionLocal, User, WeatherData
     logger.info("✅ Database modules imported successfully")
 except ImportError as e:
     logger.error(f"❌ Failed to import database modules: {e}")
@@ -27,8 +27,8 @@ except ImportError as e:
 def init_database():
     """Initialize the database with all tables"""
     try:
-        # Create all tables
-        Base.metadata.create_all(bind=engine)
+        # Create all tables and migrate older ones
+        init_db()
         logger.info("✅ Database tables created successfully!")
         
         # Test database connection
@@ -0,0 +1,158 @@
+"""
+📚 Offline Knowledge Base
+Curated farming answers (knowledge/farming_answers.json) ranked with a
+TF-IDF inverted index. Serves the assistant when the LLM is unavailable
+and answers common questions locally before the LLM is called.
+"""
+
+import json
+import logging
+import math
+import os
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from response_cache import STOPWORDS, normalize
+
+logger = logging.getLogger(__name__)
+
+KNOWLEDGE_BASE_PATH = Path(__file__).resolve().parent / "knowledge" / "farming_answers.json"
+
+# Region used when the question does not name one
+DEFAULT_REGION = "machakos"
+
+# Lowest score for an answer to be used as a fallback, and the score at which
+# it is good enough to answer without calling the LLM
+MIN_MATCH_SCORE = 0.1
+KNOWLEDGE_BASE_DIRECT_SCORE = float(os.getenv("KNOWLEDGE_BASE_DIRECT_SCORE", "0.35"))
+
+# Score multiplier for answers written for a different use case
+OTHER_USE_CASE_PENALTY = 0.8
+
+# Weight of each entry field in the index
+FIELD_WEIGHTS = {"title": 1.0, "questions": 1.0, "keywords": 2.0, "answer": 0.25}
+
+DEFAULT_ENTRY_ID = "default"
+
+
+def stem(word: str) -> str:
+    """Strip common English suffixes so "crops"/"crop" and "planting"/"plant" match"""
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    return [stem(w) for w in normalize(text).split() if w not in STOPWORDS]
+
+
+@dataclass
+class KnowledgeMatch:
+    entry_id: str
+    answer: str
+    score: float
+
+
+class KnowledgeBase:
+    """In-memory TF-IDF index over curated answers"""
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = [e for e in entries if e["id"] != DEFAULT_ENTRY_ID]
+        default = next((e for e in entries if e["id"] == DEFAULT_ENTRY_ID), None)
+        self.default_answer = default["answer"] if default else "❌ No offline answer available."
+        self.regions = {region for e in self.entries for region in e.get("regions", [])}
+
+        term_counts = [self._weighted_terms(e) for e in self.entries]
+        document_frequency = Counter(term for counts in term_counts for term in counts)
+        n = len(self.entries)
+        self.idf = {term: math.log(1 + n / df) for term, df in document_frequency.items()}
+
+        # term -> [(entry index, normalized tf-idf weight)]
+        self.postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        for i, counts in enumerate(term_counts):
+            weights = {term: math.log1p(count) * self.idf[term] for term, count in counts.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for term, weight in weights.items():
+                self.postings[term].append((i, weight / norm))
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = KNOWLEDGE_BASE_PATH) -> "KnowledgeBase":
+        with open(path, encoding="utf-8") as f:
+            knowledge_base = cls(json.load(f))
+        logger.info(f"✅ Knowledge base loaded: {len(knowledge_base.entries)} answers, {len(knowledge_base.postings)} terms")
+        return knowledge_base
+
+    @staticmethod
+    def _weighted_terms(entry: Dict[str, Any]) -> Dict[str, float]:
+        counts: Dict[str, float] = defaultdict(float)
+        fields = {
+            "title": [entry.get("title", "")],
+            "questions": entry.get("questions", []),
+            "keywords": entry.get("keywords", []),
+            "answer": [entry.get("answer", "")],
+        }
+        for field, texts in fields.items():
+            for text in texts:
+                for term in tokenize(text):
+                    counts[term] += FIELD_WEIGHTS[field]
+        return counts
+
+    def _region(self, terms: List[str], region: Optional[str]) -> str:
+        if region:
+            return region.lower()
+        return next((term for term in terms if term in self.regions), DEFAULT_REGION)
+
+    def search(self, question: str, use_case: str, region: Optional[str] = None, limit: int = 3) -> List[KnowledgeMatch]:
+        """
+        Rank answers for a question by cosine similarity.
+
+        Answers written for another region are excluded; answers for another
+        use case are ranked lower.
+
+        Args:
+            question (str): The user's question
+            use_case (str): Assistant use case
+            region (Optional[str]): Location, otherwise taken from the question
+            limit (int): Maximum number of matches
+
+        Returns:
+            List[KnowledgeMatch]: Best matches first
+        """
+        terms = tokenize(question)
+        region = self._region(terms, region)
+        query = {term: self.idf[term] for term in set(terms) if term in self.idf}
+        norm = math.sqrt(sum(w * w for w in query.values()))
+        if not norm:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        for term, weight in query.items():
+            for i, doc_weight in self.postings[term]:
+                scores[i] += weight / norm * doc_weight
+
+        matches = []
+        for i, score in scores.items():
+            entry = self.entries[i]
+            if entry.get("regions") and region not in entry["regions"]:
+                continue
+            if entry.get("use_cases") and use_case not in entry["use_cases"]:
+                score *= OTHER_USE_CASE_PENALTY
+            matches.append(KnowledgeMatch(entry["id"], entry["answer"], round(score, 4)))
+        matches.sort(key=lambda m: m.score, reverse=True)
+        return matches[:limit]
+
+    def best(self, question: str, use_case: str, region: Optional[str] = None, min_score: float = MIN_MATCH_SCORE) -> Optional[KnowledgeMatch]:
+        matches = self.search(question, use_case, region, limit=1)
+        if matches and matches[0].score >= min_score:
+            return matches[0]
+        return None
+
+    def answer(self, question: str, use_case: str, region: Optional[str] = None) -> str:
+        """Best matching answer, or the general demo answer if nothing matches"""
+        match = self.best(question, use_case, region)
+        if match is not None:
+            return match.answer
+        return self.default_answer.replace("{prompt}", question).replace("{use_case}", use_case)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Knowledge Base Tests
+Checks ranking, region filtering, the demo fallback and lookup speed
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from knowledge_base import KnowledgeBase
+
+kb = KnowledgeBase.load()
+
+
+def test_ranks_the_matching_answer_first():
+    cases = {
+        "My maize has fall armyworm, what do I do?": "machakos-pests",
+        "How do I make compost?": "organic-compost",
+        "How to store grain without weevils": "harvest-storage",
+        "Our farm is flooded": "flood",
+    }
+    for question, expected in cases.items():
+        assert kb.search(question, "Smart Farming Advice")[0].entry_id == expected
+
+
+def test_region_is_taken_from_the_question():
+    assert kb.best("What should I plant in Vhembe?", "Crop Management").entry_id == "vhembe-crops"
+    assert kb.best("What crops should I grow?", "Crop Management").entry_id == "machakos-crops"
+    assert kb.best("What crops should I grow?", "Crop Management", region="vhembe").entry_id == "vhembe-crops"
+
+
+def test_unknown_questions_get_the_demo_answer():
+    answer = kb.answer("Tell me a joke", "Crop Management")
+    assert "Demo Mode" in answer
+    assert "**Your Question:** Tell me a joke" in answer
+    assert "**Use Case:** Crop Management" in answer
+
+
+def test_lookup_is_sub_millisecond():
+    started = time.perf_counter()
+    for _ in range(1000):
+        kb.search("when will the rains start in machakos", "Weather-Based Farming")
+    assert (time.perf_counter() - started) / 1000 < 0.001
+
+
+def test_vhembe_soil_and_pest_questions_get_vhembe_answers():
+    assert kb.best("How do I improve the soil in Vhembe?", "Crop Management").entry_id == "vhembe-soil"
+    assert kb.best("Which fertilizer for my maize?", "Smart Farming Advice", region="vhembe").entry_id == "vhembe-soil"
+    assert kb.best("Fruit flies are in my mangoes in Vhembe", "Crop Management").entry_id == "vhembe-pests"
+    assert kb.best("My maize has fall armyworm", "Crop Management", region="vhembe").entry_id == "vhembe-pests"
+
+
+def test_every_region_has_answers_for_every_use_case():
+    use_cases = {
+        "Smart Farming Advice", "Weather-Based Farming", "Crop Management",
+        "Sustainable Agriculture", "Emergency Weather Response",
+    }
+    for region in kb.regions:
+        covered = {use_case for e in kb.entries if region in e.get("regions", []) for use_case in e["use_cases"]}
+        assert covered == use_cases, region
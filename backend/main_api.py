@@ -1,11 +1,29 @@
-from fastapi import FastAPI, HTTPException, Depends
-from sqlalchemy.orm import Session
-from database import SessionLocal, WeatherData, User
+# Imported first so the startup timings cover the whole module import
+from startup import StartupTracker
+from fastapi import FastAPI, HTTPException, Depends, Header, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import async_engine, AsyncSessionLocal, init_db, SessionLocal
+from open_meteo import OpenMeteoClient
+from weather_cache import WeatherCache
+from forecast_table import DEFAULT_REFRESH_SECONDS as FORECAST_REFRESH_SECONDS
+from model_registry import ModelRegistry
+from inference_pool import InferencePool
+from forecast_store import FORECAST_STORE_LIVE_TTL_SECONDS, ForecastStore, upsert_weather_rows
+from weather_ingest import BULK_INGEST_MAX_BYTES, ingest
+from user_service import PhoneAlreadyRegistered, SessionKeyError, SessionTokenError, UserService
+from user_onboarding import COUNTRY_CALLING_CODES, ONBOARDING_DEFAULT_COUNTRY_CODE, onboard_bytes
+from health_monitor import HealthMonitor
+from prediction_batcher import PredictionBatcher
+from weather_context import WeatherContextBuilder
 from pydantic import BaseModel
-import pandas as pd
-import pickle
+from typing import Any, AsyncIterator, Dict, List, Optional
 import os
-import requests
+import importlib
+import json
+import asyncio
 from datetime import datetime, timedelta
 import logging
 
@@ -28,15 +46,30 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 assistant_path = Path(__file__).resolve().parents[1] / "models" / "AI-Farming-Assistant-App"
 sys.path.append(str(assistant_path))
 
-# Import AI assistant functions
-try:
-    from assistant_core import generate_response, get_available_use_cases, test_connectivity
+# AI assistant functions, set by load_assistant() during warm-up
+generate_response = None
+get_available_use_cases = None
+AssistantBusyError = None
+assistant_engine = None
+assistant_monitor = None
+
+def load_assistant():
+    """Import the AI assistant (Groq SDK and knowledge base) and build its engine"""
+    global generate_response, get_available_use_cases, AssistantBusyError, assistant_engine, assistant_monitor
+    try:
+        from assistant_core import generate_response as _generate_response, get_available_use_cases as _use_cases
+        from assistant_engine import AssistantBusyError as _busy_error, AssistantEngine
+        from response_cache import ResponseCache
+        from assistant_monitor import ConnectivityMonitor
+    except ImportError as e:
+        logger.error(f"❌ Could not import AI Assistant from {assistant_path}: {e}")
+        raise
+    engine = AssistantEngine(cache=ResponseCache())
+    engine.weather_context = WeatherContextBuilder(open_meteo, model_registry)
+    generate_response, get_available_use_cases, AssistantBusyError = _generate_response, _use_cases, _busy_error
+    assistant_monitor = ConnectivityMonitor(engine)
+    assistant_engine = engine
     logger.info(f"✅ AI Assistant imported successfully from {assistant_path}")
-except ImportError as e:
-    logger.error(f"❌ Could not import AI Assistant from {assistant_path}: {e}")
-    generate_response = None
-    get_available_use_cases = None
-    test_connectivity = None
 
 # ✅ Main ANGA app
 app = FastAPI(
@@ -45,65 +78,120 @@ app = FastAPI(
     version="2.0.0"
 )
 
-# Add startup validation
+# ⏱️ Heavy setup runs after the port is bound; /ready opens when it is done
+startup_tracker = StartupTracker()
+
 @app.on_event("startup")
 async def startup_event():
-    """Validate environment and database on startup"""
+    """Log the endpoints and start the warm-up without holding back the port"""
     logger.info("🚀 Starting ANGA Unified API v2.0.0")
     logger.info("📋 Available endpoints:")
     logger.info("   • /assistant/ask - AI Farming Assistant")
+    logger.info("   • /assistant/ask/stream - Streaming AI Farming Assistant")
     logger.info("   • /predict/ - Weather Predictions")
+    logger.info("   • /predict/range - Date-Range Weather Predictions")
     logger.info("   • /live_weather/ - Live Weather Data")
+    logger.info("   • /weather_data/bulk - Bulk Weather Data Ingestion")
     logger.info("   • /users/ - User Management")
-    logger.info("   • /health - Health Check")
+    logger.info("   • /users/me - Current User (session token)")
+    logger.info("   • /users/bulk - Bulk Member Onboarding (CSV)")
+    logger.info("   • /health - Health Check (liveness)")
+    logger.info("   • /ready - Readiness Check")
     logger.info("   • /env/status - Environment Status")
-    
-    # Environment validation
+
+    # Models, database, assistant and validation load in the background; /ready answers 503 until then
+    asyncio.create_task(warm_up())
+    logger.info("✅ Unified API is listening, warming up")
+
+def validate_environment():
+    """Validate the environment and log the errors and warnings"""
     try:
         from env_validator import EnvironmentValidator
-        validator = EnvironmentValidator()
-        results = validator.validate_all()
-        
-        if not results['valid']:
-            logger.error("❌ Environment validation failed!")
-            logger.error("Errors found:")
-            errors = results['errors']
-            if isinstance(errors, (list, tuple, set)):
-                for error in errors:
-                    logger.error(f"   • {error}")
-            else:
-                logger.error(f"   • {errors}")
-        else:
-            logger.info("✅ Environment validation passed!")
-            warnings = results.get('warnings')
-            if isinstance(warnings, (list, tuple, set)) and warnings:
-                logger.warning("⚠️ Warnings found:")
-                for warning in warnings:
-                    logger.warning(f"   • {warning}")
-            elif warnings:
-                logger.warning("⚠️ Warnings found:")
-                logger.warning(f"   • {warnings}")
     except ImportError:
         logger.warning("⚠️ Environment validator not available")
-    except Exception as e:
-        logger.error(f"❌ Error during startup validation: {e}")
-    
+        return
+    validator = EnvironmentValidator()
+    results = validator.validate_all()
+
+    if not results['valid']:
+        logger.error("❌ Environment validation failed!")
+        logger.error("Errors found:")
+        errors = results['errors']
+        if isinstance(errors, (list, tuple, set)):
+            for error in errors:
+                logger.error(f"   • {error}")
+        else:
+            logger.error(f"   • {errors}")
+    else:
+        logger.info("✅ Environment validation passed!")
+        warnings = results.get('warnings')
+        if isinstance(warnings, (list, tuple, set)) and warnings:
+            logger.warning("⚠️ Warnings found:")
+            for warning in warnings:
+                logger.warning(f"   • {warning}")
+        elif warnings:
+            logger.warning("⚠️ Warnings found:")
+            logger.warning(f"   • {warnings}")
+
+async def init_database():
+    """Create missing tables and migrate older ones, then test the connection"""
+    async with async_engine.begin() as conn:
+        await conn.run_sync(init_db)
+        await conn.execute(text("SELECT 1"))
+    logger.info("✅ Database: Connected and ready")
+
+def start_inference_pool():
+    """Start the inference workers with the default location's models preloaded"""
+    try:
+        inference_pool.start(preload=[(DEFAULT_LOCATION, "temperature"), (DEFAULT_LOCATION, "rain")])
+    except Exception:
+        logger.error("❌ Inference pool failed to start, predicting inline")
+        raise
+
+async def warm_up():
+    """Run the startup phases, timing each, then open the readiness gate"""
+    # Independent phases run side by side; failures are recorded and reported by /health
+    await asyncio.gather(
+        startup_tracker.phase("assistant", load_assistant),
+        startup_tracker.phase("pandas", importlib.import_module, "pandas"),
+        startup_tracker.phase("model_load", load_default_models),
+        startup_tracker.phase("database", init_database),
+        startup_tracker.phase("validator", validate_environment),
+        # Workers come from a forkserver and load their own models, so this can run alongside
+        startup_tracker.phase("inference_pool", start_inference_pool),
+        return_exceptions=True,
+    )
+
     # Log AI assistant status
     if generate_response:
         logger.info("🤖 AI Assistant: Available")
     else:
         logger.warning("⚠️ AI Assistant: Not available")
-    
-    # Test database connection
-    try:
-        with SessionLocal() as db:
-            from sqlalchemy import text
-            db.execute(text("SELECT 1"))
-            logger.info("✅ Database: Connected and ready")
-    except Exception as e:
-        logger.error(f"❌ Database connection failed: {e}")
-    
-    logger.info("✅ Unified API is ready!")
+
+    # Keep the loaded models and their forecast tables in sync with the model files
+    asyncio.create_task(refresh_forecast_tables())
+
+    # Write new predictions to weather_data in batches
+    asyncio.create_task(forecast_store.run())
+
+    # Probe the LLM provider in the background for /assistant/status
+    if assistant_monitor:
+        asyncio.create_task(assistant_monitor.run())
+
+    # Run the component checks in the background for /health and /ready
+    startup_tracker.finish()
+    await health_monitor.refresh()
+    asyncio.create_task(health_monitor.run())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled upstream and database connections and stop the inference workers"""
+    await inference_pool.shutdown()
+    await forecast_store.close()
+    await open_meteo.close()
+    if assistant_engine:
+        await assistant_engine.close()
+    await async_engine.dispose()
 
 # 🌐 Enable CORS (important for mobile/Flutter access)
 from fastapi.middleware.cors import CORSMiddleware
@@ -120,19 +208,36 @@ app.add_middleware(
 class Question(BaseModel):
     query: str
     use_case: str = "Smart Farming Advice"
+    location: Optional[str] = None
+
+def question_location(data: Question) -> Optional[str]:
+    """Validated, lowercased location of a question"""
+    if data.location is None:
+        return None
+    location = data.location.lower()
+    if location not in SUPPORTED_LOCATIONS:
+        raise HTTPException(status_code=400, detail="Unsupported location.")
+    return location
 
 @app.post("/assistant/ask")
-def ask_ai_farming_assistant(data: Question):
+async def ask_ai_farming_assistant(data: Question):
     """AI Farming Assistant endpoint"""
-    if not generate_response:
+    if not assistant_engine:
         raise HTTPException(
             status_code=503, 
             detail="AI Assistant is not available. Please check the configuration."
         )
+    location = question_location(data)
     
     try:
-        answer = generate_response(data.query, data.use_case)
+        answer = await assistant_engine.generate(data.query, data.use_case, location)
         return {"answer": answer}
+    except AssistantBusyError as e:
+        return JSONResponse(
+            status_code=429,
+            content={"detail": str(e)},
+            headers={"Retry-After": str(e.retry_after)}
+        )
     except Exception as e:
         logger.error(f"AI Assistant error: {e}")
         raise HTTPException(
@@ -140,6 +245,42 @@ def ask_ai_farming_assistant(data: Question):
             detail=f"AI Assistant error: {str(e)}"
         )
 
+@app.post("/assistant/ask/stream")
+async def ask_ai_farming_assistant_stream(data: Question):
+    """
+    Streaming AI Farming Assistant endpoint.
+
+    Returns newline-delimited JSON events as the answer is generated:
+    {"type": "token"}, optionally {"type": "replace"} and a final {"type": "done"}
+    with time-to-first-token and total latency.
+    """
+    if not assistant_engine:
+        raise HTTPException(
+            status_code=503, 
+            detail="AI Assistant is not available. Please check the configuration."
+        )
+
+    location = question_location(data)
+
+    try:
+        events = await assistant_engine.stream(data.query, data.use_case, location)
+    except AssistantBusyError as e:
+        return JSONResponse(
+            status_code=429,
+            content={"detail": str(e)},
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+    async def ndjson() -> AsyncIterator[str]:
+        try:
+            async for event in events:
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        finally:
+            await events.aclose()
+
+    # The background task gives the completion slot back if the body never started
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson", background=BackgroundTask(events.aclose))
+
 @app.get("/assistant/use-cases")
 def get_ai_use_cases():
     """Get available AI assistant use cases"""
@@ -161,8 +302,8 @@ def get_ai_use_cases():
 
 @app.get("/assistant/status")
 def get_ai_status():
-    """Get AI assistant status and configuration"""
-    if not test_connectivity:
+    """Get AI assistant status and configuration from the background probes"""
+    if not assistant_monitor:
         return {
             "status": "not_available",
             "message": "AI Assistant module not loaded",
@@ -170,41 +311,71 @@ def get_ai_status():
         }
     
     try:
-        status = test_connectivity()
+        status = assistant_monitor.status()
+        status["engine"] = assistant_engine.stats()
         return status
     except Exception as e:
-        logger.error(f"Error testing AI connectivity: {e}")
+        logger.error(f"Error reading AI status: {e}")
         return {
             "status": "error",
-            "message": f"Error testing connectivity: {str(e)}",
+            "message": f"Error reading status: {str(e)}",
             "api_key_configured": bool(GROQ_API_KEY)
         }
 
 # 🔁 Database helper
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
-
-# ✅ Supported locations
-SUPPORTED_LOCATIONS = {
-    "machakos": {"lat": -1.5167, "lon": 37.2667},
-    "vhembe": {"lat": -22.9781, "lon": 30.4516}
-}
 
-# 📦 Load ML models
+# 📦 Model registry: per-location models, loaded on first use
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-try:
-    with open(os.path.join(BASE_DIR, "model/temp_model.pkl"), "rb") as f:
-        temp_model = pickle.load(f)
-    with open(os.path.join(BASE_DIR, "model/rain_model.pkl"), "rb") as f:
-        rain_model = pickle.load(f)
-    logger.info("✅ ML models loaded successfully")
-except FileNotFoundError as e:
-    logger.error(f"❌ Model files not found: {e}")
-    raise RuntimeError("Model files not found!")
+model_registry = ModelRegistry(os.path.join(BASE_DIR, "model"))
+
+# ✅ Supported locations (model/locations.json)
+SUPPORTED_LOCATIONS = model_registry.locations
+DEFAULT_LOCATION = "machakos"
+
+def load_default_models():
+    """Load the default location's models during warm-up; missing artifacts keep /ready at 503"""
+    try:
+        model_registry.get(DEFAULT_LOCATION, "temperature")
+        model_registry.get(DEFAULT_LOCATION, "rain")
+        logger.info(f"✅ ML models loaded successfully ({len(SUPPORTED_LOCATIONS)} locations available)")
+    except FileNotFoundError as e:
+        logger.error(f"❌ Model files not found: {e}")
+        logger.error("   Export them from the pickles with: python model_artifacts.py")
+        raise RuntimeError("Model files not found!")
+
+# Far-horizon inference runs in worker processes forked at startup
+inference_pool = InferencePool(model_registry)
+
+# Concurrent far-horizon /predict/ requests share one vectorized predict
+prediction_batcher = PredictionBatcher(inference_pool)
+
+# /predict/ results are served from and written behind to weather_data
+forecast_store = ForecastStore()
+
+async def refresh_forecast_tables():
+    """Hot-swap retrained artifacts and roll the forecast tables forward"""
+    while True:
+        # /predict/ reads the loaded tables directly, so check for new artifacts as often as get() would
+        await asyncio.sleep(min(FORECAST_REFRESH_SECONDS, model_registry.check_interval))
+        try:
+            await asyncio.to_thread(model_registry.refresh)
+        except Exception as e:
+            logger.error(f"❌ Forecast table refresh failed: {e}")
+
+# 🌍 Shared Open-Meteo client (pooled keep-alive connections, cached daily values)
+weather_cache = WeatherCache()
+open_meteo = OpenMeteoClient(cache=weather_cache)
+
+def parse_date(value: str):
+    """Parse a request date; ISO dates skip pandas, which is imported only for other formats"""
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        import pandas as pd
+        return pd.to_datetime(value).date()
 
 # 📍 Prediction endpoint
 class PredictionRequest(BaseModel):
@@ -218,7 +389,7 @@ async def predict_weather(request: PredictionRequest):
         raise HTTPException(status_code=400, detail="Unsupported location.")
 
     try:
-        date = pd.to_datetime(request.date).date()
+        date = parse_date(request.date)
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
 
@@ -226,131 +397,386 @@ async def predict_weather(request: PredictionRequest):
     delta_days = (date - today).days
 
     if delta_days <= 16:
-        coords = SUPPORTED_LOCATIONS[location]
-        url = (
-            f"https://api.open-meteo.com/v1/forecast?"
-            f"latitude={coords['lat']}&longitude={coords['lon']}"
-            f"&daily=temperature_2m_max,precipitation_sum"
-            f"&start_date={date}&end_date={date}"
-            "&timezone=Africa%2FNairobi"
-        )
-
-        try:
-            res = requests.get(url)
-            res.raise_for_status()
-            data = res.json()
-            return {
-                "source": "open-meteo",
-                "date": str(date),
-                "location": location.title(),
-                "temperature_prediction": data["daily"]["temperature_2m_max"][0],
-                "rain_prediction": data["daily"]["precipitation_sum"][0]
-            }
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Open-Meteo failed: {str(e)}")
+        stored = await forecast_store.get(location, date, "open-meteo", max_age=FORECAST_STORE_LIVE_TTL_SECONDS)
+        if stored is not None:
+            temp_prediction, rain_prediction = stored
+        else:
+            coords = SUPPORTED_LOCATIONS[location]
+            try:
+                daily = await open_meteo.fetch_daily(coords["lat"], coords["lon"], date, date)
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Open-Meteo failed: {str(e)}")
+            temp_prediction = daily["temperature_2m_max"][0]
+            rain_prediction = daily["precipitation_sum"][0]
+            if temp_prediction is not None and rain_prediction is not None:
+                forecast_store.put(location, date, "open-meteo", "", temp_prediction, rain_prediction)
+        return {
+            "source": "open-meteo",
+            "date": str(date),
+            "location": location.title(),
+            "temperature_prediction": temp_prediction,
+            "rain_prediction": rain_prediction
+        }
     else:
-        future_df = pd.DataFrame({'ds': [date]})
-        temp_prediction = temp_model.predict(future_df).iloc[0]["yhat"]
-        rain_prediction = rain_model.predict(future_df).iloc[0]["yhat"]
+        # Days inside the loaded forecast tables are an in-memory lookup
+        tabled = model_registry.loaded_forecast(location, date)
+        if tabled is not None:
+            temp_prediction, rain_prediction = tabled
+        else:
+            # Beyond the tables each day is a model evaluation; stored ones stay valid until retraining
+            model_version = await asyncio.to_thread(model_registry.version, location)
+            stored = await forecast_store.get(location, date, "ml-model", model_version)
+            if stored is not None:
+                temp_prediction, rain_prediction = stored
+            else:
+                temp_prediction, rain_prediction = await prediction_batcher.predict(location, date)
+                forecast_store.put(location, date, "ml-model", model_version, float(temp_prediction), float(rain_prediction))
 
         return {
             "source": "ml-model",
             "date": str(date),
             "location": location.title(),
-            "temperature_prediction": round(temp_prediction, 2),
-            "rain_prediction": round(rain_prediction, 2)
+            "temperature_prediction": round(float(temp_prediction), 2),
+            "rain_prediction": round(float(rain_prediction), 2)
         }
 
+# 📆 Date-range prediction endpoint
+MAX_RANGE_DAYS = 366
+
+class RangePredictionRequest(BaseModel):
+    start_date: str
+    end_date: str
+    locations: List[str] = ["machakos"]
+
+@app.post("/predict/range")
+async def predict_weather_range(request: RangePredictionRequest):
+    """Forecast every day in [start_date, end_date] for one or more locations"""
+    locations = [loc.lower() for loc in request.locations]
+    unsupported = [loc for loc in locations if loc not in SUPPORTED_LOCATIONS]
+    if not locations or unsupported:
+        raise HTTPException(status_code=400, detail=f"Unsupported location(s): {', '.join(unsupported) or 'none given'}")
+
+    try:
+        start = parse_date(request.start_date)
+        end = parse_date(request.end_date)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
+    if start > end:
+        raise HTTPException(status_code=400, detail="start_date must not be after end_date.")
+    if (end - start).days + 1 > MAX_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"Max range is {MAX_RANGE_DAYS} days.")
+
+    # Split at the Open-Meteo horizon: one upstream request per location for
+    # the near part, one vectorized model lookup per distinct model for the far part
+    near_end = min(end, datetime.now().date() + timedelta(days=16))
+    far_start = max(start, near_end + timedelta(days=1))
+    far_days = [far_start + timedelta(days=i) for i in range((end - far_start).days + 1)]
+
+    # Locations without their own artifacts share the default models
+    far_by_models: Dict[Any, List[Dict[str, Any]]] = {}
+
+    async def far_forecasts(location: str) -> List[Dict[str, Any]]:
+        if not far_days:
+            return []
+        models = (model_registry.resolve(location, "temperature"), model_registry.resolve(location, "rain"))
+        if models not in far_by_models:
+            temp_predictions, rain_predictions = await inference_pool.predict(location, far_days)
+            far_by_models[models] = [
+                {
+                    "source": "ml-model",
+                    "date": str(day),
+                    "temperature_prediction": round(float(temp), 2),
+                    "rain_prediction": round(float(rain), 2)
+                }
+                for day, temp, rain in zip(far_days, temp_predictions, rain_predictions)
+            ]
+        return far_by_models[models]
+
+    async def near_forecasts(location: str) -> List[Dict[str, Any]]:
+        if start > near_end:
+            return []
+        coords = SUPPORTED_LOCATIONS[location]
+        daily = await open_meteo.fetch_daily(coords["lat"], coords["lon"], start, near_end)
+        return [
+            {
+                "source": "open-meteo",
+                "date": day,
+                "temperature_prediction": temp,
+                "rain_prediction": rain
+            }
+            for day, temp, rain in zip(daily["time"], daily["temperature_2m_max"], daily["precipitation_sum"])
+        ]
+
+    try:
+        near = await asyncio.gather(*[near_forecasts(loc) for loc in locations])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Open-Meteo failed: {str(e)}")
+    far = [await far_forecasts(loc) for loc in locations]
+
+    return {
+        "start_date": str(start),
+        "end_date": str(end),
+        "locations": [
+            {"location": loc.title(), "forecasts": near_days + far_days_forecasts}
+            for loc, near_days, far_days_forecasts in zip(locations, near, far)
+        ]
+    }
+
 @app.post("/save_prediction/")
-def save_prediction(date: str, location: str, temperature: float, rain: float, db: Session = Depends(get_db)):
-    new_weather = WeatherData(date=date, location=location, temperature=temperature, rain=rain)
-    db.add(new_weather)
-    db.commit()
+async def save_prediction(date: str, location: str, temperature: float, rain: float, db: AsyncSession = Depends(get_db)):
+    try:
+        day = parse_date(date)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
+    # Saving the same location and date again replaces the earlier values
+    await db.run_sync(upsert_weather_rows, [{
+        "location": location.lower(), "date": day, "source": "manual", "model_version": "",
+        "temperature": temperature, "rain": rain
+    }])
+    await db.commit()
     return {"message": "Prediction saved successfully"}
 
+# 📥 Bulk ingestion: JSON array, NDJSON or CSV (DATE,temperature,rain)
+INGEST_SOURCES = ("manual", "observation")
+
+@app.post("/weather_data/bulk")
+async def bulk_ingest_weather_data(request: Request, location: Optional[str] = None, source: str = "manual"):
+    if source not in INGEST_SOURCES:
+        raise HTTPException(status_code=400, detail=f"source must be one of: {', '.join(INGEST_SOURCES)}")
+    if location is not None and location.lower() not in SUPPORTED_LOCATIONS:
+        raise HTTPException(status_code=400, detail="Unsupported location.")
+
+    body = await request.body()
+    if len(body) > BULK_INGEST_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"Upload exceeds {BULK_INGEST_MAX_BYTES} bytes.")
+
+    content_type = request.headers.get("content-type", "application/json")
+    try:
+        report = await asyncio.to_thread(
+            ingest, body, content_type, SessionLocal, SUPPORTED_LOCATIONS.keys(), location, source
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ Bulk ingestion failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Bulk ingestion failed: {str(e)}")
+    return report.to_dict()
+
+# 👤 Users: single-statement signup, cached logins and signed session tokens
+# Local numbers (0712...) are read with the calling code of the user's location
+LOCATION_CALLING_CODES = {
+    name: COUNTRY_CALLING_CODES.get(coords.get("country", ""), ONBOARDING_DEFAULT_COUNTRY_CODE)
+    for name, coords in SUPPORTED_LOCATIONS.items()
+}
+user_service = UserService(country_codes=[ONBOARDING_DEFAULT_COUNTRY_CODE, *LOCATION_CALLING_CODES.values()])
+
+def current_user(authorization: Optional[str] = Header(None)) -> Dict[str, Any]:
+    """Verify the Bearer session token from /login/ without a database lookup"""
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(status_code=401, detail="Missing session token", headers={"WWW-Authenticate": "Bearer"})
+    try:
+        return user_service.verify_token(token)
+    except SessionTokenError as e:
+        raise HTTPException(status_code=401, detail=str(e), headers={"WWW-Authenticate": "Bearer"})
+
+def cooperative_admin(claims: Dict[str, Any] = Depends(current_user)) -> Dict[str, Any]:
+    """Allow only members listed in COOPERATIVE_ADMIN_PHONES"""
+    if not user_service.is_admin(claims):
+        raise HTTPException(status_code=403, detail="Cooperative admin access required")
+    return claims
+
 class UserCreate(BaseModel):
     name: str
     phone_number: str
     password: str
+    location: Optional[str] = None
 
 @app.post("/users/")
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
-    if db.query(User).filter(User.phone_number == user.phone_number).first():
+async def create_user(user: UserCreate):
+    try:
+        country_code = None
+        if user.location is not None:
+            if user.location.lower() not in LOCATION_CALLING_CODES:
+                raise HTTPException(status_code=400, detail="Unsupported location.")
+            country_code = LOCATION_CALLING_CODES[user.location.lower()]
+        user_id = await user_service.register(user.name, user.phone_number, user.password, country_code)
+    except PhoneAlreadyRegistered:
         raise HTTPException(status_code=400, detail="Phone number already registered")
-
-    new_user = User(name=user.name, phone_number=user.phone_number, password=user.password)
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    return {"message": "User created successfully", "user_id": new_user.id}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"message": "User created successfully", "user_id": user_id}
+
+# 🧑‍🌾 Cooperative onboarding: CSV of name,phone_number[,password]
+@app.post("/users/bulk")
+async def bulk_onboard_users(
+    request: Request,
+    country_code: str = ONBOARDING_DEFAULT_COUNTRY_CODE,
+    claims: Dict[str, Any] = Depends(cooperative_admin)
+):
+    if not country_code.isdigit():
+        raise HTTPException(status_code=400, detail="country_code must be digits, e.g. 254")
+    body = await request.body()
+    if len(body) > BULK_INGEST_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"Upload exceeds {BULK_INGEST_MAX_BYTES} bytes.")
+    try:
+        report = await asyncio.to_thread(onboard_bytes, body, SessionLocal, country_code=country_code)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ Bulk onboarding failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Bulk onboarding failed: {str(e)}")
+    user_service.invalidate(report.created_phones)
+    logger.info(f"🧑‍🌾 Bulk onboarding by user {claims['sub']}: {report.created} created")
+    return report.to_dict()
 
 class LoginRequest(BaseModel):
     phone_number: str
     password: str
 
 @app.post("/login/")
-def login_user(request: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.phone_number == request.phone_number).first()
-    if user is None or getattr(user, "password", None) != request.password:
+async def login_user(request: LoginRequest):
+    user = await user_service.authenticate(request.phone_number, request.password)
+    if user is None:
         raise HTTPException(status_code=401, detail="Invalid phone number or password")
-    return {"message": "Login successful", "user_id": user.id}
+    try:
+        token = user_service.issue_token(user)
+    except SessionKeyError as e:
+        raise HTTPException(status_code=503, detail=f"Logins are disabled: {e}")
+    return {
+        "message": "Login successful",
+        "user_id": user.id,
+        "access_token": token,
+        "token_type": "bearer",
+        "expires_in": user_service.token_ttl_seconds
+    }
+
+@app.get("/users/me")
+async def read_current_user(claims: Dict[str, Any] = Depends(current_user)):
+    return {
+        "user_id": claims["sub"],
+        "phone_number": claims["phone"],
+        "expires_at": datetime.fromtimestamp(claims["exp"]).isoformat()
+    }
 
 @app.get("/live_weather/")
-def get_live_weather(location: str = "machakos"):
+async def get_live_weather(location: str = "machakos"):
     loc = location.lower()
     if loc not in SUPPORTED_LOCATIONS:
-        return {"error": "Only 'machakos' and 'vhembe' are supported."}
+        return {"error": f"Unsupported location. Supported: {', '.join(SUPPORTED_LOCATIONS)}"}
 
     coords = SUPPORTED_LOCATIONS[loc]
-    today = datetime.now().strftime('%Y-%m-%d')
-
-    url = (
-        f"https://api.open-meteo.com/v1/forecast?"
-        f"latitude={coords['lat']}&longitude={coords['lon']}"
-        f"&daily=temperature_2m_max,precipitation_sum"
-        f"&start_date={today}&end_date={today}"
-        "&timezone=Africa%2FNairobi"
-    )
+    today = datetime.now().date()
 
     try:
-        res = requests.get(url)
-        res.raise_for_status()
-        data = res.json()
+        daily = await open_meteo.fetch_daily(coords["lat"], coords["lon"], today, today)
 
         return {
             "location": loc.title(),
-            "date": data["daily"]["time"][0],
-            "temperature_max": data["daily"]["temperature_2m_max"][0],
-            "rain_sum": data["daily"]["precipitation_sum"][0]
+            "date": daily["time"][0],
+            "temperature_max": daily["temperature_2m_max"][0],
+            "rain_sum": daily["precipitation_sum"][0]
         }
     except Exception as e:
         return {"error": "Failed to fetch live weather", "details": str(e)}
 
-# Health check endpoint
-@app.get("/health")
-def health_check():
-    """Health check endpoint"""
-    # Test database connection
-    db_status = "unknown"
-    try:
-        with SessionLocal() as db:
-            # Test a simple query
-            from sqlalchemy import text
-            db.execute(text("SELECT 1"))
-            db_status = "healthy"
-    except Exception as e:
-        db_status = f"error: {str(e)}"
-    
+# 🩺 Health: component checks run in the background, /health and /ready serve the snapshot
+async def check_database() -> Dict[str, Any]:
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return {"pool": async_engine.pool.status()}
+
+async def check_open_meteo() -> Dict[str, Any]:
+    coords = SUPPORTED_LOCATIONS[DEFAULT_LOCATION]
+    return await open_meteo.ping(coords["lat"], coords["lon"])
+
+async def check_assistant() -> Dict[str, Any]:
+    if assistant_monitor is None:
+        raise RuntimeError("AI Assistant not available")
+    status = assistant_monitor.status()
+    if status["status"] == "api_error":
+        raise RuntimeError(status["message"])
+    return {"state": status["status"], "success_rate": status["connectivity"]["success_rate"]}
+
+async def check_models() -> Dict[str, Any]:
+    stats = model_registry.stats()
+    if not stats["loaded"]:
+        raise RuntimeError("No models loaded")
+    # Far-horizon predictions start after the Open-Meteo horizon and should come from the tables
+    needed = str(datetime.now().date() + timedelta(days=17))
+    stale = [path for path, model in stats["models"].items() if model["table_end"] < needed]
+    if stale:
+        raise RuntimeError(f"Forecast tables out of date: {', '.join(stale)}")
+    return {"models": stats["models"], "hot_swaps": stats["hot_swaps"]}
+
+async def check_caches() -> Dict[str, Any]:
     return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "database": db_status,
+        "weather_cache": weather_cache.stats(),
+        "response_cache": assistant_engine.cache.stats() if assistant_engine and assistant_engine.cache else None,
+        "forecast_store": forecast_store.stats(),
+        "prediction_batcher": prediction_batcher.stats(),
+        "inference_pool": inference_pool.stats(),
+        "users": user_service.stats(),
+    }
+
+async def check_environment() -> Dict[str, Any]:
+    from env_validator import EnvironmentValidator
+    results = await asyncio.to_thread(EnvironmentValidator().validate_all)
+    if not results["valid"]:
+        raise RuntimeError("; ".join(results["errors"]))
+    return {"warnings": results["warnings"]}
+
+async def check_session_key() -> Dict[str, Any]:
+    if user_service.secret_key_problem:
+        raise RuntimeError(f"{user_service.secret_key_problem}; generate one with: python -c \"import secrets; print(secrets.token_urlsafe(32))\"")
+    return {}
+
+async def check_startup() -> Dict[str, Any]:
+    failed = [name for name, phase in startup_tracker.phases.items() if phase["status"] == "error"]
+    if failed:
+        raise RuntimeError(f"Startup phase(s) failed: {', '.join(failed)}")
+    return {}
+
+def health_summary(checks: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Top-level fields kept from the original /health response"""
+    database = checks["database"]
+    return {
+        "database": "healthy" if database["status"] == "ok" else f"error: {database.get('error')}",
         "ai_assistant_available": bool(generate_response),
-        "ml_models_loaded": bool(temp_model and rain_model),
+        "ml_models_loaded": model_registry.loads > 0,
         "supported_locations": list(SUPPORTED_LOCATIONS.keys()),
-        "environment_valid": True  # Will be updated by startup validation
+        "environment_valid": checks["environment"]["status"] == "ok",
+        "startup": startup_tracker.status(),
     }
 
+health_monitor = HealthMonitor(summary=health_summary)
+health_monitor.register("database", check_database, critical=True)
+health_monitor.register("models", check_models, critical=True)
+health_monitor.register("open_meteo", check_open_meteo, interval=60)
+health_monitor.register("assistant", check_assistant)
+health_monitor.register("caches", check_caches)
+health_monitor.register("environment", check_environment, interval=300)
+health_monitor.register("session_key", check_session_key, critical=True, interval=3600)
+health_monitor.register("startup", check_startup, interval=3600)
+
+@app.get("/health")
+async def health_check():
+    """Liveness: the latest background health snapshot, or the startup phases while warming up"""
+    if not health_monitor.refreshes:
+        return Response(content=startup_tracker.body(), media_type="application/json")
+    return Response(content=health_monitor.body(), media_type="application/json")
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness: 503 until warm-up is done and the database and models check out"""
+    if not health_monitor.refreshes:
+        return Response(content=startup_tracker.body(), media_type="application/json", status_code=503)
+    return Response(
+        content=health_monitor.body(),
+        media_type="application/json",
+        status_code=200 if health_monitor.ready else 503
+    )
+
 # Environment validation endpoint
 @app.get("/env/status")
 def get_environment_status():
@@ -377,4 +803,7 @@ def get_environment_status():
             "valid": False,
             "error": str(e)
         }
+
+startup_tracker.mark("import")
+
 # Run the app with: uvicorn backend.main_api:app --reload --host 0.0.0.0 --port 8000
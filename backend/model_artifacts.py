@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+🧮 Model Artifacts
+Exports fitted Prophet models to small NumPy .npz artifacts and evaluates
+them without importing Prophet, so API workers start in milliseconds.
+
+Usage:
+    python model_artifacts.py                 # export every model/*.pkl next to it
+    python model_artifacts.py model/temp_model.pkl
+"""
+
+import hashlib
+import json
+import logging
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT_VERSION = 1
+
+# Holiday effects are tabulated at export time for this many years ahead
+HOLIDAY_YEARS_AHEAD = 15
+
+Dates = Union[Iterable[date], np.ndarray]
+
+
+def _to_epoch_days(days: Dates) -> np.ndarray:
+    """Convert dates to integer days since 1970-01-01"""
+    return np.asarray(days, dtype="datetime64[D]").astype(np.int64)
+
+
+def export_prophet(model: Any, path: Union[str, Path]) -> Path:
+    """
+    Export a fitted Prophet model to an .npz artifact.
+
+    Stores the trend parameters and changepoints, the Fourier coefficients
+    of every seasonality (already multiplied by y_scale) and the combined
+    holiday effect for each holiday date in the tabulated window.
+
+    Args:
+        model: Fitted Prophet model with linear or flat growth and additive
+            seasonalities
+        path: Destination .npz file
+
+    Returns:
+        Path: The written artifact
+
+    Raises:
+        ValueError: If the model uses features the evaluator cannot reproduce
+    """
+    import pandas as pd
+
+    if model.growth not in ("linear", "flat"):
+        raise ValueError(f"Unsupported growth '{model.growth}', only linear and flat can be exported")
+    if model.extra_regressors:
+        raise ValueError("Models with extra regressors cannot be exported")
+    for name, props in model.seasonalities.items():
+        if props["mode"] != "additive" or props["condition_name"]:
+            raise ValueError(f"Seasonality '{name}' must be additive and unconditional to be exported")
+    if model.holidays_mode != "additive":
+        raise ValueError("Holidays must be additive to be exported")
+
+    y_scale = float(model.y_scale)
+    floor = 0.0 if model.scaling == "absmax" else float(model.y_min)
+    beta = np.nanmean(model.params["beta"], axis=0)
+
+    # Map the feature columns back to their seasonality / holiday component
+    history_start = model.history["ds"].min()
+    grid_end = pd.Timestamp(datetime.now().date() + timedelta(days=365 * HOLIDAY_YEARS_AHEAD))
+    grid = pd.DataFrame({"ds": pd.date_range(history_start, grid_end, freq="D")})
+    features, _, component_cols, _ = model.make_all_seasonality_features(model.setup_dataframe(grid.copy()))
+
+    arrays: Dict[str, np.ndarray] = {
+        "k": np.array(np.nanmean(model.params["k"])),
+        "m": np.array(np.nanmean(model.params["m"])),
+        "deltas": np.nanmean(model.params["delta"], axis=0).astype(np.float64),
+        "changepoints_t": np.asarray(model.changepoints_t, dtype=np.float64),
+    }
+    seasonalities = []
+    for name, props in model.seasonalities.items():
+        mask = component_cols[name].to_numpy() == 1
+        arrays[f"season_{name}"] = beta[mask] * y_scale
+        seasonalities.append({"name": name, "period": float(props["period"]), "fourier_order": int(props["fourier_order"])})
+
+    holiday_effect = np.zeros(len(grid))
+    if "holidays" in component_cols:
+        mask = component_cols["holidays"].to_numpy() == 1
+        holiday_effect = features.to_numpy()[:, mask] @ beta[mask] * y_scale
+    nonzero = holiday_effect != 0
+    arrays["holiday_days"] = _to_epoch_days(grid["ds"].to_numpy())[nonzero]
+    arrays["holiday_effect"] = holiday_effect[nonzero]
+
+    meta = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "growth": model.growth,
+        "start_day": float((model.start - pd.Timestamp("1970-01-01")) / pd.Timedelta(days=1)),
+        "t_scale_days": float(model.t_scale / pd.Timedelta(days=1)),
+        "y_scale": y_scale,
+        "floor": floor,
+        "sigma_obs": float(np.nanmean(model.params["sigma_obs"])),
+        "interval_width": float(model.interval_width),
+        "seasonalities": seasonalities,
+        "holiday_window": [str(grid["ds"].iloc[0].date()), str(grid["ds"].iloc[-1].date())],
+        "exported_at": datetime.now().isoformat(),
+    }
+    arrays["meta"] = np.array(json.dumps(meta))
+
+    path = Path(path)
+    with open(path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    return path
+
+
+class ProphetArtifact:
+    """Pure-NumPy evaluator for an exported Prophet model"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], version: str = ""):
+        self.meta: Dict[str, Any] = json.loads(str(arrays["meta"]))
+        if self.meta["format_version"] != ARTIFACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported artifact format {self.meta['format_version']}")
+        self.version = version
+        self.k = float(arrays["k"])
+        self.m = float(arrays["m"])
+        self.deltas = arrays["deltas"]
+        self.changepoints_t = arrays["changepoints_t"]
+        self.seasonalities = [
+            (s["period"], arrays[f"season_{s['name']}"].reshape(s["fourier_order"], 2))
+            for s in self.meta["seasonalities"]
+        ]
+        self.holiday_days = arrays["holiday_days"]
+        self.holiday_effect = arrays["holiday_effect"]
+        self._z = NormalDist().inv_cdf(0.5 + self.meta["interval_width"] / 2)
+
+        # Prophet simulates future slope changes at the historical changepoint
+        # rate S (per unit of scaled time) with Laplace(0, lambda) sizes. The
+        # trend offset they cause at time t has variance 2/3 * S * lambda^2 * (t - 1)^3
+        if self.meta["growth"] == "flat":
+            self._trend_variance_rate = 0.0
+        else:
+            rate = max(len(self.changepoints_t), 1)
+            mean_delta = float(np.mean(np.abs(self.deltas))) + 1e-8 if len(self.deltas) else 1e-8
+            self._trend_variance_rate = 2.0 / 3.0 * rate * mean_delta ** 2
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ProphetArtifact":
+        """
+        Load an artifact written by export_prophet.
+
+        The version is a short hash of the file, so a retrained artifact
+        always gets a new one.
+        """
+        data = Path(path).read_bytes()
+        version = hashlib.sha256(data).hexdigest()[:12]
+        with np.load(path, allow_pickle=False) as arrays:
+            return cls({name: arrays[name] for name in arrays.files}, version)
+
+    def _trend(self, t: np.ndarray) -> np.ndarray:
+        if self.meta["growth"] == "flat":
+            return np.full_like(t, self.m)
+        deltas_t = (self.changepoints_t[None, :] <= t[:, None]) * self.deltas
+        k_t = deltas_t.sum(axis=1) + self.k
+        m_t = (deltas_t * -self.changepoints_t).sum(axis=1) + self.m
+        return k_t * t + m_t
+
+    def _scaled_time(self, epoch_days: np.ndarray) -> np.ndarray:
+        """Prophet's t: 0 at the start of the history, 1 at its end"""
+        return (epoch_days - self.meta["start_day"]) / self.meta["t_scale_days"]
+
+    def predict(self, days: Dates) -> np.ndarray:
+        """
+        Evaluate yhat (trend + seasonalities + holidays) for an array of
+        dates in one vectorized pass.
+
+        Args:
+            days: Dates (datetime.date objects or datetime64 values)
+
+        Returns:
+            np.ndarray: yhat for each date
+        """
+        epoch_days = _to_epoch_days(days)
+        yhat = self._trend(self._scaled_time(epoch_days)) * self.meta["y_scale"] + self.meta["floor"]
+
+        for period, coefficients in self.seasonalities:
+            orders = np.arange(1, len(coefficients) + 1)
+            x = (2 * np.pi / period) * epoch_days[:, None].astype(np.float64) * orders[None, :]
+            yhat += np.sin(x) @ coefficients[:, 0] + np.cos(x) @ coefficients[:, 1]
+
+        if len(self.holiday_days):
+            index = np.searchsorted(self.holiday_days, epoch_days).clip(max=len(self.holiday_days) - 1)
+            is_holiday = self.holiday_days[index] == epoch_days
+            yhat += np.where(is_holiday, self.holiday_effect[index], 0.0)
+        return yhat
+
+    def predict_interval(self, days: Dates) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate (yhat, yhat_lower, yhat_upper) with closed-form intervals.
+
+        Instead of simulating 1000 trend paths like Prophet, the interval is
+        a normal approximation combining observation noise (sigma_obs) with
+        the variance of the simulated future trend changes, which grows with
+        the distance from the end of the history.
+        """
+        epoch_days = _to_epoch_days(days)
+        yhat = self.predict(epoch_days.astype("datetime64[D]"))
+        beyond_history = np.clip(self._scaled_time(epoch_days) - 1.0, 0.0, None)
+        variance = self.meta["sigma_obs"] ** 2 + self._trend_variance_rate * beyond_history ** 3
+        half_width = self._z * np.sqrt(variance) * self.meta["y_scale"]
+        return yhat, yhat - half_width, yhat + half_width
+
+
+def export_pickle(pickle_path: Union[str, Path]) -> Path:
+    """Export a pickled Prophet model to an .npz artifact next to it"""
+    import pickle
+
+    pickle_path = Path(pickle_path)
+    with open(pickle_path, "rb") as f:
+        model = pickle.load(f)
+    return export_prophet(model, pickle_path.with_suffix(".npz"))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    model_dir = Path(__file__).resolve().parent / "model"
+    paths = [Path(p) for p in sys.argv[1:]] or sorted(model_dir.glob("*.pkl"))
+    if not paths:
+        logger.error(f"❌ No model pickles found in {model_dir}")
+        sys.exit(1)
+    for path in paths:
+        artifact_path = export_pickle(path)
+        logger.info(f"✅ Exported {path.name} → {artifact_path.name} ({artifact_path.stat().st_size / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
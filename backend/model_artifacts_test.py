@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Model Artifact Tests
+Checks the NumPy evaluator against Prophet's own predictions on the
+Weather_Test.csv dates
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from model_artifacts import ProphetArtifact, export_prophet
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("prophet")
+
+MODEL_DIR = backend_dir / "model"
+TEST_CSV = backend_dir.parent / "Dataset" / "Weather_Test.csv"
+
+
+@pytest.fixture(scope="module", params=["temp_model", "rain_model"])
+def models(request, tmp_path_factory):
+    with open(MODEL_DIR / f"{request.param}.pkl", "rb") as f:
+        model = pickle.load(f)
+    path = export_prophet(model, tmp_path_factory.mktemp("artifacts") / f"{request.param}.npz")
+    return model, ProphetArtifact.load(path)
+
+
+def test_yhat_matches_prophet_on_test_dates(models):
+    model, artifact = models
+    ds = pd.to_datetime(pd.read_csv(TEST_CSV)["DATE"])
+
+    expected = model.predict(pd.DataFrame({"ds": ds}))["yhat"].to_numpy()
+    actual = artifact.predict(ds.to_numpy())
+
+    np.testing.assert_allclose(actual, expected, atol=1e-6)
+
+
+def test_yhat_matches_prophet_on_holidays_years_ahead(models):
+    model, artifact = models
+    ds = pd.to_datetime(["2030-01-01", "2030-06-01", "2030-10-20", "2030-12-25", "2031-04-18"])
+
+    expected = model.predict(pd.DataFrame({"ds": ds}))["yhat"].to_numpy()
+
+    np.testing.assert_allclose(artifact.predict(ds.to_numpy()), expected, atol=1e-6)
+
+
+def test_closed_form_interval_tracks_prophet_width(models):
+    model, artifact = models
+    # Prophet accumulates trend uncertainty from the first future row of the
+    # frame, so start the frame right after the history like the closed form
+    ds = pd.date_range(model.history["ds"].max() + pd.Timedelta(days=1), "2031-12-31", freq="D")
+    forecast = model.predict(pd.DataFrame({"ds": ds}))
+    expected_width = (forecast["yhat_upper"] - forecast["yhat_lower"]).to_numpy()
+
+    _, lower, upper = artifact.predict_interval(ds.to_numpy())
+
+    for index in (0, len(ds) // 2, len(ds) - 1):
+        assert upper[index] - lower[index] == pytest.approx(expected_width[index], rel=0.15)
@@ -0,0 +1,252 @@
+"""
+🗂️ Model Registry
+Per-location forecast models loaded lazily on first use and kept in a
+bounded LRU, so memory scales with active locations rather than with the
+size of the location catalog. Retrained artifacts are hot-swapped when
+their file changes on disk.
+
+Layout under model/:
+    locations.json                 catalog: {"machakos": {"lat": .., "lon": ..}, ...}
+    temp_model.npz, rain_model.npz shared models, used by locations without their own
+    <location>/temp_model.npz      per-location models
+    <location>/rain_model.npz
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from forecast_table import DEFAULT_HORIZON_DAYS, ForecastTable
+from model_artifacts import ProphetArtifact
+
+logger = logging.getLogger(__name__)
+
+# Artifact file name for each forecast variable
+MODEL_FILES = {
+    "temperature": "temp_model.npz",
+    "rain": "rain_model.npz",
+}
+
+MODEL_CACHE_SIZE = int(os.getenv("MODEL_CACHE_SIZE", "64"))
+
+# How often (seconds) a loaded model's file is checked for a newer version
+MODEL_CHECK_INTERVAL_SECONDS = float(os.getenv("MODEL_CHECK_INTERVAL_SECONDS", "30"))
+
+
+@dataclass
+class LoadedModel:
+    """An artifact in memory together with its materialized forecast table"""
+
+    path: Path
+    mtime: float
+    artifact: ProphetArtifact
+    table: ForecastTable
+    checked_at: float
+
+
+class ModelRegistry:
+    """Lazy, bounded, hot-swappable registry of forecast models keyed by (location, variable)"""
+
+    def __init__(
+        self,
+        model_dir: Path,
+        max_loaded: int = MODEL_CACHE_SIZE,
+        horizon_days: int = DEFAULT_HORIZON_DAYS,
+        check_interval: float = MODEL_CHECK_INTERVAL_SECONDS,
+        loader: Callable[[Path], ProphetArtifact] = ProphetArtifact.load,
+    ):
+        self.model_dir = Path(model_dir)
+        self.max_loaded = max_loaded
+        self.horizon_days = horizon_days
+        self.check_interval = check_interval
+        self.loader = loader
+        self.locations: Dict[str, Dict[str, float]] = self._load_catalog()
+        # Keyed by artifact path, so locations sharing a model share one entry
+        self._loaded: "OrderedDict[Path, LoadedModel]" = OrderedDict()
+        # (location, variable) -> artifact path, for lookups that must not touch the filesystem
+        self._paths: Dict[Tuple[str, str], Path] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.swaps = 0
+        self.evictions = 0
+
+    def _load_catalog(self) -> Dict[str, Dict[str, float]]:
+        with open(self.model_dir / "locations.json") as f:
+            return {name.lower(): coords for name, coords in json.load(f).items()}
+
+    def resolve(self, location: str, variable: str) -> Path:
+        """
+        Find the artifact for a location, falling back to the shared model.
+
+        Raises:
+            KeyError: If the location or variable is unknown
+            FileNotFoundError: If neither artifact exists
+        """
+        if location not in self.locations:
+            raise KeyError(f"Unknown location '{location}'")
+        filename = MODEL_FILES[variable]
+        own = self.model_dir / location / filename
+        if own.exists():
+            return own
+        shared = self.model_dir / filename
+        if shared.exists():
+            return shared
+        raise FileNotFoundError(f"No {variable} model for '{location}' in {self.model_dir}")
+
+    def _build(self, path: Path, mtime: float) -> LoadedModel:
+        artifact = self.loader(path)
+        table = ForecastTable.from_model(artifact, datetime.now().date(), self.horizon_days)
+        return LoadedModel(path, mtime, artifact, table, time.monotonic())
+
+    def get(self, location: str, variable: str) -> LoadedModel:
+        """Get a model, loading it on first use and reloading it if the file changed"""
+        path = self.resolve(location, variable)
+        self._paths[(location, variable)] = path
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._loaded.get(path)
+            if entry is not None:
+                self._loaded.move_to_end(path)
+                if now - entry.checked_at < self.check_interval:
+                    return entry
+                entry.checked_at = now
+
+            mtime = os.path.getmtime(path)
+            if entry is not None and entry.mtime == mtime:
+                return entry
+
+            new_entry = self._build(path, mtime)
+            if entry is None:
+                self.loads += 1
+                logger.info(f"✅ Loaded {variable} model for '{location}' from {path.relative_to(self.model_dir)}")
+            else:
+                self.swaps += 1
+                logger.info(f"🔄 Hot-swapped {variable} model {path.relative_to(self.model_dir)} (version {getattr(new_entry.artifact, 'version', '')})")
+            self._loaded[path] = new_entry
+            self._loaded.move_to_end(path)
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+                self.evictions += 1
+            return new_entry
+
+    def refresh(self):
+        """
+        Pick up per-location artifacts that appeared since a location was
+        resolved, hot-swap changed artifacts and roll forward tables that are
+        running out of horizon.
+        """
+        # loaded_forecast() trusts _paths, so a newly promoted model/<location>/ artifact must replace the shared one here
+        for (location, variable), path in list(self._paths.items()):
+            try:
+                resolved = self.resolve(location, variable)
+            except FileNotFoundError:
+                continue
+            if resolved != path:
+                logger.info(f"🔄 {variable} model for '{location}' now comes from {resolved.relative_to(self.model_dir)}")
+                self.get(location, variable)
+
+        today = datetime.now().date()
+        with self._lock:
+            entries = list(self._loaded.items())
+        for path, entry in entries:
+            try:
+                mtime = os.path.getmtime(path)
+            except FileNotFoundError:
+                logger.error(f"❌ Model file {path} disappeared, keeping the loaded version")
+                continue
+            if mtime == entry.mtime and entry.table.covers(today + timedelta(days=self.horizon_days // 2)):
+                continue
+            new_entry = self._build(path, mtime)
+            with self._lock:
+                if path in self._loaded:
+                    self._loaded[path] = new_entry
+                    self.swaps += mtime != entry.mtime
+
+    def predict_days(self, location: str, variable: str, days: List[date]) -> np.ndarray:
+        """
+        Get yhat for many days at once.
+
+        Days inside the forecast table are read from it; the rest are
+        evaluated in a single vectorized model.predict call.
+
+        Args:
+            location (str): Location name from the catalog
+            variable (str): "temperature" or "rain"
+            days (List[date]): Days to forecast
+
+        Returns:
+            np.ndarray: yhat for each day, in the same order
+        """
+        entry = self.get(location, variable)
+        result = np.empty(len(days), dtype=np.float64)
+        outside = []
+        for i, day in enumerate(days):
+            forecast = entry.table.lookup(day)
+            if forecast is None:
+                outside.append(i)
+            else:
+                result[i] = forecast[0]
+
+        if outside:
+            result[outside] = entry.artifact.predict([days[i] for i in outside])
+        return result
+
+    def version(self, location: str) -> str:
+        """Versions of the temperature and rain artifacts used for a location"""
+        return ".".join(getattr(self.get(location, variable).artifact, "version", "") for variable in MODEL_FILES)
+
+    def loaded_forecast(self, location: str, day: date) -> Optional[Tuple[float, float]]:
+        """
+        Temperature and rain yhat for a day from the forecast tables already in memory.
+
+        Never loads a model, checks a file or waits for the lock, so it is safe
+        to call on the event loop. Hot swaps still arrive through get() and
+        refresh().
+
+        Returns:
+            Optional[Tuple[float, float]]: (temperature, rain), or None if a model
+                is not loaded yet or the day is outside its table
+        """
+        values = []
+        for variable in MODEL_FILES:
+            path = self._paths.get((location, variable))
+            entry = self._loaded.get(path) if path is not None else None
+            forecast = entry.table.lookup(day) if entry is not None else None
+            if forecast is None:
+                return None
+            values.append(forecast[0])
+        return values[0], values[1]
+
+    def lookup(self, location: str, variable: str, day: date) -> Optional[Tuple[float, float, float]]:
+        return self.get(location, variable).table.lookup(day)
+
+    def stats(self) -> Dict[str, Any]:
+        """Registry counters and the models currently in memory"""
+        with self._lock:
+            loaded = {
+                str(path.relative_to(self.model_dir)): {
+                    "version": getattr(entry.artifact, "version", ""),
+                    "table_start": str(entry.table.start),
+                    "table_end": str(entry.table.end),
+                }
+                for path, entry in self._loaded.items()
+            }
+        return {
+            "locations": len(self.locations),
+            "loaded": len(loaded),
+            "capacity": self.max_loaded,
+            "loads": self.loads,
+            "hot_swaps": self.swaps,
+            "evictions": self.evictions,
+            "models": loaded,
+        }
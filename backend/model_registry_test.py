@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Model Registry Tests
+Checks per-location resolution, the LRU bound and hot-swapping of
+retrained artifacts
+"""
+
+import json
+import os
+import pickle
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from model_registry import ModelRegistry
+
+
+class ConstantModel:
+    """Stand-in for an exported model that predicts a constant"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def predict(self, days):
+        return np.full(len(days), self.value)
+
+    def predict_interval(self, days):
+        yhat = self.predict(days)
+        return yhat, yhat - 1, yhat + 1
+
+
+def load_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def write_model(path, value):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(pickle.dumps(ConstantModel(value)))
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    locations = {name: {"lat": 0.0, "lon": float(i)} for i, name in enumerate(["machakos", "vhembe", "kitui"])}
+    (tmp_path / "locations.json").write_text(json.dumps(locations))
+    write_model(tmp_path / "temp_model.npz", 20.0)
+    write_model(tmp_path / "rain_model.npz", 1.0)
+    write_model(tmp_path / "vhembe" / "temp_model.npz", 30.0)
+    write_model(tmp_path / "kitui" / "temp_model.npz", 25.0)
+    return tmp_path
+
+
+def make_registry(model_dir, **kwargs):
+    return ModelRegistry(model_dir, horizon_days=30, loader=load_pickle, **kwargs)
+
+
+def test_per_location_models_fall_back_to_shared(model_dir):
+    registry = make_registry(model_dir)
+    today = date.today()
+
+    assert registry.lookup("machakos", "temperature", today)[0] == 20.0
+    assert registry.lookup("vhembe", "temperature", today)[0] == 30.0
+    assert registry.lookup("vhembe", "rain", today)[0] == 1.0
+    assert registry.stats()["loaded"] == 3
+    with pytest.raises(KeyError):
+        registry.get("atlantis", "temperature")
+
+
+def test_loaded_models_are_bounded(model_dir):
+    registry = make_registry(model_dir, max_loaded=2)
+    for location in ("machakos", "vhembe", "kitui"):
+        registry.get(location, "temperature")
+
+    stats = registry.stats()
+    assert stats["loaded"] == 2
+    assert stats["evictions"] == 1
+    assert "temp_model.npz" not in stats["models"]
+
+
+def test_retrained_artifact_is_hot_swapped(model_dir):
+    registry = make_registry(model_dir, check_interval=0)
+    path = model_dir / "vhembe" / "temp_model.npz"
+    assert registry.lookup("vhembe", "temperature", date.today())[0] == 30.0
+
+    write_model(path, 31.0)
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 10))
+
+    assert registry.lookup("vhembe", "temperature", date.today())[0] == 31.0
+    assert registry.stats()["hot_swaps"] == 1
+
+
+def test_promoted_location_artifact_replaces_the_shared_one(model_dir):
+    registry = make_registry(model_dir)
+    for variable in ("temperature", "rain"):
+        registry.get("machakos", variable)
+    assert registry.loaded_forecast("machakos", date.today()) == (20.0, 1.0)
+
+    # train_models.promote() writes a per-location model after the first lookup
+    write_model(model_dir / "machakos" / "temp_model.npz", 22.0)
+    registry.refresh()
+
+    assert registry.loaded_forecast("machakos", date.today()) == (22.0, 1.0)
+    assert registry.loaded_forecast("kitui", date.today()) is None
+
+
+def test_predict_days_falls_back_to_the_model_outside_the_table(model_dir):
+    registry = make_registry(model_dir)
+    days = [date.today(), date.today() + timedelta(days=1000)]
+    assert list(registry.predict_days("kitui", "temperature", days)) == [25.0, 25.0]
+
+
+def test_loaded_forecast_never_loads(model_dir):
+    registry = make_registry(model_dir)
+    assert registry.loaded_forecast("kitui", date.today()) is None
+    assert registry.loads == 0
+
+    registry.predict_days("kitui", "temperature", [date.today()])
+    registry.predict_days("kitui", "rain", [date.today()])
+    assert registry.loaded_forecast("kitui", date.today()) == (25.0, 1.0)
+    assert registry.loaded_forecast("kitui", date.today() + timedelta(days=1000)) is None
@@ -0,0 +1,169 @@
+"""
+🌍 Open-Meteo Client
+Shared async HTTP client for the Open-Meteo forecast API with a pooled
+keep-alive connection set, bounded concurrency, timeouts and retries.
+"""
+
+import asyncio
+import logging
+import os
+import random
+from datetime import date
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import httpx
+
+if TYPE_CHECKING:
+    from weather_cache import WeatherCache
+
+logger = logging.getLogger(__name__)
+
+OPEN_METEO_BASE_URL = os.getenv("OPEN_METEO_BASE_URL", "https://api.open-meteo.com/v1/forecast")
+OPEN_METEO_TIMEZONE = "Africa/Nairobi"
+DAILY_VARIABLES = "temperature_2m_max,precipitation_sum"
+
+# Connection pool, concurrency and timeout settings
+OPEN_METEO_MAX_CONNECTIONS = int(os.getenv("OPEN_METEO_MAX_CONNECTIONS", "20"))
+OPEN_METEO_MAX_CONCURRENCY = int(os.getenv("OPEN_METEO_MAX_CONCURRENCY", "10"))
+OPEN_METEO_CONNECT_TIMEOUT = float(os.getenv("OPEN_METEO_CONNECT_TIMEOUT", "3"))
+OPEN_METEO_READ_TIMEOUT = float(os.getenv("OPEN_METEO_READ_TIMEOUT", "10"))
+OPEN_METEO_RETRIES = int(os.getenv("OPEN_METEO_RETRIES", "3"))
+
+# Exponential backoff with full jitter, in seconds
+BACKOFF_BASE = 0.25
+BACKOFF_CAP = 4.0
+
+# Upstream statuses worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class OpenMeteoError(Exception):
+    """Raised when Open-Meteo cannot be reached or returns an error"""
+
+
+class OpenMeteoClient:
+    """Async Open-Meteo client shared by every request in the process"""
+
+    def __init__(
+        self,
+        base_url: str = OPEN_METEO_BASE_URL,
+        max_connections: int = OPEN_METEO_MAX_CONNECTIONS,
+        max_concurrency: int = OPEN_METEO_MAX_CONCURRENCY,
+        connect_timeout: float = OPEN_METEO_CONNECT_TIMEOUT,
+        read_timeout: float = OPEN_METEO_READ_TIMEOUT,
+        retries: int = OPEN_METEO_RETRIES,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional["WeatherCache"] = None,
+    ):
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.retries = retries
+        self._transport = transport
+        self.cache = cache
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Created lazily so the pool and semaphore bind to the running loop
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                timeout=self.timeout,
+                transport=self._transport,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def close(self):
+        """Close the pooled connections"""
+        if self.cache is not None:
+            await self.cache.close()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._semaphore = None
+
+    async def _get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        client = self._get_client()
+        assert self._semaphore is not None
+        last_error: Optional[Exception] = None
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+                logger.warning(f"⚠️ Open-Meteo retry {attempt}/{self.retries} in {delay:.2f}s: {last_error}")
+                await asyncio.sleep(delay)
+            try:
+                async with self._semaphore:
+                    response = await client.get(self.base_url, params=params)
+            except httpx.TransportError as e:
+                last_error = e
+                continue
+
+            if response.status_code in RETRY_STATUSES:
+                last_error = OpenMeteoError(f"HTTP {response.status_code}")
+                continue
+            if response.status_code >= 400:
+                raise OpenMeteoError(f"HTTP {response.status_code}: {response.text[:200]}")
+            return response.json()
+
+        raise OpenMeteoError(f"Open-Meteo unavailable after {self.retries + 1} attempts: {last_error}")
+
+    async def fetch_daily(self, lat: float, lon: float, start_date: date, end_date: date) -> Dict[str, Any]:
+        """
+        Fetch daily max temperature and precipitation for a date range.
+
+        Args:
+            lat (float): Latitude
+            lon (float): Longitude
+            start_date (date): First day (inclusive)
+            end_date (date): Last day (inclusive)
+
+        Returns:
+            Dict[str, Any]: The "daily" block with "time", "temperature_2m_max"
+            and "precipitation_sum" lists
+
+        Raises:
+            OpenMeteoError: If the request fails after all retries
+        """
+        if self.cache is not None:
+            return await self.cache.get_daily(lat, lon, start_date, end_date, self._fetch_daily)
+        return await self._fetch_daily(lat, lon, start_date, end_date)
+
+    async def _fetch_daily(self, lat: float, lon: float, start_date: date, end_date: date) -> Dict[str, Any]:
+        data = await self._get({
+            "latitude": lat,
+            "longitude": lon,
+            "daily": DAILY_VARIABLES,
+            "start_date": str(start_date),
+            "end_date": str(end_date),
+            "timezone": OPEN_METEO_TIMEZONE,
+        })
+        try:
+            return data["daily"]
+        except (KeyError, TypeError):
+            raise OpenMeteoError("Malformed Open-Meteo response: missing 'daily' block")
+
+    async def ping(self, lat: float, lon: float) -> Dict[str, Any]:
+        """
+        One request for today's values, bypassing the cache and retries, for health checks.
+
+        Raises:
+            OpenMeteoError: If Open-Meteo answers with an error status
+        """
+        client = self._get_client()
+        response = await client.get(self.base_url, params={
+            "latitude": lat,
+            "longitude": lon,
+            "daily": DAILY_VARIABLES,
+            "forecast_days": 1,
+            "timezone": OPEN_METEO_TIMEZONE,
+        })
+        if response.status_code >= 400:
+            raise OpenMeteoError(f"HTTP {response.status_code}")
+        return {"http_status": response.status_code}
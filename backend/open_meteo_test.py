@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Open-Meteo Client Tests
+Checks retry, backoff and error handling against a mock transport
+"""
+
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+import open_meteo
+from open_meteo import OpenMeteoClient, OpenMeteoError
+
+DAILY = {"time": ["2025-01-01"], "temperature_2m_max": [24.1], "precipitation_sum": [3.2]}
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(open_meteo, "BACKOFF_BASE", 0.0)
+
+
+def make_client(responses):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return responses[min(len(calls), len(responses)) - 1]
+
+    return OpenMeteoClient(transport=httpx.MockTransport(handler), retries=2), calls
+
+
+def test_retries_transient_errors_then_succeeds():
+    client, calls = make_client([httpx.Response(503), httpx.Response(200, json={"daily": DAILY})])
+
+    daily = asyncio.run(client.fetch_daily(-1.5, 37.2, date(2025, 1, 1), date(2025, 1, 1)))
+
+    assert daily == DAILY
+    assert len(calls) == 2
+    assert calls[0].url.params["start_date"] == "2025-01-01"
+
+
+def test_client_errors_are_not_retried():
+    client, calls = make_client([httpx.Response(400, text="bad request")])
+
+    with pytest.raises(OpenMeteoError):
+        asyncio.run(client.fetch_daily(-1.5, 37.2, date(2025, 1, 1), date(2025, 1, 1)))
+    assert len(calls) == 1
+
+
+def test_gives_up_after_retries():
+    client, calls = make_client([httpx.Response(502)])
+
+    with pytest.raises(OpenMeteoError):
+        asyncio.run(client.fetch_daily(-1.5, 37.2, date(2025, 1, 1), date(2025, 1, 1)))
+    assert len(calls) == 3
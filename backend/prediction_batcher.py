@@ -0,0 +1,132 @@
+"""
+📦 Prediction Batcher
+Micro-batching for far-horizon predictions: requests arriving within a few
+milliseconds of each other are collected and answered with one vectorized
+predict per model, then the results are fanned back out to the waiting
+requests. Batches run on the inference pool, so the event loop keeps
+collecting the next batch meanwhile.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict, deque
+from datetime import date
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from inference_pool import InferencePool
+
+logger = logging.getLogger(__name__)
+
+PREDICT_BATCH_MAX_SIZE = int(os.getenv("PREDICT_BATCH_MAX_SIZE", "64"))
+PREDICT_BATCH_MAX_WAIT_MS = float(os.getenv("PREDICT_BATCH_MAX_WAIT_MS", "5"))
+
+# Recent requests kept for the latency percentiles
+LATENCY_WINDOW = 1000
+
+Prediction = Tuple[float, float]
+
+
+class PredictionBatcher:
+    """Collects (location, day) requests and predicts them in batches"""
+
+    def __init__(
+        self,
+        inference_pool: InferencePool,
+        max_batch_size: int = PREDICT_BATCH_MAX_SIZE,
+        max_wait_ms: float = PREDICT_BATCH_MAX_WAIT_MS,
+    ):
+        self.inference_pool = inference_pool
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._pending: List[Tuple[str, date, float, "asyncio.Future[Prediction]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: set = set()
+        self.batches = 0
+        self.requests = 0
+        self.max_seen_batch = 0
+        self.batch_sizes: Deque[int] = deque(maxlen=LATENCY_WINDOW)
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    async def predict(self, location: str, day: date) -> Prediction:
+        """
+        Predict (temperature, rain) for one day, batched with concurrent requests.
+
+        Args:
+            location (str): Location name from the catalog
+            day (date): Day to forecast
+
+        Returns:
+            Tuple[float, float]: Temperature and rain predictions
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Prediction]" = loop.create_future()
+        self._pending.append((location, day, time.perf_counter(), future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[str, date, float, "asyncio.Future[Prediction]"]]):
+        by_location: Dict[str, List[int]] = defaultdict(list)
+        for i, (location, _, _, _) in enumerate(batch):
+            by_location[location].append(i)
+
+        # Locations predict side by side; a failing one only fails its own requests
+        await asyncio.gather(*[
+            self._run_location(location, [batch[i] for i in indices])
+            for location, indices in by_location.items()
+        ])
+
+        finished = time.perf_counter()
+        self.batches += 1
+        self.requests += len(batch)
+        self.max_seen_batch = max(self.max_seen_batch, len(batch))
+        self.batch_sizes.append(len(batch))
+        self.latencies.extend(finished - submitted for _, _, submitted, _ in batch)
+
+    async def _run_location(self, location: str, group: List[Tuple[str, date, float, "asyncio.Future[Prediction]"]]):
+        try:
+            temps, rains = await self.inference_pool.predict(location, [day for _, day, _, _ in group])
+        except Exception as e:
+            for _, _, _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, _, future), temp, rain in zip(group, temps, rains):
+            if not future.done():
+                future.set_result((float(temp), float(rain)))
+
+    def stats(self) -> Dict[str, Any]:
+        """Batch size and latency metrics for /health"""
+        latencies = sorted(self.latencies)
+
+        def percentile(q: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 3)
+
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "batches": self.batches,
+            "requests": self.requests,
+            "avg_batch_size": round(sum(self.batch_sizes) / len(self.batch_sizes), 2) if self.batch_sizes else None,
+            "largest_batch": self.max_seen_batch,
+            "latency_p50_ms": percentile(0.5),
+            "latency_p95_ms": percentile(0.95),
+        }
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Prediction Batcher Tests
+Checks that concurrent requests are answered by one predict call per model
+"""
+
+import asyncio
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from inference_pool import InferencePool
+from prediction_batcher import PredictionBatcher
+
+
+class CountingRegistry:
+    """Predicts the day of the month, counting predict_days calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict_days(self, location, variable, days):
+        self.calls.append((location, variable, len(days)))
+        offset = 0.0 if variable == "temperature" else 0.5
+        return np.array([day.day + offset for day in days])
+
+
+def test_concurrent_requests_share_one_batch():
+    registry = CountingRegistry()
+    batcher = PredictionBatcher(InferencePool(registry, workers=0), max_batch_size=100, max_wait_ms=20)
+    days = [date(2027, 1, 1) + timedelta(days=i) for i in range(10)]
+
+    async def run():
+        return await asyncio.gather(*[batcher.predict("machakos", day) for day in days])
+
+    results = asyncio.run(run())
+    assert results == [(float(day.day), day.day + 0.5) for day in days]
+    assert registry.calls == [("machakos", "temperature", 10), ("machakos", "rain", 10)]
+    assert batcher.stats()["largest_batch"] == 10
+
+
+def test_full_batch_flushes_without_waiting():
+    registry = CountingRegistry()
+    batcher = PredictionBatcher(InferencePool(registry, workers=0), max_batch_size=4, max_wait_ms=10_000)
+
+    async def run():
+        requests = [batcher.predict(location, date(2027, 1, 1)) for location in ("machakos", "vhembe") * 2]
+        return await asyncio.wait_for(asyncio.gather(*requests), timeout=1)
+
+    assert len(asyncio.run(run())) == 4
+    stats = batcher.stats()
+    assert stats["batches"] == 1 and stats["avg_batch_size"] == 4
+    assert sorted(registry.calls) == [
+        ("machakos", "rain", 2), ("machakos", "temperature", 2),
+        ("vhembe", "rain", 2), ("vhembe", "temperature", 2),
+    ]
+
+
+class SlowRegistry(CountingRegistry):
+    """Takes 0.1s per predict_days call and has no model for vhembe"""
+
+    def predict_days(self, location, variable, days):
+        time.sleep(0.1)
+        if location == "vhembe":
+            raise FileNotFoundError("model/vhembe/temp_model.npz")
+        return super().predict_days(location, variable, days)
+
+
+def test_locations_in_a_batch_predict_concurrently():
+    registry = SlowRegistry()
+    batcher = PredictionBatcher(InferencePool(registry, workers=0), max_batch_size=3, max_wait_ms=10_000)
+
+    async def run():
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *[batcher.predict(location, date(2027, 1, 2)) for location in ("machakos", "vhembe", "kitui")],
+            return_exceptions=True,
+        )
+        return results, time.perf_counter() - started
+
+    (machakos, vhembe, kitui), seconds = asyncio.run(run())
+    assert machakos == kitui == (2.0, 2.5)
+    assert isinstance(vhembe, FileNotFoundError)
+    # Two sequential predict_days per location, but the locations overlap
+    assert seconds < 0.35
@@ -0,0 +1,204 @@
+"""
+💬 Response Cache
+Caches assistant answers by use case and question, so the same farming
+questions asked again and again are answered without a paid LLM call.
+
+Questions are normalized for exact matches; near-duplicates ("which crops
+should I plant" / "what crops should I plant?") are found through a local
+vector index of hashed word features and a cosine similarity threshold.
+Entries expire after a TTL, the oldest are evicted when the cache is full,
+and an answer is discarded once its use case's system prompt has changed.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2000"))
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "21600"))
+RESPONSE_CACHE_SIMILARITY = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0.9"))
+
+# Estimated price of one completion (about 1,000 tokens on llama3-70b), for savings reports
+ASSISTANT_COST_PER_CALL_USD = float(os.getenv("ASSISTANT_COST_PER_CALL_USD", "0.0008"))
+
+VECTOR_DIM = 1024
+
+STOPWORDS = {
+    "a", "an", "the", "i", "my", "me", "we", "our", "you", "is", "are", "am", "be", "do", "does",
+    "can", "could", "should", "would", "will", "what", "which", "when", "how", "why", "where",
+    "to", "of", "in", "on", "for", "at", "this", "that", "it", "and", "or", "please", "now",
+}
+
+
+def normalize(question: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    return " ".join(re.findall(r"[a-z0-9]+", question.lower()))
+
+
+def embed(question: str) -> np.ndarray:
+    """
+    Hashed bag-of-words vector: content words and word pairs, L2-normalized.
+
+    Args:
+        question (str): Normalized question
+
+    Returns:
+        np.ndarray: Unit vector of length VECTOR_DIM (all zeros if no content words)
+    """
+    words = [w for w in question.split() if w not in STOPWORDS]
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    vector = np.zeros(VECTOR_DIM, dtype=np.float32)
+    for feature in features:
+        vector[zlib.crc32(feature.encode()) % VECTOR_DIM] += 1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def prompt_version(system_prompt: str) -> str:
+    return hashlib.sha256(system_prompt.encode()).hexdigest()[:12]
+
+
+@dataclass
+class CachedAnswer:
+    answer: str
+    use_case: str
+    prompt_version: str
+    expires_at: float
+    slot: int
+
+
+class ResponseCache:
+    """Exact and near-duplicate cache of assistant answers"""
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        similarity_threshold: float = RESPONSE_CACHE_SIMILARITY,
+        cost_per_call: float = ASSISTANT_COST_PER_CALL_USD,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.cost_per_call = cost_per_call
+        self._entries: "OrderedDict[Tuple[str, str], CachedAnswer]" = OrderedDict()
+        # Vector index: one row per slot, slot_keys[slot] is None when the slot is free
+        self._vectors = np.zeros((max_entries, VECTOR_DIM), dtype=np.float32)
+        self._slot_keys: List[Optional[Tuple[str, str]]] = [None] * max_entries
+        self._free_slots = list(range(max_entries - 1, -1, -1))
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def _remove(self, key: Tuple[str, str]):
+        entry = self._entries.pop(key)
+        self._slot_keys[entry.slot] = None
+        self._vectors[entry.slot] = 0.0
+        self._free_slots.append(entry.slot)
+
+    def _valid(self, key: Tuple[str, str], version: str) -> Optional[CachedAnswer]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        if entry.prompt_version != version:
+            self.invalidated += 1
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, question: str, use_case: str, system_prompt: str) -> Optional[str]:
+        """
+        Find a cached answer for the question, or a near-duplicate of it.
+
+        Args:
+            question (str): The user's question
+            use_case (str): Assistant use case
+            system_prompt (str): Current system prompt text for the use case
+
+        Returns:
+            Optional[str]: The cached answer, or None on a miss
+        """
+        text = normalize(question)
+        version = prompt_version(system_prompt)
+
+        entry = self._valid((use_case, text), version)
+        if entry is not None:
+            self.exact_hits += 1
+            return entry.answer
+
+        vector = embed(text)
+        if self._entries and vector.any():
+            similarities = self._vectors @ vector
+            for slot in np.argsort(similarities)[::-1]:
+                if similarities[slot] < self.similarity_threshold:
+                    break
+                key = self._slot_keys[slot]
+                if key is None or key[0] != use_case:
+                    continue
+                entry = self._valid(key, version)
+                if entry is not None:
+                    self.semantic_hits += 1
+                    return entry.answer
+
+        self.misses += 1
+        return None
+
+    def set(self, question: str, use_case: str, system_prompt: str, answer: str):
+        """Store an answer generated for the question"""
+        text = normalize(question)
+        key = (use_case, text)
+        if key in self._entries:
+            self._remove(key)
+        while not self._free_slots:
+            self._remove(next(iter(self._entries)))
+
+        slot = self._free_slots.pop()
+        self._vectors[slot] = embed(text)
+        self._slot_keys[slot] = key
+        self._entries[key] = CachedAnswer(
+            answer=answer,
+            use_case=use_case,
+            prompt_version=prompt_version(system_prompt),
+            expires_at=time.monotonic() + self.ttl_seconds,
+            slot=slot,
+        )
+
+    def clear(self):
+        for key in list(self._entries):
+            self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self, avg_latency: Optional[float] = None) -> Dict[str, Any]:
+        """Hit ratio and estimated savings for /assistant/status"""
+        hits = self.exact_hits + self.semantic_hits
+        lookups = hits + self.misses
+        result = {
+            "entries": len(self._entries),
+            "capacity": self.max_entries,
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else None,
+            "invalidated": self.invalidated,
+            "estimated_savings_usd": round(hits * self.cost_per_call, 4),
+        }
+        if avg_latency is not None:
+            result["estimated_seconds_saved"] = round(hits * avg_latency, 1)
+        return result
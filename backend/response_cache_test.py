@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Response Cache Tests
+Checks exact and near-duplicate hits, eviction and prompt invalidation
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from response_cache import ResponseCache
+
+PROMPT = "You are an expert AI farming assistant."
+ADVICE = "Smart Farming Advice"
+
+
+def test_exact_and_near_duplicate_hits():
+    cache = ResponseCache(max_entries=10, cost_per_call=0.001)
+    cache.set("What crops should I plant in Machakos?", ADVICE, PROMPT, "Maize and beans.")
+
+    assert cache.get("what crops should i plant in machakos", ADVICE, PROMPT) == "Maize and beans."
+    assert cache.get("Which crops should we plant in Machakos now?", ADVICE, PROMPT) == "Maize and beans."
+    assert cache.get("How do I control fall armyworm?", ADVICE, PROMPT) is None
+    assert cache.get("What crops should I plant in Machakos?", "Crop Management", PROMPT) is None
+
+    stats = cache.stats()
+    assert (stats["exact_hits"], stats["semantic_hits"], stats["misses"]) == (1, 1, 2)
+    assert stats["hit_ratio"] == 0.5
+    assert stats["estimated_savings_usd"] == 0.002
+
+
+def test_changed_system_prompt_invalidates_answers():
+    cache = ResponseCache(max_entries=10)
+    cache.set("When will it rain?", ADVICE, PROMPT, "In March.")
+
+    assert cache.get("When will it rain?", ADVICE, PROMPT + " Be brief.") is None
+    assert len(cache) == 0
+    assert cache.stats()["invalidated"] == 1
+
+
+def test_oldest_answers_are_evicted_and_expired_ones_dropped():
+    cache = ResponseCache(max_entries=2)
+    cache.set("maize spacing", ADVICE, PROMPT, "75cm")
+    cache.set("bean spacing", ADVICE, PROMPT, "50cm")
+    cache.set("sorghum spacing", ADVICE, PROMPT, "60cm")
+
+    assert len(cache) == 2
+    assert cache.get("maize spacing", ADVICE, PROMPT) is None
+    assert cache.get("sorghum spacing", ADVICE, PROMPT) == "60cm"
+
+    expired = ResponseCache(max_entries=2, ttl_seconds=0)
+    expired.set("maize spacing", ADVICE, PROMPT, "75cm")
+    assert expired.get("maize spacing", ADVICE, PROMPT) is None
@@ -0,0 +1,99 @@
+"""
+⏱️ Startup Tracker
+Times each startup phase (module import, assistant SDK, model load, database
+init, environment validation, inference workers) and holds the warm-up state
+behind /ready.
+
+The API binds its port as soon as the module is imported. The heavy phases
+run afterwards as background tasks, in parallel where they do not depend on
+each other. Until they finish, /health reports the phases so far and /ready
+answers 503.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Imported first by main_api, so this is when the API process began importing
+PROCESS_STARTED = time.perf_counter()
+
+
+class StartupTracker:
+    """Per-phase startup timings and the warm-up state"""
+
+    def __init__(self, started: float = PROCESS_STARTED):
+        self.started = started
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self.done = False
+        self.seconds: Optional[float] = None
+
+    def record(self, name: str, seconds: float, error: Optional[str] = None):
+        """
+        Record a finished phase.
+
+        Args:
+            name (str): Phase name, e.g. "model_load"
+            seconds (float): How long the phase took
+            error (Optional[str]): Why the phase failed, if it did
+        """
+        self.phases[name] = {"status": "error" if error else "ok", "seconds": round(seconds, 3)}
+        if error:
+            self.phases[name]["error"] = error
+            logger.error(f"❌ Startup phase '{name}' failed after {seconds:.2f}s: {error}")
+        else:
+            logger.info(f"⏱️ Startup phase '{name}' took {seconds:.2f}s")
+
+    def mark(self, name: str):
+        """Record a phase that ran from process start until now (the module import)"""
+        self.record(name, time.perf_counter() - self.started)
+
+    async def phase(self, name: str, func: Callable[..., Any], *args) -> Any:
+        """
+        Run and time one phase. Coroutine functions are awaited; plain functions
+        run in a worker thread so the event loop keeps serving /health.
+
+        Args:
+            name (str): Phase name
+            func (Callable[..., Any]): The work
+            *args: Arguments for func
+
+        Returns:
+            Any: What func returned
+
+        Raises:
+            Exception: Whatever func raised, after it is recorded
+        """
+        self.phases[name] = {"status": "running"}
+        started = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(func):
+                result = await func(*args)
+            else:
+                result = await asyncio.to_thread(func, *args)
+        except Exception as e:
+            self.record(name, time.perf_counter() - started, str(e) or type(e).__name__)
+            raise
+        self.record(name, time.perf_counter() - started)
+        return result
+
+    def finish(self):
+        """Mark the warm-up as complete"""
+        self.seconds = time.perf_counter() - self.started
+        self.done = True
+        failed = [name for name, phase in self.phases.items() if phase["status"] == "error"]
+        if failed:
+            logger.warning(f"⚠️ Warm-up finished in {self.seconds:.2f}s with failed phases: {', '.join(failed)}")
+        else:
+            logger.info(f"✅ Warm-up finished in {self.seconds:.2f}s")
+
+    def status(self) -> Dict[str, Any]:
+        seconds = self.seconds if self.done else time.perf_counter() - self.started
+        return {"done": self.done, "seconds": round(seconds, 3), "phases": dict(self.phases)}
+
+    def body(self) -> bytes:
+        """The not-yet-ready answer for /health and /ready while warming up"""
+        return json.dumps({"status": "starting", "ready": False, "startup": self.status()}).encode()
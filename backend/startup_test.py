@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Startup Tracker Tests
+Checks per-phase timings, recorded failures and the warm-up answer
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from startup import StartupTracker
+
+
+def test_phases_run_in_parallel_and_are_timed():
+    tracker = StartupTracker(started=time.perf_counter())
+    tracker.mark("import")
+
+    def load_models():
+        time.sleep(0.2)
+        return "models"
+
+    async def init_database():
+        await asyncio.sleep(0.2)
+        return "database"
+
+    async def warm_up():
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            tracker.phase("model_load", load_models),
+            tracker.phase("database", init_database),
+        )
+        return results, time.perf_counter() - started
+
+    results, seconds = asyncio.run(warm_up())
+    tracker.finish()
+
+    assert results == ["models", "database"] and seconds < 0.35
+    assert list(tracker.phases) == ["import", "model_load", "database"]
+    assert all(phase["status"] == "ok" for phase in tracker.phases.values())
+    assert tracker.phases["model_load"]["seconds"] >= 0.2
+    assert tracker.status()["done"] and tracker.status()["seconds"] >= 0.2
+
+
+def test_failed_phase_is_recorded_and_raised():
+    tracker = StartupTracker()
+
+    def missing_models():
+        raise FileNotFoundError("temp_model.npz")
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(tracker.phase("model_load", missing_models))
+    assert tracker.phases["model_load"]["status"] == "error"
+    assert tracker.phases["model_load"]["error"] == "temp_model.npz"
+
+
+def test_body_reports_running_phases_until_done():
+    tracker = StartupTracker()
+
+    async def warm_up():
+        task = asyncio.create_task(tracker.phase("assistant", asyncio.sleep, 0.05))
+        await asyncio.sleep(0)
+        body = json.loads(tracker.body())
+        await task
+        return body
+
+    body = asyncio.run(warm_up())
+    assert body["status"] == "starting" and not body["ready"]
+    assert body["startup"]["phases"]["assistant"] == {"status": "running"}
+    assert not body["startup"]["done"]
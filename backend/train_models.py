@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+🏋️ Model Training Pipeline
+Fits the temperature and rain Prophet models for every location in
+parallel across a process pool, exports them as versioned .npz artifacts
+with holdout metrics, and promotes them into model/ where the API's model
+registry hot-swaps them.
+
+Input data:
+    Dataset/Historical.csv, Dataset/Weather_Test.csv       shared models (model/*.npz)
+    Dataset/locations/<location>/Historical.csv            per-location models
+    Dataset/locations/<location>/Weather_Test.csv          optional holdout
+
+Locations whose input data (and training settings) hash is unchanged since
+the last run are skipped, so a nightly run only refits what changed.
+
+Usage:
+    python train_models.py                    # retrain what changed
+    python train_models.py machakos vhembe    # only these locations
+    python train_models.py --force            # retrain everything
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from model_artifacts import ProphetArtifact, export_prophet
+from model_registry import MODEL_FILES
+
+logger = logging.getLogger(__name__)
+
+DATASET_DIR = backend_dir.parent / "Dataset"
+MODEL_DIR = backend_dir / "model"
+SHARED = "_shared"
+
+# Bump when the model settings below change, so every location is refit
+TRAINING_CONFIG_VERSION = 1
+DEFAULT_COUNTRY = os.getenv("TRAINING_DEFAULT_COUNTRY", "KE")
+
+TRAINING_WORKERS = int(os.getenv("TRAINING_WORKERS", "0")) or os.cpu_count() or 1
+TRAINING_KEEP_VERSIONS = int(os.getenv("TRAINING_KEEP_VERSIONS", "3"))
+
+# CSV column holding each forecast variable
+COLUMNS = {
+    "temperature": "temperature",
+    "rain": "rain",
+}
+
+
+@dataclass
+class TrainingTarget:
+    """One location's input files and where its artifacts go"""
+
+    name: str
+    history_csv: Path
+    holdout_csv: Optional[Path]
+    output_dir: Path
+    country: str
+
+    def data_hash(self) -> str:
+        """Hash of the input data and training settings"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps({"config": TRAINING_CONFIG_VERSION, "country": self.country}).encode())
+        for path in (self.history_csv, self.holdout_csv):
+            if path is not None:
+                digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+
+def discover_targets(dataset_dir: Path = DATASET_DIR, model_dir: Path = MODEL_DIR) -> List[TrainingTarget]:
+    """
+    Find every location with training data.
+
+    Args:
+        dataset_dir (Path): Dataset root
+        model_dir (Path): Model root containing locations.json
+
+    Returns:
+        List[TrainingTarget]: The shared target (if Dataset/Historical.csv
+        exists) followed by one target per location with its own history
+    """
+    with open(model_dir / "locations.json") as f:
+        locations = {name.lower(): info for name, info in json.load(f).items()}
+
+    def holdout(directory: Path) -> Optional[Path]:
+        path = directory / "Weather_Test.csv"
+        return path if path.exists() else None
+
+    targets = []
+    if (dataset_dir / "Historical.csv").exists():
+        targets.append(TrainingTarget(SHARED, dataset_dir / "Historical.csv", holdout(dataset_dir), model_dir, DEFAULT_COUNTRY))
+
+    for name, info in sorted(locations.items()):
+        location_dir = dataset_dir / "locations" / name
+        if (location_dir / "Historical.csv").exists():
+            country = info.get("country", DEFAULT_COUNTRY)
+            targets.append(TrainingTarget(name, location_dir / "Historical.csv", holdout(location_dir), model_dir / name, country))
+    return targets
+
+
+def _read_series(csv_path: Path, variable: str):
+    import pandas as pd
+
+    data = pd.read_csv(csv_path)
+    return pd.DataFrame({"ds": pd.to_datetime(data["DATE"]), "y": data[COLUMNS[variable]]}).dropna()
+
+
+def fit_variable(target: TrainingTarget, variable: str, version_dir: Path) -> Dict[str, Any]:
+    """
+    Fit, export and score one model. Runs inside a worker process.
+
+    Returns:
+        Dict[str, Any]: Holdout metrics and timing for the model
+    """
+    from prophet import Prophet
+
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    started = time.perf_counter()
+
+    history = _read_series(target.history_csv, variable)
+    model = Prophet()
+    model.add_country_holidays(country_name=target.country)
+    model.fit(history)
+
+    path = export_prophet(model, version_dir / MODEL_FILES[variable])
+    metrics: Dict[str, Any] = {"rows": len(history), "fit_seconds": round(time.perf_counter() - started, 2)}
+
+    if target.holdout_csv is not None:
+        holdout = _read_series(target.holdout_csv, variable)
+        errors = ProphetArtifact.load(path).predict(holdout["ds"].to_numpy()) - holdout["y"].to_numpy()
+        metrics["holdout_rows"] = len(holdout)
+        metrics["mae"] = round(float(np.mean(np.abs(errors))), 4)
+        metrics["rmse"] = round(float(np.sqrt(np.mean(errors ** 2))), 4)
+    return metrics
+
+
+def promote(target: TrainingTarget, version_dir: Path):
+    """Copy a trained version into place; each file is swapped atomically"""
+    for filename in MODEL_FILES.values():
+        tmp = target.output_dir / f".{filename}.tmp"
+        shutil.copyfile(version_dir / filename, tmp)
+        os.replace(tmp, target.output_dir / filename)
+
+
+def prune_versions(target: TrainingTarget, keep: int = TRAINING_KEEP_VERSIONS):
+    versions = sorted((target.output_dir / "versions").iterdir())
+    for old in versions[:-keep] if keep > 0 else []:
+        shutil.rmtree(old)
+
+
+def load_manifest(model_dir: Path) -> Dict[str, Any]:
+    path = model_dir / "manifest.json"
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(model_dir: Path, manifest: Dict[str, Any]):
+    tmp = model_dir / ".manifest.json.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, model_dir / "manifest.json")
+
+
+def run_training(
+    targets: List[TrainingTarget],
+    model_dir: Path = MODEL_DIR,
+    workers: int = TRAINING_WORKERS,
+    force: bool = False,
+) -> Dict[str, Any]:
+    """
+    Retrain every target whose data changed, in parallel.
+
+    Each (location, variable) model is one job in the process pool. A
+    location is promoted only when both of its models trained successfully.
+
+    Args:
+        targets (List[TrainingTarget]): Locations to consider
+        model_dir (Path): Model root holding manifest.json
+        workers (int): Process pool size
+        force (bool): Retrain even if the data hash is unchanged
+
+    Returns:
+        Dict[str, Any]: Summary with trained, skipped and failed locations
+    """
+    manifest = load_manifest(model_dir)
+    started = time.perf_counter()
+
+    pending = {}
+    skipped = []
+    for target in targets:
+        data_hash = target.data_hash()
+        entry = manifest.get(target.name)
+        artifacts_exist = all((target.output_dir / f).exists() for f in MODEL_FILES.values())
+        if not force and entry and entry["data_hash"] == data_hash and artifacts_exist:
+            skipped.append(target.name)
+            continue
+        version = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{data_hash[:8]}"
+        version_dir = target.output_dir / "versions" / version
+        version_dir.mkdir(parents=True, exist_ok=True)
+        pending[target.name] = (target, data_hash, version, version_dir)
+
+    logger.info(f"🏋️ Training {len(pending)} location(s) with {workers} worker(s), {len(skipped)} unchanged")
+
+    results: Dict[str, Dict[str, Any]] = {name: {} for name in pending}
+    failed: Dict[str, str] = {}
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = {
+                pool.submit(fit_variable, target, variable, version_dir): (name, variable)
+                for name, (target, _, _, version_dir) in pending.items()
+                for variable in MODEL_FILES
+            }
+            for job in as_completed(jobs):
+                name, variable = jobs[job]
+                try:
+                    results[name][variable] = job.result()
+                except Exception as e:
+                    failed[name] = f"{variable}: {e}"
+                    logger.error(f"❌ {name} {variable} model failed: {e}")
+
+    trained = []
+    for name, (target, data_hash, version, version_dir) in pending.items():
+        if name in failed:
+            shutil.rmtree(version_dir, ignore_errors=True)
+            continue
+        with open(version_dir / "metrics.json", "w") as f:
+            json.dump(results[name], f, indent=2)
+        promote(target, version_dir)
+        prune_versions(target)
+        manifest[target.name] = {
+            "data_hash": data_hash,
+            "version": version,
+            "trained_at": datetime.now().isoformat(),
+            "metrics": results[name],
+        }
+        trained.append(name)
+        scores = ", ".join(
+            f"{variable} MAE {m['mae']} RMSE {m['rmse']}" for variable, m in results[name].items() if "mae" in m
+        )
+        logger.info(f"✅ {name}: version {version}" + (f" ({scores})" if scores else ""))
+
+    save_manifest(model_dir, manifest)
+    return {
+        "trained": trained,
+        "skipped": skipped,
+        "failed": failed,
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Retrain forecast models")
+    parser.add_argument("locations", nargs="*", help=f"Locations to train (default: all, '{SHARED}' for the shared models)")
+    parser.add_argument("--force", action="store_true", help="Retrain even if the input data is unchanged")
+    parser.add_argument("--workers", type=int, default=TRAINING_WORKERS, help="Process pool size")
+    args = parser.parse_args()
+
+    targets = discover_targets()
+    if args.locations:
+        wanted = {name.lower() for name in args.locations}
+        targets = [t for t in targets if t.name in wanted]
+    if not targets:
+        logger.error("❌ No training data found for the requested locations")
+        sys.exit(1)
+
+    summary = run_training(targets, workers=args.workers, force=args.force)
+    logger.info(
+        f"📊 Done in {summary['seconds']}s: {len(summary['trained'])} trained, "
+        f"{len(summary['skipped'])} unchanged, {len(summary['failed'])} failed"
+    )
+    sys.exit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Training Pipeline Tests
+Trains a small location end to end and checks that unchanged data is skipped
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+pytest.importorskip("prophet")
+
+from model_artifacts import ProphetArtifact
+from train_models import SHARED, discover_targets, run_training
+
+DATASET_DIR = backend_dir.parent / "Dataset"
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    dataset_dir = tmp_path / "Dataset"
+    model_dir = tmp_path / "model"
+    (dataset_dir / "locations" / "vhembe").mkdir(parents=True)
+    model_dir.mkdir()
+    shutil.copy(DATASET_DIR / "Historical.csv", dataset_dir / "locations" / "vhembe" / "Historical.csv")
+    shutil.copy(DATASET_DIR / "Weather_Test.csv", dataset_dir / "locations" / "vhembe" / "Weather_Test.csv")
+    (model_dir / "locations.json").write_text(json.dumps({
+        "machakos": {"lat": -1.5167, "lon": 37.2667},
+        "vhembe": {"lat": -22.9781, "lon": 30.4516, "country": "ZA"},
+    }))
+    return dataset_dir, model_dir
+
+
+def test_trains_locations_with_data_and_skips_unchanged(dirs):
+    dataset_dir, model_dir = dirs
+    targets = discover_targets(dataset_dir, model_dir)
+    assert [t.name for t in targets] == ["vhembe"]
+    assert SHARED not in [t.name for t in targets]
+
+    summary = run_training(targets, model_dir, workers=2)
+    assert summary["trained"] == ["vhembe"] and not summary["failed"]
+
+    manifest = json.loads((model_dir / "manifest.json").read_text())
+    metrics = manifest["vhembe"]["metrics"]
+    assert metrics["temperature"]["mae"] < 3
+    assert metrics["rain"]["rmse"] > 0
+    assert (model_dir / "vhembe" / "versions" / manifest["vhembe"]["version"] / "metrics.json").exists()
+    ProphetArtifact.load(model_dir / "vhembe" / "temp_model.npz")
+
+    assert run_training(targets, model_dir, workers=2)["skipped"] == ["vhembe"]
+
+    with open(dataset_dir / "locations" / "vhembe" / "Historical.csv", "a") as f:
+        f.write("\n2024-12-19,17.8,15.9\n")
+    assert run_training(targets, model_dir, workers=2)["trained"] == ["vhembe"]
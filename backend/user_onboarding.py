@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+🧑‍🌾 Bulk User Onboarding
+Imports cooperative member lists (CSV with name and phone_number columns,
+optionally password) into the users table.
+
+The CSV is read as a stream and processed in chunks. Phone numbers are
+normalized to E.164, and each chunk is checked against the users table
+with one set-based query. The new members are inserted with one batched
+statement per chunk, and every rejected row is reported with its row
+number and reason. Members imported without a password cannot log in
+until one is set.
+
+Usage:
+    python user_onboarding.py members.csv                     # Kenyan numbers (+254)
+    python user_onboarding.py members.csv --country-code 27   # South African numbers
+    python user_onboarding.py --normalize-stored-phones --country-code 254   # One-off: E.164 for old signups
+"""
+
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from sqlalchemy import bindparam, insert, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from database import SessionLocal, User, engine, init_db
+
+logger = logging.getLogger(__name__)
+
+# Country calling code for local numbers such as 0712 345 678
+ONBOARDING_DEFAULT_COUNTRY_CODE = os.getenv("ONBOARDING_DEFAULT_COUNTRY_CODE", "254")
+
+# Calling codes for the "country" of each location in model/locations.json
+COUNTRY_CALLING_CODES = {"KE": "254", "ZA": "27", "TZ": "255", "UG": "256", "RW": "250", "ET": "251"}
+# Members checked and inserted per transaction
+ONBOARDING_CHUNK_ROWS = int(os.getenv("ONBOARDING_CHUNK_ROWS", "5000"))
+
+# Rejected rows listed in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+
+# Characters people put in phone numbers that carry no digits
+PHONE_SEPARATORS = re.compile(r"[\s\-().]")
+E164 = re.compile(r"\+[1-9]\d{7,14}")
+
+
+def normalize_phone(raw: Optional[str], country_code: str = ONBOARDING_DEFAULT_COUNTRY_CODE) -> Optional[str]:
+    """
+    Normalize a phone number to E.164.
+
+    Args:
+        raw (Optional[str]): Number as typed, e.g. "0712 345 678", "254712345678" or "+254-712-345678"
+        country_code (str): Calling code for numbers without one
+
+    Returns:
+        Optional[str]: E.164 number such as "+254712345678", or None if it is not a phone number
+    """
+    if not raw:
+        return None
+    number = PHONE_SEPARATORS.sub("", raw.strip())
+    if number.startswith("00"):
+        number = "+" + number[2:]
+    elif number.startswith("0"):
+        number = f"+{country_code}{number[1:]}"
+    elif not number.startswith("+") and len(number) == 9:
+        # Subscriber number without the trunk 0
+        number = f"+{country_code}{number}"
+    elif number.startswith(country_code):
+        number = "+" + number
+    return number if E164.fullmatch(number) else None
+
+
+def normalize_stored_phones(conn: Connection, country_code: str) -> int:
+    """
+    Rewrite phone numbers stored as typed (e.g. "0712 345 678") to E.164.
+    An explicit one-off step (python user_onboarding.py --normalize-stored-phones
+    --country-code 254): local numbers carry no country, so the operator
+    says which one they belong to. Numbers that do not parse, or whose E.164
+    form belongs to another user, are kept; logins still find them as stored.
+
+    Args:
+        conn (Connection): Connection inside a transaction
+        country_code (str): Calling code for local numbers
+
+    Returns:
+        int: Number of users updated
+    """
+    users = User.__table__
+    stored = users.c.phone_number
+    rows = conn.execute(
+        select(users.c.id, stored).where(or_(
+            ~stored.startswith("+"), *[stored.contains(c) for c in (" ", "-", "(", ")", ".")]
+        ))
+    ).all()
+    changes: Dict[str, int] = {}
+    for user_id, raw in rows:
+        phone = normalize_phone(raw, country_code)
+        if phone is not None and phone != raw and phone not in changes:
+            changes[phone] = user_id
+    if changes:
+        taken = set(conn.scalars(select(stored).where(stored.in_(list(changes)))))
+        updates = [{"user_id": user_id, "phone": phone} for phone, user_id in changes.items() if phone not in taken]
+        if updates:
+            conn.execute(
+                update(users).where(users.c.id == bindparam("user_id")).values(phone_number=bindparam("phone")),
+                updates,
+            )
+            logger.info(f"🧑‍🌾 Normalized {len(updates)} stored phone number(s) to E.164")
+        return len(updates)
+    return 0
+
+
+@dataclass
+class OnboardingReport:
+    """Outcome of one member import"""
+
+    received: int = 0
+    created: int = 0
+    existing: int = 0
+    rejected: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    created_phones: List[str] = field(default_factory=list)
+
+    def error(self, row: int, phone_number: Optional[str], message: str):
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "phone_number": phone_number, "error": message})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "received": self.received,
+            "created": self.created,
+            "existing": self.existing,
+            "rejected": self.rejected,
+            "chunks": self.chunks,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.received / self.seconds) if self.seconds else None,
+            "errors": self.errors,
+        }
+
+
+def _chunks(reader: Iterable[Dict[str, str]], size: int) -> Iterator[List[Dict[str, str]]]:
+    chunk: List[Dict[str, str]] = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _insert_users(db: Session, users: List[Dict[str, Any]]):
+    dialects = {"sqlite": sqlite, "postgresql": postgresql}
+    dialect = dialects.get(db.get_bind().dialect.name)
+    if dialect is None:
+        db.execute(insert(User), users)
+    else:
+        # A signup racing the import for the same number keeps its row
+        db.execute(dialect.insert(User).on_conflict_do_nothing(index_elements=["phone_number"]), users)
+
+
+def onboard_csv(
+    stream: TextIO,
+    session_factory: Callable[[], Session] = SessionLocal,
+    country_code: str = ONBOARDING_DEFAULT_COUNTRY_CODE,
+    chunk_rows: int = ONBOARDING_CHUNK_ROWS,
+) -> OnboardingReport:
+    """
+    Import members from a CSV stream.
+
+    Args:
+        stream (TextIO): CSV text with name and phone_number (or phone) columns
+        session_factory (Callable[[], Session]): Sync session factory
+        country_code (str): Calling code for local numbers
+        chunk_rows (int): Members per query and transaction
+
+    Returns:
+        OnboardingReport: Counts and the per-row errors
+
+    Raises:
+        ValueError: If the CSV lacks a name or phone number column
+    """
+    started = time.perf_counter()
+    reader = csv.DictReader(stream)
+    columns = {(name or "").strip().lower(): name for name in reader.fieldnames or []}
+    phone_column = columns.get("phone_number") or columns.get("phone")
+    name_column = columns.get("name")
+    password_column = columns.get("password")
+    if phone_column is None or name_column is None:
+        raise ValueError("CSV needs name and phone_number columns")
+
+    report = OnboardingReport()
+    seen = set()
+    row_number = 1  # The header is row 1
+    with session_factory() as db:
+        for chunk in _chunks(reader, chunk_rows):
+            candidates: Dict[str, Dict[str, Any]] = {}
+            rows_by_phone: Dict[str, int] = {}
+            # Members who signed up before numbers were normalized are stored as typed
+            phone_by_raw: Dict[str, str] = {}
+            for row in chunk:
+                row_number += 1
+                report.received += 1
+                raw_phone = row.get(phone_column)
+                name = (row.get(name_column) or "").strip()
+                phone = normalize_phone(raw_phone, country_code)
+                if phone is None:
+                    message = "invalid phone number"
+                elif not name:
+                    message = "missing name"
+                elif phone in seen:
+                    message = "duplicate phone number in file"
+                else:
+                    seen.add(phone)
+                    password = (row.get(password_column) or "").strip() if password_column else ""
+                    candidates[phone] = {"name": name, "phone_number": phone, "password": password or None}
+                    rows_by_phone[phone] = row_number
+                    if raw_phone.strip() != phone:
+                        phone_by_raw[raw_phone.strip()] = phone
+                    continue
+                report.rejected += 1
+                report.error(row_number, raw_phone, message)
+
+            if candidates:
+                stored = db.scalars(select(User.phone_number).where(
+                    User.phone_number.in_(list(candidates) + list(phone_by_raw))
+                ))
+                existing = {phone_by_raw.get(value, value) for value in stored}
+                for phone in existing & set(candidates):
+                    del candidates[phone]
+                    report.existing += 1
+                    report.error(rows_by_phone[phone], phone, "phone number already registered")
+                if candidates:
+                    _insert_users(db, list(candidates.values()))
+                db.commit()
+                report.created += len(candidates)
+                report.created_phones.extend(candidates)
+            report.chunks += 1
+
+    report.errors.sort(key=lambda error: error["row"])
+    report.seconds = time.perf_counter() - started
+    logger.info(
+        f"🧑‍🌾 Onboarded {report.created}/{report.received} members "
+        f"({report.existing} existing, {report.rejected} rejected) in {report.seconds:.2f}s"
+    )
+    return report
+
+
+def onboard_bytes(body: bytes, session_factory: Callable[[], Session] = SessionLocal, **kwargs) -> OnboardingReport:
+    """Import members from an uploaded CSV body"""
+    with io.TextIOWrapper(io.BytesIO(body), encoding="utf-8-sig", newline="") as stream:
+        return onboard_csv(stream, session_factory, **kwargs)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Import cooperative members into the users table")
+    parser.add_argument("csv_file", nargs="?", help="CSV with name and phone_number columns (optional password)")
+    parser.add_argument("--country-code", default=ONBOARDING_DEFAULT_COUNTRY_CODE, help="Calling code for local numbers")
+    parser.add_argument("--chunk-rows", type=int, default=ONBOARDING_CHUNK_ROWS, help="Members per transaction")
+    parser.add_argument(
+        "--normalize-stored-phones", action="store_true",
+        help="Rewrite numbers stored as typed to E.164 using --country-code, then exit"
+    )
+    args = parser.parse_args()
+
+    init_db()
+    if args.normalize_stored_phones:
+        with engine.begin() as conn:
+            updated = normalize_stored_phones(conn, args.country_code)
+        print(json.dumps({"normalized": updated}))
+        return
+    if not args.csv_file:
+        parser.error("csv_file is required")
+    with open(args.csv_file, encoding="utf-8-sig", newline="") as stream:
+        report = onboard_csv(stream, country_code=args.country_code, chunk_rows=args.chunk_rows)
+    print(json.dumps(report.to_dict(), indent=2))
+    sys.exit(1 if report.rejected else 0)
+
+
+if __name__ == "__main__":
+    main()
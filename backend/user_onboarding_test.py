@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+User Onboarding Tests
+Checks phone normalization, deduplication and the per-row error report
+"""
+
+import asyncio
+import io
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from database import Base, User, create_async_db_engine
+from user_onboarding import normalize_phone, normalize_stored_phones, onboard_csv
+from user_service import PhoneAlreadyRegistered, UserService
+
+
+def make_sessions(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'members.db'}")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def test_phone_numbers_are_normalized():
+    for raw in ("0712 345 678", "254712345678", "+254-712-345-678", "(0712) 345.678", "712345678", "00254712345678"):
+        assert normalize_phone(raw) == "+254712345678", raw
+    assert normalize_phone("082 123 4567", country_code="27") == "+27821234567"
+    for raw in ("", None, "12345", "call me", "+0712345678"):
+        assert normalize_phone(raw) is None, raw
+
+
+def test_report_lists_every_rejected_row(tmp_path):
+    sessions = make_sessions(tmp_path)
+    with sessions() as db:
+        db.add(User(name="Existing", phone_number="+254700000001", password="pw"))
+        db.commit()
+
+    csv = (
+        "Name,Phone_Number\n"
+        "Existing Again,0700 000 001\n"
+        "Wanjiku,0700000002\n"
+        "Wanjiku Twice,+254700000002\n"
+        "Nobody,not-a-phone\n"
+        ",0700000003\n"
+        "Otieno,0700000004\n"
+    )
+    report = onboard_csv(io.StringIO(csv), sessions, chunk_rows=2)
+
+    assert (report.received, report.created, report.existing, report.rejected) == (6, 2, 1, 3)
+    assert [(e["row"], e["error"]) for e in report.errors] == [
+        (2, "phone number already registered"),
+        (4, "duplicate phone number in file"),
+        (5, "invalid phone number"),
+        (6, "missing name"),
+    ]
+    with sessions() as db:
+        assert {u.phone_number for u in db.query(User)} == {"+254700000001", "+254700000002", "+254700000004"}
+
+
+def test_fifty_thousand_members_import_in_seconds(tmp_path):
+    sessions = make_sessions(tmp_path)
+    csv = "name,phone_number\n" + "".join(f"Member {i},07{i:08d}\n" for i in range(50_000))
+
+    started = time.perf_counter()
+    report = onboard_csv(io.StringIO(csv), sessions)
+    assert time.perf_counter() - started < 10
+    assert report.created == 50_000 and report.chunks == 10
+
+    # A second import only finds existing members
+    again = onboard_csv(io.StringIO(csv), sessions)
+    assert again.created == 0 and again.existing == 50_000
+
+
+def test_onboarded_members_log_in_with_their_local_number(tmp_path):
+    sessions = make_sessions(tmp_path)
+    with sessions() as db:
+        # Stored as typed before signups were normalized
+        db.add(User(name="Early Signup", phone_number="0700 000 009", password="pw"))
+        db.commit()
+        normalize_stored_phones(db.connection(), "254")
+        db.commit()
+
+    onboard_csv(io.StringIO("name,phone_number,password\nWanjiku,+254700000005,secret\n"), sessions)
+    async_engine = create_async_db_engine(f"sqlite:///{tmp_path / 'members.db'}")
+    service = UserService(async_sessionmaker(async_engine, expire_on_commit=False), secret_key="test-secret-0123456789abcdefghijklmnopqrstuvwxyz")
+
+    async def run():
+        try:
+            member = await service.authenticate("0700 000 005", "secret")
+            early = await service.authenticate("+254700000009", "pw")
+            try:
+                await service.register("Wanjiku Again", "0700000005", "pw")
+                duplicate = False
+            except PhoneAlreadyRegistered:
+                duplicate = True
+            return member, early, duplicate
+        finally:
+            await async_engine.dispose()
+
+    member, early, duplicate = asyncio.run(run())
+    assert member is not None and member.phone_number == "+254700000005"
+    assert early is not None and early.name == "Early Signup"
+    assert duplicate
@@ -0,0 +1,254 @@
+"""
+👤 User Service
+Registration, login and session tokens for the users table.
+
+Phone numbers are normalized to E.164 on every path (signup, login and
+bulk onboarding), so "0712 345 678" and "+254712345678" are one member.
+Local numbers are read with the signing-up user's country; logins try
+each served country and the number exactly as stored, so members who
+signed up before normalization (or with numbers that do not parse) keep
+logging in.
+Registration is a single INSERT .. ON CONFLICT DO NOTHING, so a duplicate
+phone number costs one round trip and concurrent signups cannot race.
+Logins read user records through a bounded in-process cache that every
+write through this service invalidates. A successful login issues an
+HMAC-signed session token that later calls verify without touching the
+users table.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import AsyncSessionLocal, User
+from env_validator import secret_key_problem
+from user_onboarding import ONBOARDING_DEFAULT_COUNTRY_CODE, PHONE_SEPARATORS, normalize_phone
+from weather_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Session tokens are signed with SECRET_KEY; without a real one no tokens are issued
+SECRET_KEY = os.getenv("SECRET_KEY", "")
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+
+# Cooperative admins allowed to bulk-onboard members: comma-separated phone numbers
+COOPERATIVE_ADMIN_PHONES = os.getenv("COOPERATIVE_ADMIN_PHONES", "")
+
+# Cached user records: max entries, and how long (seconds) another worker's writes can go unseen
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "300"))
+
+
+class PhoneAlreadyRegistered(Exception):
+    """Raised when registering a phone number that already has a user"""
+
+
+class SessionTokenError(Exception):
+    """Raised for a session token that is malformed, tampered with or expired"""
+
+
+class SessionKeyError(Exception):
+    """Raised when issuing a session token while SECRET_KEY is missing or a placeholder"""
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """The user fields needed to log in"""
+
+    id: int
+    name: str
+    phone_number: str
+    password: str
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class UserService:
+    """User registration, cached login lookups and signed session tokens"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        secret_key: Optional[str] = None,
+        token_ttl_seconds: int = ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        cache: Optional[TTLCache] = None,
+        country_codes: Sequence[str] = (ONBOARDING_DEFAULT_COUNTRY_CODE,),
+        admin_phones: Iterable[str] = COOPERATIVE_ADMIN_PHONES.split(","),
+    ):
+        self.session_factory = session_factory
+        # Calling codes of the countries served, the default first
+        self.country_codes = list(dict.fromkeys(country_codes))
+        self.admin_phones = {
+            candidate for phone in admin_phones if phone.strip() for candidate in self._phone_candidates(phone)[:1]
+        }
+        secret_key = secret_key or SECRET_KEY
+        # A placeholder key would let anyone forge session tokens, so none are issued or accepted
+        self.secret_key_problem = secret_key_problem(secret_key)
+        if self.secret_key_problem:
+            logger.error(f"❌ {self.secret_key_problem}: logins are disabled until a real SECRET_KEY is set")
+        self._secret = None if self.secret_key_problem else secret_key.encode()
+        self.token_ttl_seconds = token_ttl_seconds
+        self.cache = cache or TTLCache(max_entries=USER_CACHE_SIZE, ttl_seconds=USER_CACHE_TTL_SECONDS)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.registrations = 0
+
+    def _insert(self, dialect_name: str, values: Dict[str, Any]):
+        dialects = {"sqlite": sqlite, "postgresql": postgresql}
+        dialect = dialects.get(dialect_name)
+        if dialect is None:
+            return insert(User).values(**values).returning(User.id)
+        return (
+            dialect.insert(User)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=["phone_number"])
+            .returning(User.id)
+        )
+
+    def _phone_candidates(self, phone_number: str) -> List[str]:
+        """Stored forms a typed number may have, most likely first"""
+        candidates = [normalize_phone(phone_number, code) for code in self.country_codes]
+        candidates += [phone_number.strip(), PHONE_SEPARATORS.sub("", phone_number)]
+        return [phone for phone in dict.fromkeys(candidates) if phone]
+
+    async def register(self, name: str, phone_number: str, password: str, country_code: Optional[str] = None) -> int:
+        """
+        Create a user in one statement.
+
+        Args:
+            name (str): Display name
+            phone_number (str): Unique login phone number, stored as E.164 when it parses
+            password (str): Password
+            country_code (Optional[str]): Calling code for a local number (default: the first served country)
+
+        Returns:
+            int: The new user's id
+
+        Raises:
+            ValueError: If the phone number is empty
+            PhoneAlreadyRegistered: If the phone number is taken
+        """
+        typed = phone_number.strip()
+        if not typed:
+            raise ValueError("Phone number is required")
+        phone_number = normalize_phone(typed, country_code or self.country_codes[0]) or typed
+        values = {"name": name, "phone_number": phone_number, "password": password}
+        async with self.session_factory() as db:
+            stmt = self._insert(db.bind.dialect.name, values)
+            try:
+                user_id = (await db.execute(stmt)).scalar_one_or_none()
+                await db.commit()
+            except IntegrityError:
+                # Databases without ON CONFLICT report the duplicate as a unique violation
+                user_id = None
+        self.invalidate([phone_number])
+        if user_id is None:
+            raise PhoneAlreadyRegistered(phone_number)
+        self.registrations += 1
+        return user_id
+
+    def invalidate(self, phone_numbers: Iterable[str]):
+        """Drop cached records after users are written"""
+        for phone_number in phone_numbers:
+            self.cache.delete(phone_number)
+
+    async def get_by_phone(self, phone_number: str) -> Optional[CachedUser]:
+        """Look up a user by any form of their phone number, reading the database only on a cache miss"""
+        candidates = self._phone_candidates(phone_number)
+        for phone in candidates:
+            user = self.cache.get(phone)
+            if user is not None:
+                self.cache_hits += 1
+                return user
+        if not candidates:
+            return None
+        self.cache_misses += 1
+        async with self.session_factory() as db:
+            rows = (await db.execute(
+                select(User.id, User.name, User.phone_number, User.password).where(User.phone_number.in_(candidates))
+            )).all()
+        if not rows:
+            return None
+        row = min(rows, key=lambda r: candidates.index(r.phone_number))
+        user = CachedUser(row.id, row.name, row.phone_number, row.password)
+        self.cache.set(row.phone_number, user)
+        return user
+
+    async def authenticate(self, phone_number: str, password: str) -> Optional[CachedUser]:
+        """The user if the phone number and password match, else None"""
+        user = await self.get_by_phone(phone_number)
+        if user is None or user.password is None:
+            return None
+        if not hmac.compare_digest(user.password.encode(), password.encode()):
+            return None
+        return user
+
+    def _sign(self, payload: str) -> str:
+        return _b64encode(hmac.new(self._secret, payload.encode(), hashlib.sha256).digest())
+
+    def issue_token(self, user: CachedUser) -> str:
+        """
+        Signed session token carrying the user id, phone number and expiry.
+
+        Raises:
+            SessionKeyError: If SECRET_KEY is missing or a placeholder
+        """
+        if self._secret is None:
+            raise SessionKeyError(self.secret_key_problem)
+        claims = {"sub": user.id, "phone": user.phone_number, "exp": int(time.time()) + self.token_ttl_seconds}
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+        return f"{payload}.{self._sign(payload)}"
+
+    def verify_token(self, token: str) -> Dict[str, Any]:
+        """
+        Check a session token's signature and expiry.
+
+        Returns:
+            Dict[str, Any]: The token claims (sub, phone, exp)
+
+        Raises:
+            SessionTokenError: If the token is malformed, tampered with or expired
+        """
+        if self._secret is None:
+            raise SessionTokenError("Session tokens are disabled: SECRET_KEY is not configured")
+        payload, _, signature = token.partition(".")
+        if not payload or not signature or not hmac.compare_digest(signature, self._sign(payload)):
+            raise SessionTokenError("Invalid session token")
+        try:
+            claims = json.loads(_b64decode(payload))
+        except ValueError:
+            raise SessionTokenError("Invalid session token")
+        if claims.get("exp", 0) < time.time():
+            raise SessionTokenError("Session token expired")
+        return claims
+
+    def is_admin(self, claims: Dict[str, Any]) -> bool:
+        """Whether verified token claims belong to a cooperative admin (COOPERATIVE_ADMIN_PHONES)"""
+        return claims.get("phone") in self.admin_phones
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "cached_users": len(self.cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": round(self.cache_hits / lookups, 4) if lookups else None,
+            "registrations": self.registrations,
+        }
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+User Service Tests
+Checks single-statement registration, cached logins and session tokens
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from database import Base, User, create_async_db_engine
+from user_service import CachedUser, PhoneAlreadyRegistered, SessionKeyError, SessionTokenError, UserService
+
+TEST_SECRET = "test-secret-0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def run_with_service(tmp_path, scenario, **kwargs):
+    url = f"sqlite:///{tmp_path / 'users.db'}"
+    Base.metadata.create_all(bind=create_engine(url))
+    async_engine = create_async_db_engine(url)
+    service = UserService(async_sessionmaker(async_engine, expire_on_commit=False), secret_key=TEST_SECRET, **kwargs)
+
+    async def run():
+        try:
+            return await scenario(service)
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(run()), service
+
+
+def test_concurrent_signups_create_one_user(tmp_path):
+    async def scenario(service):
+        return await asyncio.gather(
+            *[service.register("Farmer", "+254700000001", "pw") for _ in range(5)],
+            return_exceptions=True,
+        )
+
+    results, service = run_with_service(tmp_path, scenario)
+    assert sum(isinstance(r, int) for r in results) == 1
+    assert sum(isinstance(r, PhoneAlreadyRegistered) for r in results) == 4
+
+
+def test_logins_are_served_from_the_cache(tmp_path):
+    async def scenario(service):
+        await service.register("Farmer", "+254700000002", "pw")
+        first = await service.authenticate("+254700000002", "pw")
+        second = await service.authenticate("+254700000002", "pw")
+        wrong = await service.authenticate("+254700000002", "nope")
+        missing = await service.authenticate("+254700000003", "pw")
+        return first, second, wrong, missing
+
+    (first, second, wrong, missing), service = run_with_service(tmp_path, scenario)
+    assert first is not None and second == first
+    assert wrong is None and missing is None
+    assert service.cache_misses == 2 and service.cache_hits == 2
+
+    service.invalidate(["+254700000002"])
+    assert len(service.cache) == 0
+
+
+def test_session_tokens_are_signed_and_expire(tmp_path):
+    async def scenario(service):
+        user_id = await service.register("Farmer", "+254700000004", "pw")
+        return user_id, service.issue_token(await service.authenticate("+254700000004", "pw"))
+
+    (user_id, token), service = run_with_service(tmp_path, scenario)
+    claims = service.verify_token(token)
+    assert claims["sub"] == user_id and claims["phone"] == "+254700000004"
+
+    payload, _, signature = token.partition(".")
+    with pytest.raises(SessionTokenError):
+        service.verify_token(payload[:-2] + "xx." + signature)
+    with pytest.raises(SessionTokenError):
+        UserService(secret_key=TEST_SECRET[::-1]).verify_token(token)
+
+    expired = UserService(secret_key=TEST_SECRET, token_ttl_seconds=-1)
+    with pytest.raises(SessionTokenError, match="expired"):
+        expired.verify_token(expired.issue_token(service.cache.get("+254700000004")))
+
+
+def test_placeholder_secret_keys_disable_session_tokens():
+    placeholder = UserService(secret_key="your_super_secret_key_here")
+    assert placeholder.secret_key_problem == "SECRET_KEY still has a placeholder value"
+    with pytest.raises(SessionKeyError, match="placeholder"):
+        placeholder.issue_token(CachedUser(1, "Farmer", "+254700000005", "pw"))
+    # Tokens signed with the published placeholder do not verify
+    payload = base64.urlsafe_b64encode(b'{"sub":1,"phone":"+254700000005","exp":9999999999}').rstrip(b"=").decode()
+    placeholder_signature = base64.urlsafe_b64encode(
+        hmac.new(b"your_super_secret_key_here", payload.encode(), hashlib.sha256).digest()
+    ).rstrip(b"=").decode()
+    with pytest.raises(SessionTokenError):
+        placeholder.verify_token(f"{payload}.{placeholder_signature}")
+
+
+def test_logins_and_readiness_fail_without_a_real_secret_key(monkeypatch):
+    TestClient = pytest.importorskip("fastapi.testclient").TestClient
+    import main_api
+
+    service = UserService(secret_key="changeme")
+    monkeypatch.setattr(main_api, "user_service", service)
+
+    async def member(phone_number, password):
+        return CachedUser(1, "Farmer", phone_number, password)
+
+    monkeypatch.setattr(service, "authenticate", member)
+    login = TestClient(main_api.app).post("/login/", json={"phone_number": "+254700000006", "password": "pw"})
+    assert login.status_code == 503 and "SECRET_KEY" in login.json()["detail"]
+    with pytest.raises(RuntimeError, match="SECRET_KEY"):
+        asyncio.run(main_api.check_session_key())
+
+
+def test_local_numbers_use_the_users_country(tmp_path):
+    async def scenario(service):
+        user_id = await service.register("Vhembe Farmer", "082 123 4567", "pw", country_code="27")
+        return user_id, await service.authenticate("0821234567", "pw")
+
+    (user_id, user), service = run_with_service(tmp_path, scenario, country_codes=("254", "27"))
+    assert user is not None and user.id == user_id
+    assert user.phone_number == "+27821234567"
+
+
+def test_numbers_stored_as_typed_still_log_in(tmp_path):
+    url = f"sqlite:///{tmp_path / 'users.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        # Signups from before normalization, including numbers it cannot parse
+        db.add_all([
+            User(name="Old Signup", phone_number="27821234567", password="pw1"),
+            User(name="Visitor", phone_number="15551234567", password="pw2"),
+            User(name="Local", phone_number="0712345678", password="pw3"),
+        ])
+        db.commit()
+
+    async def scenario(service):
+        return (
+            await service.authenticate("27821234567", "pw1"),
+            await service.authenticate("15551234567", "pw2"),
+            await service.authenticate("0712 345 678", "pw3"),
+            await service.register("New Visitor", "15557654321", "pw"),
+        )
+
+    (old, visitor, local, new_id), service = run_with_service(tmp_path, scenario)
+    assert old.name == "Old Signup" and visitor.name == "Visitor" and local.name == "Local"
+    assert isinstance(new_id, int)
+
+
+def test_only_cooperative_admins_may_bulk_onboard(monkeypatch):
+    TestClient = pytest.importorskip("fastapi.testclient").TestClient
+    import main_api
+
+    service = UserService(secret_key=TEST_SECRET, admin_phones=["0712 000 001", ""])
+    assert service.admin_phones == {"+254712000001"}
+    monkeypatch.setattr(main_api, "user_service", service)
+    client = TestClient(main_api.app)
+
+    def bulk(phone):
+        token = service.issue_token(CachedUser(id=1, name="Member", phone_number=phone, password="pw"))
+        return client.post("/users/bulk?country_code=x", content=b"", headers={"Authorization": f"Bearer {token}"})
+
+    member = bulk("+254700000009")
+    assert member.status_code == 403 and member.json()["detail"] == "Cooperative admin access required"
+    # An admin token gets past the role check to the request validation
+    assert bulk("+254712000001").status_code == 400
@@ -0,0 +1,249 @@
+"""
+🗄️ Weather Cache
+TTL + LRU cache for Open-Meteo daily values keyed by (location, date),
+with an optional Redis tier and request coalescing so concurrent misses
+for the same days trigger a single upstream call.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis is optional
+    aioredis = None
+
+from open_meteo import OpenMeteoError
+
+logger = logging.getLogger(__name__)
+
+WEATHER_CACHE_TTL_SECONDS = int(os.getenv("WEATHER_CACHE_TTL_SECONDS", "1800"))
+WEATHER_CACHE_MAX_ENTRIES = int(os.getenv("WEATHER_CACHE_MAX_ENTRIES", "10000"))
+REDIS_URL = os.getenv("REDIS_URL")
+
+DailyFetcher = Callable[[float, float, date, date], Awaitable[Dict[str, Any]]]
+
+T = TypeVar("T")
+
+
+class RequestCoalescer:
+    """
+    Shares one in-flight call between identical concurrent requests.
+
+    The call runs as its own task and every caller awaits it through
+    asyncio.shield, so a caller that is cancelled (client disconnect,
+    wait_for timeout) leaves the call running for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await the in-flight call for key, starting it if there is none.
+
+        Args:
+            key (Hashable): Identifies identical requests
+            call (Callable[[], Awaitable[T]]): Starts the upstream work
+
+        Returns:
+            T: What the shared call returned
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: "asyncio.Task[Any]"):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+class TTLCache:
+    """In-process LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, max_entries: int = WEATHER_CACHE_MAX_ENTRIES, ttl_seconds: float = WEATHER_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class WeatherCache:
+    """
+    Two-tier cache for Open-Meteo daily values.
+
+    Each day is cached separately, so a range request only goes upstream
+    for the span of days that are missing.
+    """
+
+    def __init__(self, local: Optional[TTLCache] = None, redis_url: Optional[str] = REDIS_URL):
+        self.local = local or TTLCache()
+        self.redis = None
+        if redis_url:
+            if aioredis is None:
+                logger.warning("⚠️ REDIS_URL is set but the redis package is not installed, using in-process cache only")
+            else:
+                self.redis = aioredis.from_url(redis_url, decode_responses=True)
+                logger.info("✅ Weather cache: Redis tier enabled")
+        self._inflight = RequestCoalescer()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.upstream_calls = 0
+        self.redis_hits = 0
+        self.redis_errors = 0
+
+    @staticmethod
+    def _key(lat: float, lon: float, day: date) -> str:
+        return f"open-meteo:{lat:.4f},{lon:.4f}:{day}"
+
+    async def _redis_get(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        if self.redis is None or not keys:
+            return [None] * len(keys)
+        try:
+            values = await self.redis.mget(keys)
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"⚠️ Redis read failed: {e}")
+            return [None] * len(keys)
+        return [json.loads(v) if v else None for v in values]
+
+    async def _redis_set(self, items: Dict[str, Dict[str, Any]]):
+        if self.redis is None or not items:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, json.dumps(value), ex=int(self.local.ttl_seconds))
+                await pipe.execute()
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"⚠️ Redis write failed: {e}")
+
+    async def _fetch_span(self, fetch: DailyFetcher, lat: float, lon: float, start: date, end: date) -> Dict[str, Any]:
+        """Fetch a span upstream, sharing the call with identical in-flight requests"""
+        span_key = (round(lat, 4), round(lon, 4), start, end)
+        if span_key in self._inflight:
+            self.coalesced += 1
+        else:
+            self.upstream_calls += 1
+        return await self._inflight.run(span_key, lambda: fetch(lat, lon, start, end))
+
+    async def get_daily(self, lat: float, lon: float, start: date, end: date, fetch: DailyFetcher) -> Dict[str, Any]:
+        """
+        Get daily values for [start, end], going upstream only for missing days.
+
+        Args:
+            lat (float): Latitude
+            lon (float): Longitude
+            start (date): First day (inclusive)
+            end (date): Last day (inclusive)
+            fetch (DailyFetcher): Upstream call returning an Open-Meteo "daily" block
+
+        Returns:
+            Dict[str, Any]: A "daily" block covering every requested day
+        """
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        keys = [self._key(lat, lon, day) for day in days]
+        values: List[Optional[Dict[str, Any]]] = [self.local.get(key) for key in keys]
+
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            from_redis = await self._redis_get([keys[i] for i in missing])
+            for i, value in zip(missing, from_redis):
+                if value is not None:
+                    self.redis_hits += 1
+                    self.local.set(keys[i], value)
+                    values[i] = value
+            missing = [i for i in missing if values[i] is None]
+
+        self.hits += len(days) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            span_start, span_end = days[missing[0]], days[missing[-1]]
+            daily = await self._fetch_span(fetch, lat, lon, span_start, span_end)
+            fetched = {}
+            for i, day in enumerate(daily["time"]):
+                value = {
+                    "time": day,
+                    "temperature_2m_max": daily["temperature_2m_max"][i],
+                    "precipitation_sum": daily["precipitation_sum"][i],
+                }
+                key = self._key(lat, lon, date.fromisoformat(day))
+                self.local.set(key, value)
+                fetched[key] = value
+            await self._redis_set(fetched)
+            for i in missing:
+                values[i] = fetched.get(keys[i])
+
+        if any(value is None for value in values):
+            raise OpenMeteoError("Open-Meteo response did not cover every requested day")
+
+        return {
+            "time": [v["time"] for v in values],
+            "temperature_2m_max": [v["temperature_2m_max"] for v in values],
+            "precipitation_sum": [v["precipitation_sum"] for v in values],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for /health"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": "redis+memory" if self.redis is not None else "memory",
+            "entries": len(self.local),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "coalesced_requests": self.coalesced,
+            "upstream_calls": self.upstream_calls,
+            "redis_hits": self.redis_hits,
+            "redis_errors": self.redis_errors,
+        }
+
+    async def close(self):
+        if self.redis is not None:
+            await self.redis.aclose()
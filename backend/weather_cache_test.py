@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Weather Cache Tests
+Checks TTL/LRU eviction, per-day caching and request coalescing
+"""
+
+import asyncio
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from weather_cache import TTLCache, WeatherCache
+
+
+class FakeUpstream:
+    """Counts calls and returns deterministic daily values"""
+
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+
+    async def __call__(self, lat, lon, start, end):
+        self.calls.append((start, end))
+        await asyncio.sleep(self.delay)
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        return {
+            "time": [str(d) for d in days],
+            "temperature_2m_max": [20.0 + d.day for d in days],
+            "precipitation_sum": [float(d.day) for d in days],
+        }
+
+
+def test_ttl_cache_expires_and_evicts_lru():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    expired = TTLCache(max_entries=2, ttl_seconds=0)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+
+
+def test_range_only_fetches_missing_days():
+    cache = WeatherCache(redis_url=None)
+    upstream = FakeUpstream()
+    start = date(2025, 1, 1)
+
+    async def run():
+        await cache.get_daily(-1.5, 37.2, start, start + timedelta(days=2), upstream)
+        return await cache.get_daily(-1.5, 37.2, start, start + timedelta(days=4), upstream)
+
+    daily = asyncio.run(run())
+
+    assert daily["time"] == [str(start + timedelta(days=i)) for i in range(5)]
+    assert upstream.calls == [(start, start + timedelta(days=2)), (start + timedelta(days=3), start + timedelta(days=4))]
+    assert cache.stats()["hits"] == 3
+
+
+def test_concurrent_misses_share_one_upstream_call():
+    cache = WeatherCache(redis_url=None)
+    upstream = FakeUpstream(delay=0.05)
+    day = date(2025, 1, 1)
+
+    async def run():
+        return await asyncio.gather(*[cache.get_daily(-1.5, 37.2, day, day, upstream) for _ in range(10)])
+
+    results = asyncio.run(run())
+
+    assert len(upstream.calls) == 1
+    assert all(r == results[0] for r in results)
+    assert cache.stats()["coalesced_requests"] == 9
+
+
+def test_cancelled_leader_does_not_strand_followers():
+    cache = WeatherCache(redis_url=None)
+    upstream = FakeUpstream(delay=0.1)
+    day = date(2025, 1, 1)
+
+    async def run():
+        leader = asyncio.create_task(cache.get_daily(-1.5, 37.2, day, day, upstream))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(cache.get_daily(-1.5, 37.2, day, day, upstream))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.wait_for(follower, timeout=1)
+
+    daily = asyncio.run(run())
+
+    assert daily["time"] == [str(day)]
+    assert len(upstream.calls) == 1
+    assert cache.stats()["coalesced_requests"] == 1
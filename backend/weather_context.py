@@ -0,0 +1,134 @@
+"""
+🌦️ Weather Context
+Builds a compact weather summary for a location (today's values, the next
+14 days from Open-Meteo and the model outlook beyond that) to ground the
+weather-related assistant use cases. Each location's summary is built once
+per TTL and shared by every question asked in that window.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from model_registry import ModelRegistry
+from open_meteo import OpenMeteoClient
+from weather_cache import RequestCoalescer
+
+logger = logging.getLogger(__name__)
+
+WEATHER_CONTEXT_TTL_SECONDS = int(os.getenv("WEATHER_CONTEXT_TTL_SECONDS", "1800"))
+
+# Contexts built without live data are retried sooner
+DEGRADED_TTL_SECONDS = 60
+
+NEAR_DAYS = 14
+# Model outlook: OUTLOOK_MONTHS blocks of 30 days starting after the Open-Meteo horizon
+OUTLOOK_START_DAYS = 17
+OUTLOOK_MONTHS = 3
+
+
+class WeatherContextBuilder:
+    """TTL cache of per-location weather summaries for assistant prompts"""
+
+    def __init__(
+        self,
+        open_meteo: OpenMeteoClient,
+        model_registry: ModelRegistry,
+        ttl_seconds: float = WEATHER_CONTEXT_TTL_SECONDS,
+    ):
+        self.open_meteo = open_meteo
+        self.model_registry = model_registry
+        self.ttl_seconds = ttl_seconds
+        self._contexts: Dict[str, Tuple[float, str]] = {}
+        self._inflight = RequestCoalescer()
+        self.builds = 0
+        self.hits = 0
+
+    def _near_summary(self, daily: Dict[str, Any]) -> str:
+        rows = [
+            (day, t, r)
+            for day, t, r in zip(daily["time"], daily["temperature_2m_max"], daily["precipitation_sum"])
+            if t is not None and r is not None
+        ]
+        if not rows:
+            raise ValueError("No daily values")
+        temps = [t for _, t, _ in rows]
+        rain = [r for _, _, r in rows]
+        days = ", ".join(f"{day[5:]} {t:.0f}°C/{r:.1f}mm" for day, t, r in rows)
+        return (
+            f"Today ({rows[0][0]}): max {temps[0]}°C, rain {rain[0]}mm.\n"
+            f"Next {len(rows)} days: max temperature {min(temps):.0f}-{max(temps):.0f}°C, "
+            f"total rain {sum(rain):.0f}mm over {sum(1 for r in rain if r >= 1.0)} rainy days.\n"
+            f"Daily (date max/rain): {days}."
+        )
+
+    def _outlook_summary(self, location: str, today: date) -> str:
+        start = today + timedelta(days=OUTLOOK_START_DAYS)
+        days = [start + timedelta(days=i) for i in range(30 * OUTLOOK_MONTHS)]
+        temps = self.model_registry.predict_days(location, "temperature", days)
+        rain = self.model_registry.predict_days(location, "rain", days)
+        blocks = []
+        for month in range(OUTLOOK_MONTHS):
+            block = slice(30 * month, 30 * (month + 1))
+            blocks.append(
+                f"{days[block.start]:%d %b}-{days[block.stop - 1]:%d %b}: "
+                f"avg max {temps[block].mean():.1f}°C, ~{max(rain[block].sum(), 0.0):.0f}mm rain"
+            )
+        return "Model outlook: " + "; ".join(blocks) + "."
+
+    async def _build(self, location: str) -> Tuple[str, bool]:
+        """Returns (context, True if every part was available)"""
+        today = datetime.now().date()
+        coords = self.model_registry.locations[location]
+        lines = [f"Weather context for {location.title()} as of {today}:"]
+        complete = True
+        try:
+            daily = await self.open_meteo.fetch_daily(coords["lat"], coords["lon"], today, today + timedelta(days=NEAR_DAYS - 1))
+            lines.append(self._near_summary(daily))
+        except Exception as e:
+            logger.warning(f"⚠️ Live weather unavailable for context: {e}")
+            lines.append("Live and 14-day forecast data are currently unavailable.")
+            complete = False
+        try:
+            lines.append(await asyncio.to_thread(self._outlook_summary, location, today))
+        except Exception as e:
+            logger.warning(f"⚠️ Model outlook unavailable for context: {e}")
+            complete = False
+        self.builds += 1
+        return "\n".join(lines), complete
+
+    async def get(self, location: str) -> Optional[str]:
+        """
+        Get the weather context for a location, building it at most once per TTL.
+
+        Args:
+            location (str): Location name from the catalog
+
+        Returns:
+            Optional[str]: The context, or None for an unknown location
+        """
+        location = location.lower()
+        if location not in self.model_registry.locations:
+            return None
+
+        cached = self._contexts.get(location)
+        if cached is not None and cached[0] > time.monotonic():
+            self.hits += 1
+            return cached[1]
+
+        # Concurrent questions for the same location share one build
+        if location in self._inflight:
+            self.hits += 1
+        return await self._inflight.run(location, lambda: self._build_and_store(location))
+
+    async def _build_and_store(self, location: str) -> str:
+        context, complete = await self._build(location)
+        ttl = self.ttl_seconds if complete else min(self.ttl_seconds, DEGRADED_TTL_SECONDS)
+        self._contexts[location] = (time.monotonic() + ttl, context)
+        return context
+
+    def stats(self) -> Dict[str, Any]:
+        return {"locations": len(self._contexts), "builds": self.builds, "hits": self.hits}
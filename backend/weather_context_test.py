@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Weather Context Tests
+Checks that the context is built once per location and injected into the
+weather use cases' prompts
+"""
+
+import asyncio
+import json
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import httpx
+import numpy as np
+import pytest
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+pytest.importorskip("groq")
+
+from assistant_engine import AssistantEngine
+from weather_context import WeatherContextBuilder
+
+
+class FakeOpenMeteo:
+    def __init__(self):
+        self.calls = 0
+
+    async def fetch_daily(self, lat, lon, start, end):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        return {
+            "time": [str(day) for day in days],
+            "temperature_2m_max": [24.0] * len(days),
+            "precipitation_sum": [2.5] * len(days),
+        }
+
+
+class FakeRegistry:
+    locations = {"machakos": {"lat": -1.5167, "lon": 37.2667}}
+
+    def predict_days(self, location, variable, days):
+        return np.full(len(days), 20.0 if variable == "temperature" else 1.0)
+
+
+def test_context_is_built_once_and_shared():
+    open_meteo = FakeOpenMeteo()
+    builder = WeatherContextBuilder(open_meteo, FakeRegistry())
+
+    async def run():
+        return await asyncio.gather(*[builder.get("Machakos") for _ in range(5)])
+
+    contexts = asyncio.run(run())
+    assert len(set(contexts)) == 1
+    assert open_meteo.calls == 1
+    assert "Next 14 days" in contexts[0] and "total rain 35mm over 14 rainy days" in contexts[0]
+    assert "Model outlook" in contexts[0] and "avg max 20.0°C, ~30mm rain" in contexts[0]
+    assert asyncio.run(builder.get("atlantis")) is None
+
+
+def test_cancelled_question_does_not_block_the_others():
+    open_meteo = FakeOpenMeteo()
+    builder = WeatherContextBuilder(open_meteo, FakeRegistry())
+
+    async def run():
+        first = asyncio.create_task(builder.get("machakos"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(builder.get("machakos"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await asyncio.wait_for(second, timeout=1)
+
+    assert "Next 14 days" in asyncio.run(run())
+    assert open_meteo.calls == 1 and builder.stats()["locations"] == 1
+
+
+def test_weather_use_cases_get_the_context():
+    prompts = []
+
+    def handler(request):
+        prompts.append(json.loads(request.content)["messages"][0]["content"])
+        return httpx.Response(200, json={"choices": [{"message": {"content": "Irrigate on Tuesday."}}]})
+
+    builder = WeatherContextBuilder(FakeOpenMeteo(), FakeRegistry())
+    engine = AssistantEngine(
+        api_key="gsk_test",
+        base_url="http://mock-llm/v1",
+        transport=httpx.MockTransport(handler),
+        weather_context=builder,
+    )
+
+    async def run():
+        await engine.generate("Should I irrigate this week?", "Weather-Based Farming", "machakos")
+        await engine.generate("Should I irrigate this week?", "Crop Management", "machakos")
+
+    asyncio.run(run())
+    assert "Weather context for Machakos" in prompts[0]
+    assert "Weather context" not in prompts[1]
+
+
+def test_grounded_weather_questions_skip_canned_answers():
+    prompts = []
+
+    def handler(request):
+        prompts.append(json.loads(request.content)["messages"][0]["content"])
+        return httpx.Response(200, json={"choices": [{"message": {"content": "Plant after Thursday's rain."}}]})
+
+    def make_engine(weather_context):
+        return AssistantEngine(
+            api_key="gsk_test",
+            base_url="http://mock-llm/v1",
+            transport=httpx.MockTransport(handler),
+            weather_context=weather_context,
+        )
+
+    question = "When should I plant maize given the weather forecast?"
+    grounded = make_engine(WeatherContextBuilder(FakeOpenMeteo(), FakeRegistry()))
+    ungrounded = make_engine(None)
+
+    async def run():
+        return (
+            await grounded.generate(question, "Weather-Based Farming", "machakos"),
+            await ungrounded.generate(question, "Weather-Based Farming", "machakos"),
+        )
+
+    with_context, without_context = asyncio.run(run())
+    assert with_context == "Plant after Thursday's rain." and len(prompts) == 1
+    assert "Weather context for Machakos" in prompts[0]
+    # Without live data the knowledge base still answers directly
+    assert without_context != with_context and ungrounded.local_answers == 1
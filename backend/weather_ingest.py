@@ -0,0 +1,226 @@
+"""
+📥 Weather Data Ingestion
+Bulk loading of weather observations and predictions into weather_data.
+
+Uploads are JSON arrays, NDJSON streams or CSV files in the Dataset/*.csv
+format (DATE,temperature,rain). Rows are parsed into a DataFrame, validated
+in one vectorized pass and upserted on their (location, date) key with one
+executemany per chunk, each chunk in its own transaction. pandas is
+imported on the first upload rather than with the API.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from forecast_store import upsert_weather_rows
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Rows written per transaction
+BULK_INGEST_CHUNK_ROWS = int(os.getenv("BULK_INGEST_CHUNK_ROWS", "5000"))
+# Largest accepted upload
+BULK_INGEST_MAX_BYTES = int(os.getenv("BULK_INGEST_MAX_BYTES", str(50 * 1024 * 1024)))
+
+# Rejected rows listed in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+# Plausible daily values
+TEMPERATURE_RANGE = (-60.0, 60.0)
+MAX_DAILY_RAIN_MM = 2000.0
+
+REQUIRED_COLUMNS = ("date", "temperature", "rain")
+
+
+@dataclass
+class IngestReport:
+    """Outcome of one bulk upload"""
+
+    received: int = 0
+    written: int = 0
+    rejected: int = 0
+    duplicates: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "received": self.received,
+            "written": self.written,
+            "rejected": self.rejected,
+            "duplicates": self.duplicates,
+            "chunks": self.chunks,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.received / self.seconds) if self.seconds else None,
+            "errors": self.errors,
+        }
+
+
+def parse_upload(body: bytes, content_type: str) -> pd.DataFrame:
+    """
+    Parse an upload into a DataFrame with lower-cased column names.
+
+    Args:
+        body (bytes): Request body
+        content_type (str): "application/json", "application/x-ndjson" or "text/csv"
+
+    Returns:
+        pd.DataFrame: One row per record, values not yet validated
+
+    Raises:
+        ValueError: If the body cannot be parsed or the content type is unsupported
+    """
+    import pandas as pd
+
+    media_type = content_type.split(";")[0].strip().lower()
+    try:
+        if media_type == "application/json":
+            records = json.loads(body)
+            if not isinstance(records, list):
+                raise ValueError("Expected a JSON array of records")
+            frame = pd.DataFrame.from_records(records)
+        elif media_type in ("application/x-ndjson", "application/ndjson", "application/jsonl"):
+            frame = pd.read_json(io.BytesIO(body), lines=True, dtype=False)
+        elif media_type in ("text/csv", "application/csv"):
+            frame = pd.read_csv(io.BytesIO(body), dtype=str, skipinitialspace=True)
+        else:
+            raise ValueError(f"Unsupported content type '{media_type}'")
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Could not parse upload: {e}")
+    frame.columns = [str(column).strip().lower() for column in frame.columns]
+    return frame
+
+
+def validate_rows(
+    frame: pd.DataFrame, locations: Collection[str], default_location: Optional[str] = None
+) -> Tuple[pd.DataFrame, List[Dict[str, Any]], int]:
+    """
+    Validate every row at once.
+
+    Args:
+        frame (pd.DataFrame): Parsed upload
+        locations (Collection[str]): Accepted location names (lower case)
+        default_location (Optional[str]): Location for rows without one
+
+    Returns:
+        Tuple[pd.DataFrame, List[Dict[str, Any]], int]: (valid rows with the last value per (location, date),
+        rejected rows as {"row", "error"}, number of rejected rows)
+
+    Raises:
+        ValueError: If a required column is missing
+    """
+    import pandas as pd
+
+    missing = [column for column in REQUIRED_COLUMNS if column not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+    if "location" in frame.columns:
+        location = frame["location"].astype("string").str.strip().str.lower()
+        if default_location:
+            location = location.fillna(default_location.lower())
+    elif default_location:
+        location = pd.Series(default_location.lower(), index=frame.index, dtype="string")
+    else:
+        raise ValueError("Rows have no location column; pass ?location=")
+
+    dates = pd.to_datetime(frame["date"], errors="coerce", format="mixed")
+    temperature = pd.to_numeric(frame["temperature"], errors="coerce")
+    rain = pd.to_numeric(frame["rain"], errors="coerce")
+
+    # The first failing check names the row's error
+    checks = [
+        (location.isna() | ~location.isin(list(locations)), "unsupported location"),
+        (dates.isna(), "invalid date"),
+        (temperature.isna(), "invalid temperature"),
+        (~temperature.between(*TEMPERATURE_RANGE), "temperature out of range"),
+        (rain.isna(), "invalid rain"),
+        (~rain.between(0.0, MAX_DAILY_RAIN_MM), "rain out of range"),
+    ]
+    error = pd.Series(pd.NA, index=frame.index, dtype="string")
+    for mask, message in reversed(checks):
+        error = error.mask(mask.fillna(True).astype(bool), message)
+    invalid = error.notna()
+
+    rejected = [
+        {"row": int(i) + 1, "error": message}
+        for i, message in error[invalid].head(MAX_REPORTED_ERRORS).items()
+    ]
+    valid = pd.DataFrame({
+        "location": location[~invalid].astype(str),
+        "date": dates[~invalid].dt.date,
+        "temperature": temperature[~invalid].astype(float),
+        "rain": rain[~invalid].astype(float),
+    })
+    # One statement cannot update the same key twice; the last row wins
+    valid = valid.drop_duplicates(subset=["location", "date"], keep="last")
+    return valid, rejected, int(invalid.sum())
+
+
+def write_rows(
+    session_factory: Callable[[], Session],
+    rows: pd.DataFrame,
+    source: str = "manual",
+    chunk_rows: int = BULK_INGEST_CHUNK_ROWS,
+) -> int:
+    """
+    Upsert validated rows in chunked transactions.
+
+    Returns:
+        int: Number of chunks written
+    """
+    records = rows.assign(source=source, model_version="").to_dict("records")
+    chunks = 0
+    with session_factory() as db:
+        for start in range(0, len(records), chunk_rows):
+            upsert_weather_rows(db, records[start:start + chunk_rows])
+            db.commit()
+            chunks += 1
+    return chunks
+
+
+def ingest(
+    body: bytes,
+    content_type: str,
+    session_factory: Callable[[], Session],
+    locations: Collection[str],
+    default_location: Optional[str] = None,
+    source: str = "manual",
+    chunk_rows: int = BULK_INGEST_CHUNK_ROWS,
+) -> IngestReport:
+    """
+    Parse, validate and upsert one upload.
+
+    Raises:
+        ValueError: If the upload cannot be parsed or lacks required columns
+    """
+    started = time.perf_counter()
+    frame = parse_upload(body, content_type)
+    valid, errors, rejected = validate_rows(frame, locations, default_location)
+    report = IngestReport(
+        received=len(frame),
+        rejected=rejected,
+        duplicates=len(frame) - rejected - len(valid),
+        errors=errors,
+    )
+    report.chunks = write_rows(session_factory, valid, source, chunk_rows)
+    report.written = len(valid)
+    report.seconds = time.perf_counter() - started
+    logger.info(
+        f"📥 Ingested {report.written}/{report.received} weather rows "
+        f"({report.rejected} rejected) in {report.seconds:.2f}s"
+    )
+    return report
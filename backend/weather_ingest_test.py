@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Weather Ingestion Tests
+Checks the upload formats, vectorized validation and chunked upserts
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(backend_dir))
+
+from database import Base, WeatherData
+from weather_ingest import ingest
+
+LOCATIONS = {"machakos", "vhembe"}
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingest.db'}")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def test_dataset_csv_is_loaded_in_chunks(session_factory):
+    csv = (backend_dir.parent / "Dataset" / "Historical.csv").read_bytes()
+    report = ingest(csv, "text/csv", session_factory, LOCATIONS, default_location="Machakos", chunk_rows=100)
+
+    with session_factory() as db:
+        stored = db.query(WeatherData).count()
+    assert report.rejected == 0 and report.written == stored == report.received - report.duplicates
+    assert report.chunks == -(-report.written // 100)
+    assert report.to_dict()["rows_per_second"] > 0
+
+
+def test_invalid_rows_are_reported_and_skipped(session_factory):
+    rows = [
+        {"date": "2027-01-01", "location": "machakos", "temperature": 20, "rain": 1},
+        {"date": "not a date", "location": "machakos", "temperature": 20, "rain": 1},
+        {"date": "2027-01-02", "location": "atlantis", "temperature": 20, "rain": 1},
+        {"date": "2027-01-03", "location": "vhembe", "temperature": "hot", "rain": 1},
+        {"date": "2027-01-04", "location": "vhembe", "temperature": 20, "rain": -3},
+    ]
+    report = ingest(json.dumps(rows).encode(), "application/json", session_factory, LOCATIONS)
+
+    assert report.written == 1 and report.rejected == 4
+    assert report.errors == [
+        {"row": 2, "error": "invalid date"},
+        {"row": 3, "error": "unsupported location"},
+        {"row": 4, "error": "invalid temperature"},
+        {"row": 5, "error": "rain out of range"},
+    ]
+
+
+def test_ndjson_upserts_on_location_and_date(session_factory):
+    first = b'{"date": "2027-01-01", "temperature": 20, "rain": 1}\n'
+    second = b'{"date": "2027-01-01", "temperature": 22, "rain": 0}\n{"date": "2027-01-02", "temperature": 23, "rain": 0}\n'
+    ingest(first, "application/x-ndjson", session_factory, LOCATIONS, default_location="vhembe")
+    ingest(second, "application/x-ndjson", session_factory, LOCATIONS, default_location="vhembe")
+
+    with session_factory() as db:
+        rows = db.query(WeatherData).order_by(WeatherData.date).all()
+    assert [(str(row.date), row.temperature) for row in rows] == [("2027-01-01", 22.0), ("2027-01-02", 23.0)]
+
+    with pytest.raises(ValueError):
+        ingest(first, "application/x-ndjson", session_factory, LOCATIONS)